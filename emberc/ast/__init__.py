@@ -38,7 +38,10 @@ from .resolved import (
     # -Statements
     StmtNode,
     StmtEmptyNode,
+    StmtBlockNode,
+    StmtConditionalNode,
     StmtExpressionNode,
+    StmtWhileNode,
     # -Expressions
     ExprNode,
     ExprAssignNode,
@@ -81,7 +84,10 @@ __all__ = (
     # -Resolved: Statement
     "StmtNode",
     "StmtEmptyNode",
+    "StmtBlockNode",
+    "StmtConditionalNode",
     "StmtExpressionNode",
+    "StmtWhileNode",
     # -Resolved: Expression
     "ExprNode",
     "ExprAssignNode",
@@ -25,7 +25,10 @@ from .expressions import (
 from .statements import (
     StmtNode,
     StmtEmptyNode,
+    StmtBlockNode,
+    StmtConditionalNode,
     StmtExpressionNode,
+    StmtWhileNode,
     StmtNodeVisitor,
 )
 from .types import (
@@ -53,7 +56,10 @@ __all__ = (
     # -Statements
     "StmtNode",
     "StmtEmptyNode",
+    "StmtBlockNode",
+    "StmtConditionalNode",
     "StmtExpressionNode",
+    "StmtWhileNode",
     "StmtNodeVisitor",
     # -Expressions
     "ExprNode",
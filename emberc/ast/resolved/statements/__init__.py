@@ -11,6 +11,11 @@ from .node import (
     StmtNode,
     StmtEmptyNode,
 )
+from .block import StmtBlockNode
+from .conditional import (
+    StmtConditionalNode,
+    StmtWhileNode,
+)
 from .expression import (
     StmtExpressionNode,
 )
@@ -19,11 +24,17 @@ from .expression import (
 __all__ = (
     "StmtNode",
     "StmtEmptyNode",
+    "StmtBlockNode",
+    "StmtConditionalNode",
     "StmtExpressionNode",
+    "StmtWhileNode",
 )
 
 ## Classes
 class StmtNodeVisitor[TReturn](Protocol):
     """A visitor pattern interface for traversing resolved statement nodes"""
     # -Instance Methods
+    def visit_stmt_block(self, node: StmtBlockNode) -> TReturn: ...
+    def visit_stmt_conditional(self, node: StmtConditionalNode) -> TReturn: ...
     def visit_stmt_expression(self, node: StmtExpressionNode) -> TReturn: ...
+    def visit_stmt_while(self, node: StmtWhileNode) -> TReturn: ...
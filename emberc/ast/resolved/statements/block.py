@@ -0,0 +1,35 @@
+##-------------------------------##
+## Ember Compiler                ##
+## Written By: Ryan Smith        ##
+##-------------------------------##
+## Statement Node: Block         ##
+##-------------------------------##
+
+## Imports
+from dataclasses import dataclass
+from typing import TYPE_CHECKING
+from .node import StmtNode
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator, Sequence
+    from . import StmtNodeVisitor
+    from ..declarations import DeclNode
+
+
+## Classes
+@dataclass(slots=True)
+class StmtBlockNode(StmtNode):
+    """
+    Resolved Block Statement
+    Opens a new scope over a sequence of declarations and statements.
+    """
+    # -Dunder Methods
+    def __iter__(self) -> Iterator[DeclNode | StmtNode]:
+        yield from self.body
+
+    # -Instance Methods
+    def accept[T](self, visitor: StmtNodeVisitor[T]) -> T:
+        return visitor.visit_stmt_block(self)
+
+    # -Properties
+    body: Sequence[DeclNode | StmtNode]
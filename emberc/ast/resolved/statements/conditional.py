@@ -0,0 +1,59 @@
+##-------------------------------##
+## Ember Compiler                ##
+## Written By: Ryan Smith        ##
+##-------------------------------##
+## Statement Node: Conditional   ##
+##-------------------------------##
+
+## Imports
+from dataclasses import dataclass
+from typing import TYPE_CHECKING
+from .node import StmtNode
+
+if TYPE_CHECKING:
+    from . import StmtNodeVisitor
+    from ..declarations import DeclNode
+    from ..expressions import ExprNode
+
+
+## Classes
+@dataclass(slots=True)
+class StmtConditionalNode(StmtNode):
+    """
+    Resolved Conditional Statement
+    Executes the then branch when its condition is non-zero; otherwise the optional else branch.
+    """
+    # -Instance Methods
+    def accept[T](self, visitor: StmtNodeVisitor[T]) -> T:
+        return visitor.visit_stmt_conditional(self)
+
+    # -Properties
+    condition: ExprNode
+    then_branch: DeclNode | StmtNode
+    _else_branch: DeclNode | StmtNode | None
+
+    @property
+    def has_else_branch(self) -> bool:
+        '''Return if conditional has else branch.'''
+        return self._else_branch is not None
+
+    @property
+    def else_branch(self) -> DeclNode | StmtNode:
+        '''Return else branch node; assert node exists.'''
+        assert self._else_branch is not None
+        return self._else_branch
+
+
+@dataclass(slots=True)
+class StmtWhileNode(StmtNode):
+    """
+    Resolved While Statement
+    Repeats its body for as long as its condition is non-zero.
+    """
+    # -Instance Methods
+    def accept[T](self, visitor: StmtNodeVisitor[T]) -> T:
+        return visitor.visit_stmt_while(self)
+
+    # -Properties
+    condition: ExprNode
+    body: DeclNode | StmtNode
@@ -25,6 +25,8 @@ class TypePrimitive(TypeNode):
     # -Dunder Methods
     def __str__(self) -> str:
         match self.kind:
+            case TypePrimitive.Kind.Boolean:
+                return "bool"
             case TypePrimitive.Kind.Int8:
                 return "int8"
             case TypePrimitive.Kind.Int16:
@@ -48,10 +50,56 @@ class TypePrimitive(TypeNode):
     def accept[T](self, visitor: TypeNodeVisitor[T]) -> T:
         return visitor.visit_type_primitive(self)
 
+    def contains(self, value: int) -> bool:
+        '''Return if value is representable by type.'''
+        return self.min_value <= value <= self.max_value
+
+    def wrap(self, value: int) -> int:
+        '''Wrap value around to the width and signedness of type.'''
+        bits = self.bits
+        value &= (1 << bits) - 1
+        if self.is_signed and value >> (bits - 1):
+            value -= 1 << bits
+        return value
+
     # -Properties
     kind: TypePrimitive.Kind
 
+    @property
+    def bits(self) -> int:
+        '''Return bit width of type.'''
+        match self.kind:
+            case TypePrimitive.Kind.Boolean:
+                return 1
+            case TypePrimitive.Kind.Int8 | TypePrimitive.Kind.UInt8:
+                return 8
+            case TypePrimitive.Kind.Int16 | TypePrimitive.Kind.UInt16:
+                return 16
+            case TypePrimitive.Kind.Int32 | TypePrimitive.Kind.UInt32:
+                return 32
+            case TypePrimitive.Kind.Int64 | TypePrimitive.Kind.UInt64:
+                return 64
+            case _:
+                assert_never(self.kind)
+
+    @property
+    def is_signed(self) -> bool:
+        return TypePrimitive.Kind.Int8 <= self.kind <= TypePrimitive.Kind.Int64
+
+    @property
+    def is_integer(self) -> bool:
+        return self.kind != TypePrimitive.Kind.Boolean
+
+    @property
+    def min_value(self) -> int:
+        return -(1 << (self.bits - 1)) if self.is_signed else 0
+
+    @property
+    def max_value(self) -> int:
+        return (1 << (self.bits - 1 if self.is_signed else self.bits)) - 1
+
     # -Class Properties
+    boolean: ClassVar[Self]
     int8: ClassVar[Self]
     int16: ClassVar[Self]
     int32: ClassVar[Self]
@@ -71,9 +119,11 @@ class TypePrimitive(TypeNode):
         UInt16 = auto()
         UInt32 = auto()
         UInt64 = auto()
+        Boolean = auto()
 
 
 ## Body
+TypePrimitive.boolean = TypePrimitive(TypePrimitive.Kind.Boolean)
 TypePrimitive.int8 = TypePrimitive(TypePrimitive.Kind.Int8)
 TypePrimitive.int16 = TypePrimitive(TypePrimitive.Kind.Int16)
 TypePrimitive.int32 = TypePrimitive(TypePrimitive.Kind.Int32)
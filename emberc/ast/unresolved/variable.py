@@ -98,4 +98,4 @@ class UnresolvedVariableNode(UnresolvedNode):
         def wide_span(self) -> Span:
             if not self.has_initializer:
                 return self.location
-            return self.location.extend_to(self.initializer.location)
+            return self.location.extend_to(self.initializer.wide_span)
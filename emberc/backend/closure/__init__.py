@@ -0,0 +1,56 @@
+##-------------------------------##
+## Ember Compiler                ##
+## Written By: Ryan Smith        ##
+##-------------------------------##
+## Backend: Closure Compiler     ##
+##-------------------------------##
+
+## Imports
+from dataclasses import dataclass
+from typing import TYPE_CHECKING
+from .compiler import ClosureCompiler
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Mapping
+    from .compiler import Statement
+    from .operators import Frame
+    from ...ast import ResolvedNode
+
+## Constants
+__all__ = (
+    "ClosureCompiler",
+    "ClosureProgram",
+)
+
+
+## Classes
+@dataclass(frozen=True, slots=True)
+class ClosureProgram:
+    """
+    A resolved AST compiled into closures.
+
+    Calling the program runs its root closure over a fresh frame and returns the frame;
+    `slots` maps each symbol id to its frame slot.
+    """
+    # -Dunder Methods
+    def __call__(self) -> Frame:
+        frame: Frame = [None] * len(self.slots)
+        self.entry(frame)
+        return frame
+
+    # -Instance Methods
+    def value_of(self, frame: Frame, _id: int) -> int | None:
+        '''Return value of symbol id in frame or None if the program never uses it.'''
+        slot = self.slots.get(_id)
+        return None if slot is None else frame[slot]
+
+    # -Properties
+    entry: Statement
+    slots: Mapping[int, int]
+
+    # -Static Methods
+    @staticmethod
+    def compile(ast: ResolvedNode, output: Callable[[int], None] | None = None) -> ClosureProgram:
+        compiler = ClosureCompiler(output)
+        entry = compiler.compile(ast)
+        return ClosureProgram(entry, compiler.slots)
@@ -0,0 +1,210 @@
+##-------------------------------##
+## Ember Compiler                ##
+## Written By: Ryan Smith        ##
+##-------------------------------##
+## Closure: Compiler             ##
+##-------------------------------##
+
+## Imports
+from typing import TYPE_CHECKING, Any, NoReturn, assert_never
+from .operators import OperandShape, binary_factory
+from ...ast import AssignOperator, TypePrimitive
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+    from .operators import Expression, Frame
+    from ...ast import (
+        ResolvedNode,
+        DeclUnitNode,
+        DeclVariableNode,
+        StmtBlockNode,
+        StmtConditionalNode,
+        StmtExpressionNode,
+        StmtWhileNode,
+        ExprAssignNode,
+        ExprBinaryNode,
+        ExprIntegerNode,
+        ExprVariableNode,
+    )
+
+## Constants
+type Statement = Callable[[Frame], None]
+type CompiledExpression = tuple[OperandShape, Any]
+DEFAULT_TYPE = TypePrimitive.int64
+
+
+## Functions
+def _as_closure(compiled: CompiledExpression) -> Expression:
+    """Return compiled expression as a closure over the frame."""
+    shape, payload = compiled
+    match shape:
+        case OperandShape.Closure:
+            return payload  # type: ignore[no-any-return]
+        case OperandShape.Slot:
+            return lambda f: f[payload]
+        case OperandShape.Constant:
+            return lambda f: payload
+        case _:
+            assert_never(shape)
+
+
+def _sequence(statements: list[Statement]) -> Statement:
+    """Return one statement running statements in order."""
+    match statements:
+        case []:
+            return lambda f: None
+        case [statement]:
+            return statement
+        case _:
+            body = tuple(statements)
+
+            def run(f: Frame) -> None:
+                for statement in body:
+                    statement(f)
+            return run
+
+
+## Classes
+class ClosureCompiler:
+    """
+    A resolved AST visitor compiling each node once into a Python closure.
+
+    Variables are bound to fixed slots of a flat frame allocated per symbol id,
+    integer literals and constant subexpressions are baked in, and binary operators
+    pick a closure specialized for the operator and its operand shapes at compile time.
+    Arithmetic wraps to the checked type of the expression (int64 when unchecked), matching
+    the virtual machine and transpiler. Expression statement values are passed to `output` when given.
+    """
+
+    # -Constructor
+    def __init__(self, output: Callable[[int], None] | None = None) -> None:
+        self.output = output
+        self.slots: dict[int, int] = {}
+
+    # -Instance Methods
+    def compile(self, ast: ResolvedNode) -> Statement:
+        '''Compile ast into a statement closure over a frame.'''
+        compiled = ast.accept(self)
+        if isinstance(compiled, tuple):
+            expression = _as_closure(compiled)
+
+            def run(f: Frame) -> None:
+                expression(f)
+            return run
+        return compiled  # type: ignore[no-any-return]
+
+    def slot_of(self, _id: int) -> int:
+        '''Return frame slot of symbol id; allocating it on first use.'''
+        slot = self.slots.get(_id)
+        if slot is None:
+            slot = self.slots[_id] = len(self.slots)
+        return slot
+
+    def _statement(self, node: ResolvedNode) -> Statement:
+        '''Compile a declaration or statement child.'''
+        return node.accept(self)  # type: ignore[no-any-return]
+
+    # --Types--
+    def visit_type_primitive(self, node: TypePrimitive) -> NoReturn:
+        assert False, "Tried calling closure compiler with a primitive type node"
+
+    # --Declarations--
+    def visit_decl_unit(self, node: DeclUnitNode) -> Statement:
+        return _sequence([self._statement(child) for child in node])
+
+    def visit_decl_variable(self, node: DeclVariableNode) -> Statement:
+        slot = self.slot_of(node.id)
+        if not node.has_initializer:
+            def declare(f: Frame) -> None:
+                f[slot] = None
+            return declare
+        initializer = _as_closure(node.initializer.accept(self))
+
+        def initialize(f: Frame) -> None:
+            f[slot] = initializer(f)
+        return initialize
+
+    # --Statements--
+    def visit_stmt_block(self, node: StmtBlockNode) -> Statement:
+        return _sequence([self._statement(child) for child in node])
+
+    def visit_stmt_conditional(self, node: StmtConditionalNode) -> Statement:
+        condition = _as_closure(node.condition.accept(self))
+        then_branch = self._statement(node.then_branch)
+        if not node.has_else_branch:
+            def run_if(f: Frame) -> None:
+                if condition(f):
+                    then_branch(f)
+            return run_if
+        else_branch = self._statement(node.else_branch)
+
+        def run_if_else(f: Frame) -> None:
+            if condition(f):
+                then_branch(f)
+            else:
+                else_branch(f)
+        return run_if_else
+
+    def visit_stmt_expression(self, node: StmtExpressionNode) -> Statement:
+        expression = _as_closure(node.expression.accept(self))
+        output = self.output
+        if output is None:
+            def run(f: Frame) -> None:
+                expression(f)
+            return run
+
+        def run_output(f: Frame) -> None:
+            output(expression(f))
+        return run_output
+
+    def visit_stmt_while(self, node: StmtWhileNode) -> Statement:
+        condition = _as_closure(node.condition.accept(self))
+        body = self._statement(node.body)
+
+        def run(f: Frame) -> None:
+            while condition(f):
+                body(f)
+        return run
+
+    # --Expressions--
+    def visit_expr_assignment(self, node: ExprAssignNode) -> CompiledExpression:
+        match node.operator:
+            case AssignOperator.Eq:
+                pass
+            case _:
+                assert_never(node.operator)
+        shape, target = node.l_value.accept(self)
+        assert shape is OperandShape.Slot, "Tried compiling assignment to a non-variable l-value"
+        value = _as_closure(node.r_value.accept(self))
+
+        def assign(f: Frame) -> int:
+            f[target] = result = value(f)
+            return result
+        return (OperandShape.Closure, assign)
+
+    def visit_expr_binary(self, node: ExprBinaryNode) -> CompiledExpression:
+        l_shape, lhs = node.lhs.accept(self)
+        r_shape, rhs = node.rhs.accept(self)
+        _type = node.type if isinstance(node.type, TypePrimitive) else DEFAULT_TYPE
+        bias = -_type.min_value
+        closure = binary_factory(node.operator, l_shape, r_shape)(lhs, rhs, bias, (1 << _type.bits) - 1)
+        if l_shape is OperandShape.Constant and r_shape is OperandShape.Constant:
+            try:
+                return (OperandShape.Constant, closure([]))
+            except ZeroDivisionError:
+                pass
+        return (OperandShape.Closure, closure)
+
+    def visit_expr_integer(self, node: ExprIntegerNode) -> CompiledExpression:
+        return (OperandShape.Constant, node.value)
+
+    def visit_expr_variable(self, node: ExprVariableNode) -> CompiledExpression:
+        return (OperandShape.Slot, self.slot_of(node.id))
+
+    # -Properties
+    @property
+    def frame_size(self) -> int:
+        return len(self.slots)
+
+    # -Class Properties
+    __slots__ = ("output", "slots")
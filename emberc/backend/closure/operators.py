@@ -0,0 +1,90 @@
+##-------------------------------##
+## Ember Compiler                ##
+## Written By: Ryan Smith        ##
+##-------------------------------##
+## Closure: Operators            ##
+##-------------------------------##
+
+## Imports
+from enum import IntEnum, auto
+from typing import TYPE_CHECKING, Any
+from ...ast import BinaryOperator
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+## Constants
+type Frame = list[int | None]
+type Expression = Callable[[Frame], int]
+type ExpressionFactory = Callable[[Any, Any, int, int], Expression]
+SYMBOLS: dict[BinaryOperator, str] = {
+    BinaryOperator.Add: '+',
+    BinaryOperator.Sub: '-',
+    BinaryOperator.Mul: '*',
+    BinaryOperator.Div: "//",
+    BinaryOperator.Mod: '%',
+    BinaryOperator.Eq: "==",
+    BinaryOperator.NtEq: "!=",
+    BinaryOperator.Lt: '<',
+    BinaryOperator.LtEq: "<=",
+    BinaryOperator.Gt: '>',
+    BinaryOperator.GtEq: ">=",
+}
+COMPARISON_OPERATORS = frozenset((
+    BinaryOperator.Eq, BinaryOperator.NtEq,
+    BinaryOperator.Lt, BinaryOperator.LtEq,
+    BinaryOperator.Gt, BinaryOperator.GtEq,
+))
+WRAPPED_OPERATORS = frozenset((
+    BinaryOperator.Add, BinaryOperator.Sub,
+    BinaryOperator.Mul, BinaryOperator.Div,
+))
+
+
+## Classes
+class OperandShape(IntEnum):
+    """How a compiled operand is read: a nested closure, a frame slot or a baked-in constant."""
+    Closure = auto()
+    Slot = auto()
+    Constant = auto()
+
+
+## Functions
+def _operand_source(name: str, shape: OperandShape) -> str:
+    match shape:
+        case OperandShape.Closure:
+            return f"{name}(f)"
+        case OperandShape.Slot:
+            return f"f[{name}]"
+        case OperandShape.Constant:
+            return name
+
+
+def _build_factory(operator: BinaryOperator, lhs: OperandShape, rhs: OperandShape) -> ExpressionFactory:
+    """
+    Generate the factory of closures evaluating operator over operands of the given shapes.
+    Each factory is generated once at import so the closures it returns contain the
+    operator inline and read operands without any dispatch. Arithmetic results are
+    wrapped with ((value + b) & m) - b from the bias and mask passed to the factory.
+    """
+    expression = f"{_operand_source('l', lhs)} {SYMBOLS[operator]} {_operand_source('r', rhs)}"
+    if operator in COMPARISON_OPERATORS:
+        expression = f"1 if {expression} else 0"
+    elif operator in WRAPPED_OPERATORS:
+        expression = f"(({expression} + b) & m) - b"
+    source = f"def factory(l, r, b, m):\n    def run(f):\n        return {expression}\n    return run\n"
+    namespace: dict[str, Any] = {}
+    exec(source, namespace)
+    return namespace["factory"]  # type: ignore[no-any-return]
+
+
+def binary_factory(operator: BinaryOperator, lhs: OperandShape, rhs: OperandShape) -> ExpressionFactory:
+    '''Return closure factory specialized for operator and operand shapes.'''
+    return FACTORIES[operator, lhs, rhs]
+
+
+## Body
+FACTORIES: dict[tuple[BinaryOperator, OperandShape, OperandShape], ExpressionFactory] = {
+    (operator, lhs, rhs): _build_factory(operator, lhs, rhs)
+    for operator in BinaryOperator for lhs in OperandShape for rhs in OperandShape
+}
@@ -6,23 +6,33 @@
 ##-------------------------------##
 
 ## Imports
+import sys
 from typing import TYPE_CHECKING, assert_never
-from .environment import Environment
+from .environment import Environment, EnvironmentSnapshot
 from .lvalue import LValueResolver
+from .output import (
+    BufferedSink,
+    MemorySink,
+    NullSink,
+)
 from ...ast import (
     AssignOperator,
     BinaryOperator,
+    TypePrimitive,
 )
 
 if TYPE_CHECKING:
     from collections.abc import Sequence
     from .environment import INTERPRETER_VALUE
+    from .output import OutputSink
     from ...ast import (
         ResolvedNode,
-        TypePrimitive,
         DeclUnitNode,
         DeclVariableNode,
+        StmtBlockNode,
+        StmtConditionalNode,
         StmtExpressionNode,
+        StmtWhileNode,
         ExprAssignNode,
         ExprBinaryNode,
         ExprIntegerNode,
@@ -31,7 +41,15 @@ if TYPE_CHECKING:
     from ...middleware import Symbol
 
 ## Constants
-__all__ = ("TreeWalkInterpreter",)
+__all__ = (
+    "BufferedSink",
+    "Environment",
+    "EnvironmentSnapshot",
+    "MemorySink",
+    "NullSink",
+    "TreeWalkInterpreter",
+)
+DEFAULT_TYPE = TypePrimitive.int64
 
 
 ## Classes
@@ -41,15 +59,22 @@ class TreeWalkInterpreter:
     
     Tracks variables via an execution environment and leverages an 
     LValueResolver to handle assignments to mutable storage locations.
+    Arithmetic wraps to the checked type of the expression (int64 when unchecked), matching
+    the virtual machine, transpiler and closure backends.
+    Expression statement values are written to an output sink; with `trace` the
+    environment is also written before every top-level declaration.
     """
 
     # -Constructor
     def __init__(
-        self, symbols: Sequence[Symbol], environment: Environment
+        self, symbols: Sequence[Symbol], environment: Environment,
+        output: OutputSink, trace: bool = True
     ) -> None:
         self.environment: Environment = environment
         self.symbols = symbols
         self.lvalue_resolver = LValueResolver(self)
+        self.output = output
+        self.trace = trace
 
     # -Instance Methods
     # --Types--
@@ -59,7 +84,8 @@ class TreeWalkInterpreter:
     # --Declarations--
     def visit_decl_unit(self, node: DeclUnitNode) -> None:
         for child in node:
-            print(self.environment)
+            if self.trace:
+                self.output.write(str(self.environment))
             child.accept(self)
 
     def visit_decl_variable(self, node: DeclVariableNode) -> None:
@@ -69,9 +95,25 @@ class TreeWalkInterpreter:
         self.environment.declare(node.id, value)
 
     # --Statements--
+    def visit_stmt_block(self, node: StmtBlockNode) -> None:
+        self.environment.push()
+        for child in node:
+            child.accept(self)
+        self.environment.pop()
+
+    def visit_stmt_conditional(self, node: StmtConditionalNode) -> None:
+        if node.condition.accept(self):
+            node.then_branch.accept(self)
+        elif node.has_else_branch:
+            node.else_branch.accept(self)
+
     def visit_stmt_expression(self, node: StmtExpressionNode) -> None:
         value = node.expression.accept(self)
-        print(value)
+        self.output.write(value)
+
+    def visit_stmt_while(self, node: StmtWhileNode) -> None:
+        while node.condition.accept(self):
+            node.body.accept(self)
 
     # --Expressions--
     def visit_expr_assignment(self, node: ExprAssignNode) -> INTERPRETER_VALUE:
@@ -89,15 +131,27 @@ class TreeWalkInterpreter:
         rhs = node.rhs.accept(self)
         match node.operator:
             case BinaryOperator.Add:
-                return lhs + rhs
+                return self._wrap(node, lhs + rhs)
             case BinaryOperator.Sub:
-                return lhs - rhs
+                return self._wrap(node, lhs - rhs)
             case BinaryOperator.Mul:
-                return lhs * rhs
+                return self._wrap(node, lhs * rhs)
             case BinaryOperator.Div:
-                return lhs // rhs
+                return self._wrap(node, lhs // rhs)
             case BinaryOperator.Mod:
                 return lhs % rhs
+            case BinaryOperator.Eq:
+                return int(lhs == rhs)
+            case BinaryOperator.NtEq:
+                return int(lhs != rhs)
+            case BinaryOperator.Lt:
+                return int(lhs < rhs)
+            case BinaryOperator.LtEq:
+                return int(lhs <= rhs)
+            case BinaryOperator.Gt:
+                return int(lhs > rhs)
+            case BinaryOperator.GtEq:
+                return int(lhs >= rhs)
             case _:
                 assert_never(node.operator)
 
@@ -109,9 +163,25 @@ class TreeWalkInterpreter:
 
     # -Static Methods
     @staticmethod
-    def run(ast: ResolvedNode, symbols: Sequence[Symbol]) -> None:
-        env = Environment.default
-        ast.accept(TreeWalkInterpreter(symbols, env))
+    def _wrap(node: ExprBinaryNode, value: int) -> int:
+        '''Wrap arithmetic value to the checked type of node.'''
+        _type = node.type if isinstance(node.type, TypePrimitive) else DEFAULT_TYPE
+        return _type.wrap(value)
+
+    @staticmethod
+    def run(
+        ast: ResolvedNode, symbols: Sequence[Symbol],
+        output: OutputSink | None = None, trace: bool = True
+    ) -> Environment:
+        '''Execute ast in a fresh environment; writing output to stdout in chunks unless another sink is given'''
+        env = Environment()
+        env.reserve(len(symbols))
+        sink = output if output is not None else BufferedSink(sys.stdout)
+        try:
+            ast.accept(TreeWalkInterpreter(symbols, env, sink, trace))
+        finally:
+            sink.flush()
+        return env
 
     # -Class Properties
-    __slots__ = ("symbols", "environment", "lvalue_resolver")
+    __slots__ = ("symbols", "environment", "lvalue_resolver", "output", "trace")
@@ -7,64 +7,104 @@
 
 ## Imports
 from dataclasses import dataclass, field
-from typing import ClassVar, Self
+from typing import Final
 
 ## Constants
 type INTERPRETER_VALUE = int
-type Scope = dict[int, INTERPRETER_VALUE | None]
+type Slot = INTERPRETER_VALUE | None | object
+UNDECLARED: Final = object()
 
 ## Classes
+@dataclass(frozen=True, slots=True)
+class EnvironmentSnapshot:
+    """An immutable copy of an environment's slots and scope log."""
+    values: tuple[Slot, ...]
+    log: tuple[tuple[int, Slot], ...]
+    marks: tuple[int, ...]
+
+
 @dataclass(slots=True)
 class Environment:
     """
-    Manages runtime variable state using a stack of lexical scopes.
+    Manages runtime variable state in a flat list of slots indexed by symbol id.
     
-    Provides scoping mechanisms (push/pop) and variable operations (declaration, 
-    lookup, and assignment) that bubble up through the scope hierarchy.
+    Symbol ids are dense and unique per declaration, so reads and writes index the
+    slot directly. Scopes are tracked by an undo log: declaring in a nested scope
+    records the slot's previous value and popping a scope restores every slot
+    declared since its push.
+    Every interpreter run owns its environment, so runs never share state.
     """
 
     # -Dunder Methods
     def __getitem__(self, _id: int) -> INTERPRETER_VALUE:
-        '''Retrieve value of variable by bubbling up scopes'''
-        for scope in reversed(self._scopes):
-            if _id not in scope:
-                continue
-            value = scope[_id]
-            assert value is not None
-            return value
-        assert False, f"Tried to retrieve value from unknown id[{_id}]"
+        '''Retrieve value of variable by id'''
+        value = self._values[_id] if _id < len(self._values) else UNDECLARED
+        assert value is not UNDECLARED, f"Tried to retrieve value from unknown id[{_id}]"
+        assert value is not None
+        return value  # type: ignore[return-value]
+
+    def __repr__(self) -> str:
+        bindings = ", ".join(
+            f"{_id}: {value}" for _id, value in enumerate(self._values) if value is not UNDECLARED
+        )
+        return f"Environment({{{bindings}}})"
 
     # -Instance Methods: Scope
     def push(self) -> None:
-        self._scopes.append(dict())
+        self._marks.append(len(self._log))
 
-    def pop(self) -> Scope:
-        return self._scopes.pop()
+    def pop(self) -> None:
+        '''Undo every declaration made since the matching push'''
+        mark = self._marks.pop()
+        log, values = self._log, self._values
+        while len(log) > mark:
+            _id, previous = log.pop()
+            values[_id] = previous
 
     # -Instance Methods: Values
     def declare(self, _id: int, value: INTERPRETER_VALUE | None) -> None:
         '''Declare variable in current scope'''
-        self.current_scope[_id] = value
+        if _id >= len(self._values):
+            self.reserve(_id + 1)
+        if self._marks:
+            self._log.append((_id, self._values[_id]))
+        self._values[_id] = value
 
     def assign(self, _id: int, value: INTERPRETER_VALUE) -> None:
-        '''Assign value to variable by bubbling up scopes'''
-        for scope in reversed(self._scopes):
-            if _id not in scope:
-                continue
-            scope[_id] = value
-            return
-        assert False, f"Tried to assign value to unknown id[{_id}]"
+        '''Assign value to declared variable'''
+        assert _id < len(self._values) and self._values[_id] is not UNDECLARED, (
+            f"Tried to assign value to unknown id[{_id}]"
+        )
+        self._values[_id] = value
 
-    # -Properties
-    _scopes: list[Scope] = field(default_factory=lambda: [{}])
+    # -Instance Methods: State
+    def reset(self) -> None:
+        '''Forget every variable and scope; keeping reserved slots'''
+        self._values[:] = [UNDECLARED] * len(self._values)
+        self._log.clear()
+        self._marks.clear()
 
-    @property
-    def current_scope(self) -> Scope:
-        return self._scopes[-1]
+    def snapshot(self) -> EnvironmentSnapshot:
+        '''Return a copy of current state'''
+        return EnvironmentSnapshot(tuple(self._values), tuple(self._log), tuple(self._marks))
+
+    def restore(self, snapshot: EnvironmentSnapshot) -> None:
+        '''Replace current state with snapshot'''
+        self._values[:] = snapshot.values
+        self._log[:] = snapshot.log
+        self._marks[:] = snapshot.marks
 
-    # -Class Properties
-    default: ClassVar[Self]
+    def reserve(self, size: int) -> None:
+        '''Preallocate slots for symbol ids below size'''
+        if size > len(self._values):
+            self._values.extend([UNDECLARED] * (size - len(self._values)))
 
+    # -Properties
+    _values: list[Slot] = field(default_factory=list)
+    _log: list[tuple[int, Slot]] = field(default_factory=list)
+    _marks: list[int] = field(default_factory=list)
 
-## Body
-Environment.default = Environment()
+    @property
+    def depth(self) -> int:
+        '''Return number of scopes pushed above the global scope'''
+        return len(self._marks)
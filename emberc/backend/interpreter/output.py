@@ -0,0 +1,90 @@
+##-------------------------------##
+## Ember Compiler                ##
+## Written By: Ryan Smith        ##
+##-------------------------------##
+## Interpreter: Output           ##
+##-------------------------------##
+
+## Imports
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Protocol
+
+if TYPE_CHECKING:
+    from typing import TextIO
+
+## Constants
+DEFAULT_CHUNK_SIZE = 1 << 16
+
+
+## Classes
+class OutputSink(Protocol):
+    """Interpreter output interface; receiving one value per line"""
+    # -Instance Methods
+    def write(self, value: object) -> None: ...
+    def flush(self) -> None: ...
+
+
+class NullSink:
+    """Output sink discarding every value without formatting it"""
+    # -Instance Methods
+    def write(self, value: object) -> None:
+        pass
+
+    def flush(self) -> None:
+        pass
+
+    # -Class Properties
+    __slots__ = ()
+
+
+@dataclass(slots=True)
+class MemorySink:
+    """Output sink keeping every value in memory"""
+    # -Instance Methods
+    def write(self, value: object) -> None:
+        self.values.append(value)
+
+    def flush(self) -> None:
+        pass
+
+    def getvalue(self) -> str:
+        '''Return values formatted one per line'''
+        return "".join(f"{value}\n" for value in self.values)
+
+    # -Properties
+    values: list[object] = field(default_factory=list)
+
+
+class BufferedSink:
+    """
+    Output sink formatting values into lines and writing them to a stream
+    in chunks of at least `chunk_size` characters.
+    """
+    # -Constructor
+    def __init__(self, stream: TextIO, chunk_size: int = DEFAULT_CHUNK_SIZE) -> None:
+        self.stream = stream
+        self.chunk_size = chunk_size
+        self._parts: list[str] = []
+        self._size: int = 0
+
+    # -Instance Methods
+    def write(self, value: object) -> None:
+        line = f"{value}\n"
+        self._parts.append(line)
+        self._size += len(line)
+        if self._size >= self.chunk_size:
+            self._drain()
+
+    def flush(self) -> None:
+        '''Write every buffered line and flush the stream'''
+        self._drain()
+        self.stream.flush()
+
+    def _drain(self) -> None:
+        if self._parts:
+            self.stream.write("".join(self._parts))
+            self._parts.clear()
+            self._size = 0
+
+    # -Class Properties
+    __slots__ = ("stream", "chunk_size", "_parts", "_size")
@@ -33,13 +33,13 @@ class MIRInstructionSelector(TACVisitor[Collection[MIRInstruction]], ABC):
         self._symbols: Sequence[Symbol] = symbols
         self._register: int = 0
         self._temporary_registers: dict[int, VirtualRegister] = {}
-        self._variable_registers: dict[int, VirtualRegister] = {}
+        self._variable_registers: dict[tuple[int, int], VirtualRegister] = {}
     
     # -Instance Methods: Helpers
-    def add_variable_register(self, _id: int) -> VirtualRegister:
+    def add_variable_register(self, _id: int, version: int = 0) -> VirtualRegister:
         ''''''
         register = self.next_register
-        self._variable_registers[_id] = register
+        self._variable_registers[_id, version] = register
         return register
 
     def add_temporary_register(self, index: int) -> VirtualRegister:
@@ -67,7 +67,11 @@ class MIRInstructionSelector(TACVisitor[Collection[MIRInstruction]], ABC):
                     self.add_temporary_register(address.index)
                 return self._temporary_registers[address.index]
             case TACVariable():
-                return self._variable_registers[address.id]
+                key = (address.id, address.version)
+                if key not in self._variable_registers:
+                    assert address.version, f"Tried using undeclared variable id[{address.id}]"
+                    self.add_variable_register(*key)
+                return self._variable_registers[key]
             case _:
                 assert_never(address)
 
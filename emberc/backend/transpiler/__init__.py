@@ -0,0 +1,85 @@
+##-------------------------------##
+## Ember Compiler                ##
+## Written By: Ryan Smith        ##
+##-------------------------------##
+## Backend: Python Transpiler    ##
+##-------------------------------##
+
+## Imports
+from dataclasses import dataclass
+from threading import Lock
+from typing import TYPE_CHECKING, ClassVar
+from .emitter import ENTRY_NAME, PythonEmitter
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+    from typing import TextIO
+    from ...ir import (
+        TACUnit,
+        TACVariable,
+        TACInstruction,
+    )
+
+## Constants
+__all__ = (
+    "PythonEmitter",
+    "TranspiledProgram",
+)
+CACHE_LIMIT = 64
+
+
+## Classes
+@dataclass(frozen=True, slots=True)
+class TranspiledProgram:
+    """
+    A TAC unit transpiled to Python source and compiled by CPython.
+
+    Programs are cached in memory by their unit's instructions, so transpiling an
+    unchanged unit again reuses the compiled function; the cache is guarded by a lock,
+    so units may be transpiled from any thread. Calling the program runs it
+    and returns the final value of each variable. Arithmetic wraps to the checked type
+    of each binary (int64 when untyped), matching the other execution backends.
+    """
+    # -Dunder Methods
+    def __call__(self) -> dict[TACVariable, int | None]:
+        return dict(zip(self.variables, self.function()))
+
+    # -Properties
+    source: str
+    variables: tuple[TACVariable, ...]
+    function: Callable[[], tuple[int | None, ...]]
+
+    # -Class Methods
+    @classmethod
+    def transpile(cls, tac: TACUnit, dump: TextIO | None = None) -> TranspiledProgram:
+        '''Return program of tac from cache or by transpiling it; writing its source to dump if given.'''
+        key = tuple(tac)
+        with cls._lock:
+            program = cls._cache.get(key)
+        if program is None:
+            # -Built outside the lock; a unit built twice concurrently keeps the first program stored
+            built = cls._build(key)
+            with cls._lock:
+                program = cls._cache.setdefault(key, built)
+                if len(cls._cache) > CACHE_LIMIT:
+                    del cls._cache[next(iter(cls._cache))]
+        if dump is not None:
+            dump.write(program.source)
+        return program
+
+    @classmethod
+    def clear_cache(cls) -> None:
+        with cls._lock:
+            cls._cache.clear()
+
+    @classmethod
+    def _build(cls, instructions: tuple[TACInstruction, ...]) -> TranspiledProgram:
+        emitter = PythonEmitter()
+        source = emitter.emit(instructions)
+        namespace: dict[str, object] = {}
+        exec(compile(source, f"<ember:{hash(instructions):x}>", "exec"), namespace)
+        return cls(source, tuple(emitter.variables), namespace[ENTRY_NAME])  # type: ignore[arg-type]
+
+    # -Class Properties
+    _cache: ClassVar[dict[tuple[TACInstruction, ...], TranspiledProgram]] = {}
+    _lock: ClassVar[Lock] = Lock()
@@ -0,0 +1,407 @@
+##-------------------------------##
+## Ember Compiler                ##
+## Written By: Ryan Smith        ##
+##-------------------------------##
+## Transpiler: Emitter           ##
+##-------------------------------##
+
+## Imports
+from typing import TYPE_CHECKING, assert_never
+from ...ast import BinaryOperator, TypePrimitive
+from ...ir import (
+    CFG,
+    TACLiteral,
+    TACTemporary,
+    TACVariable,
+    TACAssign,
+    TACBinary,
+    TACDeclare,
+    TACLabel,
+    TACJump,
+    TACBranch,
+    TACPhi,
+)
+from ...middleware.tac import DominatorTree
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+    from ...ir import (
+        TACOperand,
+        TACBasicBlock,
+        TACInstruction,
+    )
+
+## Constants
+ENTRY_NAME = "__ember_main__"
+DEFAULT_TYPE = TypePrimitive.int64
+INDENT = "    "
+EXIT = -1
+UNREACHABLE = -1
+# -Kept under CPython's limits of 100 indentation levels and 20 statically nested blocks
+MAX_DEPTH = 64
+MAX_LOOPS = 16
+
+
+## Functions
+def operand_source(operand: TACOperand) -> str:
+    """Return Python expression of operand."""
+    match operand:
+        case TACLiteral():
+            return repr(operand.value)
+        case TACTemporary():
+            return f"t{operand.index}"
+        case TACVariable():
+            return f"v{operand.id}_{operand.version}" if operand.version else f"v{operand.id}"
+        case _:
+            assert_never(operand)
+
+
+def binary_source(instruction: TACBinary) -> str:
+    """Return Python expression of binary; masking arithmetic to its checked type."""
+    lhs, rhs = operand_source(instruction.lhs), operand_source(instruction.rhs)
+    _type = instruction.type or DEFAULT_TYPE
+    mask, bias = (1 << _type.bits) - 1, -_type.min_value
+    match instruction.operator:
+        case BinaryOperator.Add:
+            value = f"{lhs} + {rhs}"
+        case BinaryOperator.Sub:
+            value = f"{lhs} - {rhs}"
+        case BinaryOperator.Mul:
+            value = f"{lhs} * {rhs}"
+        case BinaryOperator.Div:
+            value = f"{lhs} // {rhs}"
+        case BinaryOperator.Mod:
+            return f"{lhs} % {rhs}"
+        case BinaryOperator.Eq:
+            return f"1 if {lhs} == {rhs} else 0"
+        case BinaryOperator.NtEq:
+            return f"1 if {lhs} != {rhs} else 0"
+        case BinaryOperator.Lt:
+            return f"1 if {lhs} < {rhs} else 0"
+        case BinaryOperator.LtEq:
+            return f"1 if {lhs} <= {rhs} else 0"
+        case BinaryOperator.Gt:
+            return f"1 if {lhs} > {rhs} else 0"
+        case BinaryOperator.GtEq:
+            return f"1 if {lhs} >= {rhs} else 0"
+        case _:
+            assert_never(instruction.operator)
+    if not bias:
+        return f"({value}) & {mask}"
+    return f"(({value} + {bias}) & {mask}) - {bias}"
+
+
+## Classes
+class _Unstructured(Exception):
+    """Raised when a control flow graph has no structured `while`/`if` form."""
+
+
+class PythonEmitter:
+    """
+    TAC to Python Source Emitter
+
+    Emits one function whose locals are the unit's variables and temporaries.
+    Control flow is recovered from the graph's dominator tree: every natural loop becomes a
+    native `while` loop, its single exit a `break`, and branches become `if`/`else` arms,
+    with blocks joined by several forward edges emitted after the statement that reaches them.
+    A graph with no such form (irreducible, a loop with several exits, or nesting past
+    CPython's limits) falls back to a `while` loop dispatching on the current block id
+    through bisected comparisons. The function returns the final value of every variable,
+    in the order of `variables`.
+    """
+    # -Constructor
+    def __init__(self) -> None:
+        self.lines: list[str] = []
+        self.variables: list[TACVariable] = []
+        self._cfg: CFG | None = None
+        self._tree: DominatorTree | None = None
+        self._merges = bytearray()
+        self._exits: dict[int, int | None] = {}
+        self._emitted = 0
+        self._return = ""
+
+    # -Instance Methods
+    def emit(self, instructions: Iterable[TACInstruction]) -> str:
+        '''Return Python source of instructions.'''
+        cfg = CFG.build(instructions)
+        seen: set[TACVariable] = set()
+        for instruction in cfg.instructions():
+            for operand in self._addresses_of(instruction):
+                if isinstance(operand, TACVariable) and operand not in seen:
+                    seen.add(operand)
+                    self.variables.append(operand)
+        self._line(0, f"def {ENTRY_NAME}():")
+        names = [operand_source(variable) for variable in self.variables]
+        if names:
+            self._line(1, f"{' = '.join(names)} = None")
+        self._return = f"return ({''.join(name + ', ' for name in names)})"
+        mark = len(self.lines)
+        try:
+            self._emit_structured(cfg)
+        except (_Unstructured, RecursionError):
+            del self.lines[mark:]
+            self._emit_dispatch(cfg)
+        self._line(1, self._return)
+        return "\n".join(self.lines) + "\n"
+
+    def _emit_straight(self, instructions: Iterable[TACInstruction], depth: int) -> None:
+        '''Emit instructions of a block without its terminator.'''
+        for instruction in instructions:
+            match instruction:
+                case TACAssign():
+                    self._line(depth, f"{operand_source(instruction.dest)} = {operand_source(instruction.src)}")
+                case TACBinary():
+                    self._line(depth, f"{operand_source(instruction.dest)} = {binary_source(instruction)}")
+                case TACDeclare() | TACLabel() | TACJump() | TACBranch():
+                    continue
+                case TACPhi():
+                    assert False, "Tried transpiling a phi instruction; translate out of SSA first"
+                case _:
+                    assert_never(instruction)
+
+    # -Instance Methods: Structured
+    def _emit_structured(self, cfg: CFG) -> None:
+        '''Emit cfg as nested `while` and `if` statements; raising `_Unstructured` if it has no such form.'''
+        self._cfg, self._tree = cfg, DominatorTree(cfg)
+        self._merges = bytearray(len(cfg))
+        self._exits = {}
+        self._emitted = 0
+        rpo_number = cfg.rpo_number
+        for _id in cfg.rpo:
+            forward = 0
+            latches: list[int] = []
+            for predecessor in cfg.predecessors[_id]:
+                if rpo_number[predecessor] == UNREACHABLE:
+                    continue
+                if rpo_number[predecessor] < rpo_number[_id]:
+                    forward += 1
+                elif self._tree.dominates(_id, predecessor):
+                    latches.append(predecessor)
+                else:
+                    raise _Unstructured("irreducible loop")
+            self._merges[_id] = forward > 1
+            if latches:
+                self._exits[_id] = self._loop_exit(_id, latches)
+        if len(cfg):
+            self._emit_tree(0, (), EXIT, 1)
+        if self._emitted != len(cfg.rpo):
+            raise _Unstructured("unplaced blocks")
+
+    def _loop_exit(self, header: int, latches: list[int]) -> int | None:
+        '''Return the only block the natural loop of header exits to or None if it never exits.'''
+        assert self._cfg is not None
+        body = {header}
+        stack = [latch for latch in latches if latch != header]
+        body.update(stack)
+        while stack:
+            for predecessor in self._cfg.predecessors[stack.pop()]:
+                if predecessor not in body and self._cfg.rpo_number[predecessor] != UNREACHABLE:
+                    body.add(predecessor)
+                    stack.append(predecessor)
+        exits = {
+            successor for _id in body for successor in self._cfg.successors[_id]
+            if successor not in body
+        }
+        if len(exits) > 1:
+            raise _Unstructured("loop with several exits")
+        return exits.pop() if exits else None
+
+    def _emit_tree(
+        self, _id: int, loops: tuple[tuple[int, int | None], ...],
+        follow: int, depth: int, in_loop: bool = False,
+    ) -> None:
+        '''Emit block and the blocks it dominates; control falling off the end reaches follow.'''
+        assert self._tree is not None
+        if depth > MAX_DEPTH:
+            raise _Unstructured("nesting too deep")
+        while True:
+            if _id in self._exits and not in_loop:
+                exit = self._exits[_id]
+                if len(loops) >= MAX_LOOPS:
+                    raise _Unstructured("loops nested too deep")
+                self._line(depth, "while True:")
+                mark = len(self.lines)
+                self._emit_tree(_id, (*loops, (_id, exit)), _id, depth + 1, True)
+                if len(self.lines) == mark:
+                    self._line(depth + 1, "pass")
+                if exit is None:
+                    return
+                if not self._tree.dominates(_id, exit):
+                    self._emit_tail(_id, exit, loops, follow, depth)
+                    return
+                _id = exit
+                continue
+            in_loop = False
+            self._emitted += 1
+            skip = {exit for _, exit in loops}
+            merges = [
+                child for child in self._tree.children[_id]
+                if self._merges[child] and child not in skip
+            ]
+            inner_follow = merges[0] if merges else follow
+            tail = self._emit_block(_id, loops, inner_follow, depth)
+            if tail is not None:
+                if not merges:
+                    _id = tail
+                    continue
+                self._emit_tree(tail, loops, inner_follow, depth)
+            if not merges:
+                return
+            for index, merge in enumerate(merges[:-1]):
+                self._emit_tree(merge, loops, merges[index + 1], depth)
+            _id = merges[-1]
+
+    def _emit_tail(
+        self, source: int, target: int,
+        loops: tuple[tuple[int, int | None], ...], follow: int, depth: int,
+    ) -> None:
+        '''Emit transfer from source to target as the last statement; emitting an inlined target in place.'''
+        inlined = self._transfer(source, target, loops, follow, depth)
+        if inlined is not None:
+            self._emit_tree(inlined, loops, follow, depth)
+
+    def _emit_block(
+        self, _id: int, loops: tuple[tuple[int, int | None], ...], follow: int, depth: int
+    ) -> int | None:
+        '''Emit instructions of block and its terminator; returning a successor to emit in place after it.'''
+        assert self._cfg is not None
+        block = self._cfg[_id]
+        self._emit_straight(block.instructions, depth)
+        match block.terminator:
+            case TACJump() as jump:
+                return self._transfer(_id, self._cfg.block_of(jump.target), loops, follow, depth)
+            case TACBranch() as branch:
+                true_id = self._cfg.block_of(branch.true_target)
+                false_id = self._cfg.block_of(branch.false_target)
+                if true_id == false_id:
+                    return self._transfer(_id, true_id, loops, follow, depth)
+                self._emit_if(_id, operand_source(branch.condition), true_id, false_id, loops, follow, depth)
+                return None
+            case None:
+                target = _id + 1 if _id + 1 < len(self._cfg) else EXIT
+                return self._transfer(_id, target, loops, follow, depth)
+
+    def _emit_if(
+        self, source: int, condition: str, true_id: int, false_id: int,
+        loops: tuple[tuple[int, int | None], ...], follow: int, depth: int,
+    ) -> None:
+        '''Emit a branch as an `if` statement; hoisting an arm out when the other only jumps.'''
+        mark = len(self.lines)
+        self._emit_tail(source, true_id, loops, follow, depth + 1)
+        then_lines = self.lines[mark:]
+        del self.lines[mark:]
+        self._emit_tail(source, false_id, loops, follow, depth + 1)
+        else_lines = self.lines[mark:]
+        del self.lines[mark:]
+        if not then_lines and not else_lines:
+            return
+        if not then_lines:
+            self._line(depth, f"if not {condition}:")
+            self.lines.extend(else_lines)
+        elif not else_lines:
+            self._line(depth, f"if {condition}:")
+            self.lines.extend(then_lines)
+        elif self._is_jump(then_lines):
+            self._line(depth, f"if {condition}:")
+            self.lines.extend(then_lines)
+            self.lines.extend(line.removeprefix(INDENT) for line in else_lines)
+        elif self._is_jump(else_lines):
+            self._line(depth, f"if not {condition}:")
+            self.lines.extend(else_lines)
+            self.lines.extend(line.removeprefix(INDENT) for line in then_lines)
+        else:
+            self._line(depth, f"if {condition}:")
+            self.lines.extend(then_lines)
+            self._line(depth, "else:")
+            self.lines.extend(else_lines)
+
+    def _transfer(
+        self, source: int, target: int,
+        loops: tuple[tuple[int, int | None], ...], follow: int, depth: int,
+    ) -> int | None:
+        '''Emit the statement passing control from source to target; returning target if it is emitted in place.'''
+        assert self._cfg is not None and self._tree is not None
+        if target == follow:
+            return None
+        if loops and target == loops[-1][0]:
+            self._line(depth, "continue")
+            return None
+        if loops and target == loops[-1][1]:
+            self._line(depth, "break")
+            return None
+        if target == EXIT:
+            self._line(depth, self._return)
+            return None
+        rpo_number = self._cfg.rpo_number
+        if (
+            rpo_number[target] > rpo_number[source] and self._tree.idom[target] == source
+            and not self._merges[target]
+        ):
+            return target
+        raise _Unstructured("jump out of nested statements")
+
+    def _is_jump(self, lines: list[str]) -> bool:
+        '''Return if lines are a single statement leaving the enclosing block.'''
+        return len(lines) == 1 and lines[0].strip() in ("break", "continue", self._return)
+
+    # -Instance Methods: Dispatch
+    def _emit_dispatch(self, cfg: CFG) -> None:
+        '''Emit blocks of cfg as leaves of a bisected dispatch on the current block id.'''
+        self._line(1, "block = 0")
+        self._line(1, "while True:")
+        self._emit_bisect(cfg, cfg.blocks, 2)
+
+    def _emit_bisect(self, cfg: CFG, blocks: list[TACBasicBlock], depth: int) -> None:
+        '''Emit blocks as halves of nested `if block < N` tests.'''
+        if len(blocks) == 1:
+            self._emit_straight(blocks[0].instructions, depth)
+            self._emit_transfer(cfg, blocks[0], depth)
+            return
+        middle = len(blocks) // 2
+        self._line(depth, f"if block < {blocks[middle].id}:")
+        self._emit_bisect(cfg, blocks[:middle], depth + 1)
+        self._line(depth, "else:")
+        self._emit_bisect(cfg, blocks[middle:], depth + 1)
+
+    def _emit_transfer(self, cfg: CFG, block: TACBasicBlock, depth: int) -> None:
+        '''Emit the block id control passes to after block; leaving the loop past the last block.'''
+        match block.terminator:
+            case TACJump() as jump:
+                self._line(depth, f"block = {cfg.block_of(jump.target)}")
+            case TACBranch() as branch:
+                self._line(depth, (
+                    f"block = {cfg.block_of(branch.true_target)} if {operand_source(branch.condition)} "
+                    f"else {cfg.block_of(branch.false_target)}"
+                ))
+            case None if block.id + 1 < len(cfg):
+                self._line(depth, f"block = {block.id + 1}")
+            case None:
+                self._line(depth, "break")
+
+    def _line(self, depth: int, text: str) -> None:
+        self.lines.append(INDENT * depth + text)
+
+    # -Static Methods
+    @staticmethod
+    def _addresses_of(instruction: TACInstruction) -> tuple[TACOperand, ...]:
+        match instruction:
+            case TACAssign():
+                return (instruction.dest, instruction.src)
+            case TACBinary():
+                return (instruction.dest, instruction.lhs, instruction.rhs)
+            case TACBranch():
+                return (instruction.condition,)
+            case _:
+                return ()
+
+    # -Class Properties
+    __slots__ = (
+        "lines",
+        "variables",
+        "_cfg",
+        "_tree",
+        "_merges",
+        "_exits",
+        "_emitted",
+        "_return",
+    )
@@ -0,0 +1,89 @@
+##-------------------------------##
+## Ember Compiler                ##
+## Written By: Ryan Smith        ##
+##-------------------------------##
+## Backend: Virtual Machine      ##
+##-------------------------------##
+
+## Imports
+from dataclasses import dataclass
+from time import perf_counter
+from typing import TYPE_CHECKING
+from .program import VMProgram
+
+if TYPE_CHECKING:
+    from .handlers import Registers
+    from ...ir import TACUnit
+
+## Constants
+__all__ = (
+    "TACVirtualMachine",
+    "VMProgram",
+    "VMStats",
+)
+
+
+## Classes
+@dataclass(slots=True)
+class VMStats:
+    """Counts of a virtual machine run."""
+    # -Dunder Methods
+    def __str__(self) -> str:
+        return (
+            f"{self.instructions} instructions in {self.seconds:.6f}s "
+            f"({self.instructions_per_second:,.0f} instructions/sec)"
+        )
+
+    # -Properties
+    instructions: int = 0
+    seconds: float = 0.0
+
+    @property
+    def instructions_per_second(self) -> float:
+        return self.instructions / self.seconds if self.seconds else 0.0
+
+
+class TACVirtualMachine:
+    """
+    A register machine executing linear TAC.
+
+    Runs a pre-decoded program over a flat register file: each step calls the
+    handler at the program counter, which returns the next program counter.
+    Arithmetic wraps to the checked type of each binary (int64 when untyped), matching
+    the tree-walk interpreter, closure and transpiler backends.
+    """
+
+    # -Constructor
+    def __init__(self, program: VMProgram) -> None:
+        self.program = program
+        self.registers: Registers = program.registers()
+        self.stats = VMStats()
+
+    # -Instance Methods
+    def execute(self) -> VMStats:
+        '''Run program from its first instruction until it falls off the end.'''
+        code, registers = self.program.code, self.registers
+        end = len(code)
+        pc = executed = 0
+        start = perf_counter()
+        while pc < end:
+            pc = code[pc](registers)
+            executed += 1
+        self.stats.seconds += perf_counter() - start
+        self.stats.instructions += executed
+        return self.stats
+
+    def variable(self, _id: int, version: int = 0) -> int | None:
+        '''Return value held by variable version or None if unassigned.'''
+        slot = self.program.variable_slot(_id, version)
+        return None if slot is None else self.registers[slot]
+
+    # -Static Methods
+    @staticmethod
+    def run(tac: TACUnit) -> TACVirtualMachine:
+        vm = TACVirtualMachine(VMProgram.load(tac))
+        vm.execute()
+        return vm
+
+    # -Class Properties
+    __slots__ = ("program", "registers", "stats")
@@ -0,0 +1,147 @@
+##-------------------------------##
+## Ember Compiler                ##
+## Written By: Ryan Smith        ##
+##-------------------------------##
+## VM: Handlers                  ##
+##-------------------------------##
+
+## Imports
+from typing import TYPE_CHECKING, assert_never
+from ...ast import BinaryOperator
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+## Constants
+type Registers = list[int | None]
+type Handler = Callable[[Registers], int]
+type HandlerFactory = Callable[[int, int, int, int, int, int], Handler]
+
+
+## Functions
+# -Control
+def copy(dest: int, src: int, following: int) -> Handler:
+    def handler(r: Registers) -> int:
+        r[dest] = r[src]
+        return following
+    return handler
+
+
+def jump(target: int) -> Handler:
+    def handler(r: Registers) -> int:
+        return target
+    return handler
+
+
+def branch(condition: int, true_target: int, false_target: int) -> Handler:
+    def handler(r: Registers) -> int:
+        return true_target if r[condition] else false_target
+    return handler
+
+
+# -Math: results wrapped with ((value + bias) & mask) - bias
+def _add(dest: int, lhs: int, rhs: int, bias: int, mask: int, following: int) -> Handler:
+    def handler(r: Registers) -> int:
+        r[dest] = ((r[lhs] + r[rhs] + bias) & mask) - bias  # type: ignore[operator]
+        return following
+    return handler
+
+
+def _sub(dest: int, lhs: int, rhs: int, bias: int, mask: int, following: int) -> Handler:
+    def handler(r: Registers) -> int:
+        r[dest] = ((r[lhs] - r[rhs] + bias) & mask) - bias  # type: ignore[operator]
+        return following
+    return handler
+
+
+def _mul(dest: int, lhs: int, rhs: int, bias: int, mask: int, following: int) -> Handler:
+    def handler(r: Registers) -> int:
+        r[dest] = ((r[lhs] * r[rhs] + bias) & mask) - bias  # type: ignore[operator]
+        return following
+    return handler
+
+
+def _div(dest: int, lhs: int, rhs: int, bias: int, mask: int, following: int) -> Handler:
+    def handler(r: Registers) -> int:
+        r[dest] = ((r[lhs] // r[rhs] + bias) & mask) - bias  # type: ignore[operator]
+        return following
+    return handler
+
+
+def _mod(dest: int, lhs: int, rhs: int, bias: int, mask: int, following: int) -> Handler:
+    def handler(r: Registers) -> int:
+        r[dest] = r[lhs] % r[rhs]  # type: ignore[operator]
+        return following
+    return handler
+
+
+# -Comparisons
+def _eq(dest: int, lhs: int, rhs: int, bias: int, mask: int, following: int) -> Handler:
+    def handler(r: Registers) -> int:
+        r[dest] = 1 if r[lhs] == r[rhs] else 0
+        return following
+    return handler
+
+
+def _nteq(dest: int, lhs: int, rhs: int, bias: int, mask: int, following: int) -> Handler:
+    def handler(r: Registers) -> int:
+        r[dest] = 1 if r[lhs] != r[rhs] else 0
+        return following
+    return handler
+
+
+def _lt(dest: int, lhs: int, rhs: int, bias: int, mask: int, following: int) -> Handler:
+    def handler(r: Registers) -> int:
+        r[dest] = 1 if r[lhs] < r[rhs] else 0  # type: ignore[operator]
+        return following
+    return handler
+
+
+def _lteq(dest: int, lhs: int, rhs: int, bias: int, mask: int, following: int) -> Handler:
+    def handler(r: Registers) -> int:
+        r[dest] = 1 if r[lhs] <= r[rhs] else 0  # type: ignore[operator]
+        return following
+    return handler
+
+
+def _gt(dest: int, lhs: int, rhs: int, bias: int, mask: int, following: int) -> Handler:
+    def handler(r: Registers) -> int:
+        r[dest] = 1 if r[lhs] > r[rhs] else 0  # type: ignore[operator]
+        return following
+    return handler
+
+
+def _gteq(dest: int, lhs: int, rhs: int, bias: int, mask: int, following: int) -> Handler:
+    def handler(r: Registers) -> int:
+        r[dest] = 1 if r[lhs] >= r[rhs] else 0  # type: ignore[operator]
+        return following
+    return handler
+
+
+def binary(operator: BinaryOperator) -> HandlerFactory:
+    '''Return handler factory specialized for operator.'''
+    match operator:
+        case BinaryOperator.Add:
+            return _add
+        case BinaryOperator.Sub:
+            return _sub
+        case BinaryOperator.Mul:
+            return _mul
+        case BinaryOperator.Div:
+            return _div
+        case BinaryOperator.Mod:
+            return _mod
+        case BinaryOperator.Eq:
+            return _eq
+        case BinaryOperator.NtEq:
+            return _nteq
+        case BinaryOperator.Lt:
+            return _lt
+        case BinaryOperator.LtEq:
+            return _lteq
+        case BinaryOperator.Gt:
+            return _gt
+        case BinaryOperator.GtEq:
+            return _gteq
+        case _:
+            assert_never(operator)
@@ -0,0 +1,127 @@
+##-------------------------------##
+## Ember Compiler                ##
+## Written By: Ryan Smith        ##
+##-------------------------------##
+## VM: Program                   ##
+##-------------------------------##
+
+## Imports
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, assert_never
+from . import handlers
+from ...ast import TypePrimitive
+from ...ir import (
+    TACLiteral,
+    TACTemporary,
+    TACVariable,
+    TACAssign,
+    TACBinary,
+    TACDeclare,
+    TACLabel,
+    TACJump,
+    TACBranch,
+    TACPhi,
+)
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+    from .handlers import Handler, Registers
+    from ...ir import TACOperand, TACInstruction
+
+## Constants
+DEFAULT_TYPE = TypePrimitive.int64
+type SlotKey = tuple[int, int, int]
+
+
+## Classes
+@dataclass(slots=True)
+class VMProgram:
+    """
+    Pre-decoded VM Program
+
+    Every variable version, temporary and distinct literal owns a dense slot of the
+    register file; literal slots are preloaded so handlers never test operand kinds.
+    Each instruction becomes a handler closure bound to its slots and returning the
+    index of the next handler. Labels and declarations emit no handler, their
+    targets resolving to the following instruction instead.
+    """
+    # -Instance Methods
+    def registers(self) -> Registers:
+        '''Return a fresh register file with literals preloaded.'''
+        registers: Registers = [None] * self.size
+        for slot, value in self.constants:
+            registers[slot] = value
+        return registers
+
+    def slot_of(self, operand: TACOperand) -> int:
+        '''Return slot of operand; allocating it on first use.'''
+        match operand:
+            case TACLiteral():
+                key = (0, operand.value, 0)
+            case TACTemporary():
+                key = (1, operand.index, 0)
+            case TACVariable():
+                key = (2, operand.id, operand.version)
+            case _:
+                assert_never(operand)
+        slot = self.slots.get(key)
+        if slot is None:
+            slot = self.slots[key] = self.size
+            self.size += 1
+            if isinstance(operand, TACLiteral):
+                self.constants.append((slot, operand.value))
+        return slot
+
+    def variable_slot(self, _id: int, version: int = 0) -> int | None:
+        '''Return slot of variable version or None if the program never uses it.'''
+        return self.slots.get((2, _id, version))
+
+    # -Properties
+    code: list[Handler] = field(default_factory=list)
+    size: int = 0
+    slots: dict[SlotKey, int] = field(default_factory=dict)
+    constants: list[tuple[int, int]] = field(default_factory=list)
+
+    # -Class Methods
+    @classmethod
+    def load(cls, instructions: Iterable[TACInstruction]) -> VMProgram:
+        '''Allocate slots and decode instructions into handlers.'''
+        program = cls()
+        executable: list[TACInstruction] = []
+        labels: dict[int, int] = {}
+        for instruction in instructions:
+            match instruction:
+                case TACLabel():
+                    labels[instruction.id] = len(executable)
+                case TACDeclare():
+                    continue
+                case TACPhi():
+                    assert False, "Tried loading a phi instruction; translate out of SSA first"
+                case _:
+                    executable.append(instruction)
+        slot_of = program.slot_of
+        for index, instruction in enumerate(executable):
+            following = index + 1
+            match instruction:
+                case TACAssign():
+                    handler = handlers.copy(
+                        slot_of(instruction.dest), slot_of(instruction.src), following
+                    )
+                case TACBinary():
+                    _type = instruction.type or DEFAULT_TYPE
+                    bias = -_type.min_value
+                    handler = handlers.binary(instruction.operator)(
+                        slot_of(instruction.dest), slot_of(instruction.lhs), slot_of(instruction.rhs),
+                        bias, (1 << _type.bits) - 1, following,
+                    )
+                case TACJump():
+                    handler = handlers.jump(labels[instruction.target])
+                case TACBranch():
+                    handler = handlers.branch(
+                        slot_of(instruction.condition),
+                        labels[instruction.true_target], labels[instruction.false_target],
+                    )
+                case _:
+                    assert False, f"Tried loading unsupported instruction: {type(instruction).__name__}"
+            program.code.append(handler)
+        return program
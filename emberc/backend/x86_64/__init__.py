@@ -6,6 +6,7 @@
 ##-------------------------------##
 
 ## Imports
+from .condition import x86Condition
 from .register import (
     x86Register,
 )
@@ -13,6 +14,7 @@ from .selector import x86_64InstructionSelector
 
 ## Constants
 __all__ = (
+    "x86Condition",
     "x86Register",
     "x86_64InstructionSelector",
 )
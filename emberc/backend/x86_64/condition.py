@@ -0,0 +1,24 @@
+##-------------------------------##
+## Ember Compiler                ##
+## Written By: Ryan Smith        ##
+##-------------------------------##
+## x86_64: Conditions            ##
+##-------------------------------##
+
+## Imports
+from enum import IntEnum, auto
+
+
+## Classes
+class x86Condition(IntEnum):
+    """Flag conditions of conditional jumps and sets; B/A variants compare unsigned."""
+    E = auto()
+    NE = auto()
+    L = auto()
+    LE = auto()
+    G = auto()
+    GE = auto()
+    B = auto()
+    BE = auto()
+    A = auto()
+    AE = auto()
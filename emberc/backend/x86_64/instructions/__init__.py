@@ -7,8 +7,13 @@
 
 ## Imports
 from .add import x86Add
+from .cmp import x86Cmp
+from .jcc import x86Jcc
+from .jmp import x86Jmp
+from .label import x86Label
 from .mov import x86Mov
 from .mul import x86Mul
+from .setcc import x86Setcc
 from .sub import x86Sub
 
 ## Constants
@@ -17,4 +22,9 @@ __all__ = (
     "x86Add",
     "x86Sub",
     "x86Mul",
+    "x86Cmp",
+    "x86Jmp",
+    "x86Jcc",
+    "x86Setcc",
+    "x86Label",
 )
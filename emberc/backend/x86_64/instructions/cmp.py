@@ -0,0 +1,42 @@
+##-------------------------------##
+## Ember Compiler                ##
+## Written By: Ryan Smith        ##
+##-------------------------------##
+## x86_64 Instruction: Cmp       ##
+##-------------------------------##
+
+## Imports
+from dataclasses import dataclass
+from typing import TYPE_CHECKING
+from ...mir import MIRInstruction
+
+if TYPE_CHECKING:
+    from collections.abc import Sequence
+    from ...mir import (
+        MIROperand,
+        MIRRegister
+    )
+
+## Classes
+@dataclass(frozen=True, slots=True)
+class x86Cmp(MIRInstruction):
+    """
+    Supports:
+    cmp %reg, %reg
+    cmp %reg, <immediate>
+    """
+    # -Properties
+    lhs: MIRRegister
+    rhs: MIROperand
+
+    @property
+    def reads(self) -> Sequence[MIRRegister]:
+        match self.rhs:
+            case int():
+                return (self.lhs,)
+            case _:
+                return (self.lhs, self.rhs)
+
+    @property
+    def writes(self) -> Sequence[MIRRegister]:
+        return ()
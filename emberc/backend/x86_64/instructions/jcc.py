@@ -0,0 +1,37 @@
+##-------------------------------##
+## Ember Compiler                ##
+## Written By: Ryan Smith        ##
+##-------------------------------##
+## x86_64 Instruction: Jcc       ##
+##-------------------------------##
+
+## Imports
+from dataclasses import dataclass
+from typing import TYPE_CHECKING
+from ..condition import x86Condition
+from ...mir import MIRInstruction
+
+if TYPE_CHECKING:
+    from collections.abc import Sequence
+    from ...mir import (
+        MIRRegister
+    )
+
+## Classes
+@dataclass(frozen=True, slots=True)
+class x86Jcc(MIRInstruction):
+    """
+    Supports:
+    j<condition> <label>
+    """
+    # -Properties
+    condition: x86Condition
+    target: int
+
+    @property
+    def reads(self) -> Sequence[MIRRegister]:
+        return ()
+
+    @property
+    def writes(self) -> Sequence[MIRRegister]:
+        return ()
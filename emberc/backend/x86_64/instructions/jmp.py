@@ -0,0 +1,35 @@
+##-------------------------------##
+## Ember Compiler                ##
+## Written By: Ryan Smith        ##
+##-------------------------------##
+## x86_64 Instruction: Jmp       ##
+##-------------------------------##
+
+## Imports
+from dataclasses import dataclass
+from typing import TYPE_CHECKING
+from ...mir import MIRInstruction
+
+if TYPE_CHECKING:
+    from collections.abc import Sequence
+    from ...mir import (
+        MIRRegister
+    )
+
+## Classes
+@dataclass(frozen=True, slots=True)
+class x86Jmp(MIRInstruction):
+    """
+    Supports:
+    jmp <label>
+    """
+    # -Properties
+    target: int
+
+    @property
+    def reads(self) -> Sequence[MIRRegister]:
+        return ()
+
+    @property
+    def writes(self) -> Sequence[MIRRegister]:
+        return ()
@@ -0,0 +1,38 @@
+##-------------------------------##
+## Ember Compiler                ##
+## Written By: Ryan Smith        ##
+##-------------------------------##
+## x86_64 Instruction: Setcc     ##
+##-------------------------------##
+
+## Imports
+from dataclasses import dataclass
+from typing import TYPE_CHECKING
+from ..condition import x86Condition
+from ...mir import MIRInstruction
+
+if TYPE_CHECKING:
+    from collections.abc import Sequence
+    from ...mir import (
+        MIRRegister
+    )
+
+## Classes
+@dataclass(frozen=True, slots=True)
+class x86Setcc(MIRInstruction):
+    """
+    Supports:
+    set<condition> %reg
+    """
+    # -Properties
+    condition: x86Condition
+    dest: MIRRegister
+
+    @property
+    def reads(self) -> Sequence[MIRRegister]:
+        # -Only the low byte is written, so the rest of dest is carried through
+        return (self.dest,)
+
+    @property
+    def writes(self) -> Sequence[MIRRegister]:
+        return (self.dest,)
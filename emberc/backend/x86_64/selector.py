@@ -12,7 +12,13 @@ from .instructions import (
     x86Add,
     x86Sub,
     x86Mul,
+    x86Cmp,
+    x86Jmp,
+    x86Jcc,
+    x86Setcc,
+    x86Label,
 )
+from .condition import x86Condition
 from .register import x86Register
 from ..mir import (
     MIRUnit,
@@ -29,10 +35,26 @@ if TYPE_CHECKING:
         TACAssign,
         TACBinary,
         TACDeclare,
+        TACLabel,
+        TACJump,
+        TACBranch,
+        TACPhi,
     )
     from ...middleware import Symbol
 
 
+## Constants
+CONDITIONS: dict[BinaryOperator, tuple[x86Condition, x86Condition]] = {
+    # -(signed, unsigned)
+    BinaryOperator.Eq: (x86Condition.E, x86Condition.E),
+    BinaryOperator.NtEq: (x86Condition.NE, x86Condition.NE),
+    BinaryOperator.Lt: (x86Condition.L, x86Condition.B),
+    BinaryOperator.LtEq: (x86Condition.LE, x86Condition.BE),
+    BinaryOperator.Gt: (x86Condition.G, x86Condition.A),
+    BinaryOperator.GtEq: (x86Condition.GE, x86Condition.AE),
+}
+
+
 ## Classes
 class x86_64InstructionSelector(MIRInstructionSelector):
     """"""
@@ -68,6 +90,27 @@ class x86_64InstructionSelector(MIRInstructionSelector):
                     x86Mul(temporary),
                     x86Mov(dest, rax),
                 )
+            case (
+                BinaryOperator.Eq | BinaryOperator.NtEq |
+                BinaryOperator.Lt | BinaryOperator.LtEq |
+                BinaryOperator.Gt | BinaryOperator.GtEq
+            ):
+                signed, unsigned = CONDITIONS[tac.operator]
+                condition = signed if tac.type is None or tac.type.is_signed else unsigned
+                # -Zeroing dest after cmp keeps flags and lets dest alias an operand
+                if isinstance(lhs, int):
+                    temporary = self.next_register
+                    return (
+                        x86Mov(temporary, lhs),
+                        x86Cmp(temporary, rhs),
+                        x86Mov(dest, 0),
+                        x86Setcc(condition, dest),
+                    )
+                return (
+                    x86Cmp(lhs, rhs),
+                    x86Mov(dest, 0),
+                    x86Setcc(condition, dest),
+                )
             case _:
                 raise NotImplementedError(f"Operator '{tac.operator}' not implemented in x86_64 instruction selector")
                 assert_never(tac.operator)
@@ -77,6 +120,29 @@ class x86_64InstructionSelector(MIRInstructionSelector):
         self.add_variable_register(tac.id)
         return tuple()
 
+    def visit_label(self, tac: TACLabel) -> Collection[MIRInstruction]:
+        ''''''
+        return (x86Label(tac.id),)
+
+    def visit_jump(self, tac: TACJump) -> Collection[MIRInstruction]:
+        ''''''
+        return (x86Jmp(tac.target),)
+
+    def visit_branch(self, tac: TACBranch) -> Collection[MIRInstruction]:
+        ''''''
+        condition = self.visit_operand(tac.condition)
+        if isinstance(condition, int):
+            return (x86Jmp(tac.true_target if condition else tac.false_target),)
+        return (
+            x86Cmp(condition, 0),
+            x86Jcc(x86Condition.NE, tac.true_target),
+            x86Jmp(tac.false_target),
+        )
+
+    def visit_phi(self, tac: TACPhi) -> Collection[MIRInstruction]:
+        ''''''
+        assert False, "Tried selecting a phi instruction; translate out of SSA first"
+
     # -Static Methods
     @staticmethod
     def run(tac: TACUnit, symbols: Sequence[Symbol]) -> MIRUnit:
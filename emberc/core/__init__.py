@@ -8,9 +8,11 @@
 ## Imports
 from .lookahead_buffer import LookaheadBuffer
 from .span import Span
+from .span_index import SpanIndex
 
 ## Constants
 __all__ = (
     "LookaheadBuffer",
     "Span",
+    "SpanIndex",
 )
@@ -0,0 +1,189 @@
+##-------------------------------##
+## Ember Compiler                ##
+## Written By: Ryan Smith        ##
+##-------------------------------##
+## Core: Span Index              ##
+##-------------------------------##
+
+## Imports
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable, Iterator
+    from .span import Span
+
+## Constants
+__all__ = ("SpanIndex",)
+type _Key = tuple[int, int, int]
+_PRIORITY_MULTIPLIER = 0x9E3779B97F4A7C15
+_PRIORITY_MASK = (1 << 64) - 1
+
+
+## Functions
+def _priority_from(serial: int) -> int:
+    """Return a deterministic pseudo-random heap priority for an insertion serial."""
+    return (serial * _PRIORITY_MULTIPLIER) & _PRIORITY_MASK
+
+
+## Classes
+@dataclass(slots=True)
+class _IntervalNode[Item]:
+    """Treap node ordered by (start, -end, serial) and augmented with subtree max end."""
+    # -Instance Methods
+    def update(self) -> None:
+        '''Recalculate subtree max end from children.'''
+        max_end = self.end
+        if self.left is not None and self.left.max_end > max_end:
+            max_end = self.left.max_end
+        if self.right is not None and self.right.max_end > max_end:
+            max_end = self.right.max_end
+        self.max_end = max_end
+
+    # -Properties
+    key: _Key
+    item: Item
+    priority: int
+    max_end: int
+    left: _IntervalNode[Item] | None = field(default=None)
+    right: _IntervalNode[Item] | None = field(default=None)
+
+    @property
+    def start(self) -> int:
+        return self.key[0]
+
+    @property
+    def end(self) -> int:
+        return -self.key[1]
+
+
+class SpanIndex[Item]:
+    """
+    Span Interval Index
+
+    A balanced interval tree (treap augmented with subtree max end) over spans of a single source.
+    Answers innermost and all-enclosing item queries for an offset in logarithmic time
+    and supports incremental insertion and removal when subtrees are replaced.
+    """
+    # -Constructor
+    def __init__(self) -> None:
+        self._root: _IntervalNode[Item] | None = None
+        self._keys: dict[int, _Key] = {}
+        self._serial = 0
+
+    # -Dunder Methods
+    def __contains__(self, item: Item) -> bool:
+        return id(item) in self._keys
+
+    def __iter__(self) -> Iterator[Item]:
+        stack: list[_IntervalNode[Item]] = []
+        node = self._root
+        while stack or node is not None:
+            while node is not None:
+                stack.append(node)
+                node = node.left
+            node = stack.pop()
+            yield node.item
+            node = node.right
+
+    def __len__(self) -> int:
+        return len(self._keys)
+
+    # -Instance Methods: Mutation
+    def insert(self, span: Span, item: Item) -> None:
+        '''Index item under the given span; assert item is not already indexed.'''
+        assert id(item) not in self._keys, "Tried indexing an item twice."
+        key = (span.start, -span.end, self._serial)
+        node = _IntervalNode(key, item, _priority_from(self._serial), span.end)
+        self._serial += 1
+        self._keys[id(item)] = key
+        lower, upper = self._split(self._root, key)
+        self._root = self._merge(self._merge(lower, node), upper)
+
+    def extend(self, entries: Iterable[tuple[Span, Item]]) -> None:
+        '''Index every (span, item) pair.'''
+        for span, item in entries:
+            self.insert(span, item)
+
+    def remove(self, item: Item) -> None:
+        '''Remove item from index; assert item is indexed.'''
+        key = self._keys.pop(id(item), None)
+        assert key is not None, "Tried removing an item that is not indexed."
+        lower, upper = self._split(self._root, key)
+        _, upper = self._split(upper, (key[0], key[1], key[2] + 1))
+        self._root = self._merge(lower, upper)
+
+    # -Instance Methods: Queries
+    def enclosing(self, position: int) -> list[Item]:
+        '''Return all items whose span covers position; ordered outermost to innermost.'''
+        items: list[Item] = []
+        stack: list[_IntervalNode[Item]] = []
+        node = self._root
+        while stack or node is not None:
+            while node is not None and node.max_end > position:
+                stack.append(node)
+                node = node.left
+            if not stack:
+                break
+            node = stack.pop()
+            if node.start > position:
+                break
+            if position < node.end:
+                items.append(node.item)
+            node = node.right
+        return items
+
+    def innermost(self, position: int) -> Item | None:
+        '''Return the innermost item whose span covers position or None if uncovered.'''
+        best: _IntervalNode[Item] | None = None
+        node = self._root
+        stack: list[_IntervalNode[Item]] = []
+        # -Reverse in-order walk; first covering node is the innermost
+        while stack or node is not None:
+            while node is not None and node.max_end > position:
+                stack.append(node)
+                node = node.right if node.start <= position else None
+            if not stack:
+                break
+            node = stack.pop()
+            if node.start <= position < node.end:
+                best = node
+                break
+            node = node.left
+        return best.item if best is not None else None
+
+    # -Instance Methods: Helpers
+    def _split(
+        self, node: _IntervalNode[Item] | None, key: _Key
+    ) -> tuple[_IntervalNode[Item] | None, _IntervalNode[Item] | None]:
+        '''Split tree into nodes ordered before key and nodes at or after key.'''
+        if node is None:
+            return (None, None)
+        if node.key < key:
+            lower, upper = self._split(node.right, key)
+            node.right = lower
+            node.update()
+            return (node, upper)
+        lower, upper = self._split(node.left, key)
+        node.left = upper
+        node.update()
+        return (lower, node)
+
+    def _merge(
+        self, lower: _IntervalNode[Item] | None, upper: _IntervalNode[Item] | None
+    ) -> _IntervalNode[Item] | None:
+        '''Merge two trees where every key in lower orders before every key in upper.'''
+        if lower is None:
+            return upper
+        if upper is None:
+            return lower
+        if lower.priority > upper.priority:
+            lower.right = self._merge(lower.right, upper)
+            lower.update()
+            return lower
+        upper.left = self._merge(lower, upper.left)
+        upper.update()
+        return upper
+
+    # -Class Properties
+    __slots__ = ("_root", "_keys", "_serial")
@@ -7,13 +7,20 @@
 
 ## Imports
 from .diagnostic import Diagnostic
+from .emitter import DiagnosticEmitter, JSONLinesEmitter, SARIFEmitter
 from .engine import DiagnosticEngine
-from .source_map import Source, SourceMap
+from .renderer import DiagnosticRenderer
+from .source_map import PackedSpan, Source, SourceMap
 
 ## Constants
 __all__ = (
     "Diagnostic",
+    "DiagnosticEmitter",
     "DiagnosticEngine",
+    "DiagnosticRenderer",
+    "JSONLinesEmitter",
+    "PackedSpan",
+    "SARIFEmitter",
     "Source",
     "SourceMap",
 )
@@ -52,6 +52,9 @@ class Diagnostic:
 
     # -Sub-Classes
     class Code(Enum):
+        # -Engine
+        E0001 = ("Aborting after {0} errors", True)
+        E0002 = ("Further '{0}' diagnostics suppressed after {1} reports", True)
         # -Lexer
         E1001 = ("Unknown character '{0}' found", True)
         E1002 = ("Unterminated multi-line comment; expected '*/'", False)
@@ -0,0 +1,165 @@
+##-------------------------------##
+## Ember Compiler                ##
+## Written By: Ryan Smith        ##
+##-------------------------------##
+## Diagnostics: Emitter          ##
+##-------------------------------##
+
+## Imports
+import json
+from typing import TYPE_CHECKING, Any, Protocol, TextIO, assert_never
+from .diagnostic import Diagnostic
+
+if TYPE_CHECKING:
+    from .source_map import SourceMap
+
+## Constants
+__all__ = (
+    "DiagnosticEmitter",
+    "JSONLinesEmitter",
+    "SARIFEmitter",
+)
+SARIF_SCHEMA = "https://json.schemastore.org/sarif-2.1.0.json"
+SARIF_VERSION = "2.1.0"
+type JSONRecord = dict[str, Any]
+
+
+## Functions
+def _level_name(level: Diagnostic.Level) -> str:
+    """Return machine-readable name of a diagnostic level."""
+    match level:
+        case Diagnostic.Level.Error:
+            return "error"
+        case Diagnostic.Level.Warn:
+            return "warning"
+        case _:
+            assert_never(level)
+
+
+def _format_message(diagnostic: Diagnostic) -> str:
+    """Return diagnostic message with args applied."""
+    if diagnostic.is_formatted:
+        return diagnostic.message.format(*diagnostic.args)
+    return diagnostic.message
+
+
+## Classes
+class DiagnosticEmitter(Protocol):
+    """Diagnostic emitter interface; receives every diagnostic as it is stored."""
+    # -Instance Methods
+    def emit(self, diagnostic: Diagnostic) -> None: ...
+    def finish(self) -> None: ...
+
+
+class JSONLinesEmitter:
+    """
+    JSON Lines Emitter
+
+    Writes each diagnostic as a single JSON record the moment it is reported,
+    carrying its code, level, message, args and resolved span.
+    """
+    # -Constructor
+    def __init__(self, source_map: SourceMap, fd: TextIO) -> None:
+        self.source_map = source_map
+        self.fd = fd
+
+    # -Instance Methods
+    def emit(self, diagnostic: Diagnostic) -> None:
+        '''Write diagnostic as a JSON line and flush.'''
+        self.fd.write(json.dumps(self.record(diagnostic), default=str))
+        self.fd.write('\n')
+        self.fd.flush()
+
+    def finish(self) -> None:
+        self.fd.flush()
+
+    def record(self, diagnostic: Diagnostic) -> JSONRecord:
+        '''Return JSON record of diagnostic with a resolved span.'''
+        location = diagnostic.location
+        source = self.source_map[location.id]
+        row, column = source.resolve_location(location.start)
+        return {
+            "code": diagnostic.name,
+            "level": _level_name(diagnostic.level),
+            "message": _format_message(diagnostic),
+            "args": list(diagnostic.args),
+            "span": {
+                "source": location.id,
+                "path": str(source.path) if source.is_path else None,
+                "start": location.start,
+                "end": location.end,
+                "row": row,
+                "column": column,
+            },
+        }
+
+    # -Class Properties
+    __slots__ = ("source_map", "fd")
+
+
+class SARIFEmitter:
+    """
+    SARIF Emitter
+
+    Collects diagnostics as SARIF results and writes a single SARIF 2.1.0 log on finish.
+    """
+    # -Constructor
+    def __init__(self, source_map: SourceMap, fd: TextIO) -> None:
+        self.source_map = source_map
+        self.fd = fd
+        self._rules: dict[Diagnostic.Code, JSONRecord] = {}
+        self._results: list[JSONRecord] = []
+
+    # -Instance Methods
+    def emit(self, diagnostic: Diagnostic) -> None:
+        '''Convert diagnostic into a SARIF result.'''
+        if diagnostic.code not in self._rules:
+            self._rules[diagnostic.code] = {
+                "id": diagnostic.name,
+                "shortDescription": {"text": diagnostic.message},
+            }
+        self._results.append({
+            "ruleId": diagnostic.name,
+            "level": _level_name(diagnostic.level),
+            "message": {"text": _format_message(diagnostic)},
+            "locations": [self._location(diagnostic)],
+        })
+
+    def finish(self) -> None:
+        '''Write SARIF log of all collected results.'''
+        log = {
+            "$schema": SARIF_SCHEMA,
+            "version": SARIF_VERSION,
+            "runs": [{
+                "tool": {"driver": {
+                    "name": "emberc",
+                    "rules": list(self._rules.values()),
+                }},
+                "results": self._results,
+            }],
+        }
+        json.dump(log, self.fd, indent=2)
+        self.fd.write('\n')
+        self.fd.flush()
+
+    def _location(self, diagnostic: Diagnostic) -> JSONRecord:
+        '''Return SARIF physical location of diagnostic span.'''
+        location = diagnostic.location
+        source = self.source_map[location.id]
+        start_row, start_column = source.resolve_location(location.start)
+        end_row, end_column = source.resolve_location(location.end)
+        uri = source.path.as_posix() if source.is_path else f"source-{location.id}"
+        return {"physicalLocation": {
+            "artifactLocation": {"uri": uri},
+            "region": {
+                "startLine": start_row,
+                "startColumn": start_column,
+                "endLine": end_row,
+                "endColumn": end_column,
+                "charOffset": location.start,
+                "charLength": len(location),
+            },
+        }}
+
+    # -Class Properties
+    __slots__ = ("source_map", "fd", "_rules", "_results")
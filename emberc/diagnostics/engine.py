@@ -7,18 +7,29 @@
 
 ## Imports
 import sys
+from threading import Lock
 from typing import (
     TYPE_CHECKING,
     Any, Self, TextIO,
-    assert_never
 )
 from .diagnostic import Diagnostic
+from .emitter import JSONLinesEmitter, SARIFEmitter
+from .renderer import DiagnosticRenderer
 from .source_map import SourceMap
 
 if TYPE_CHECKING:
-    from collections.abc import MutableSequence
+    from collections.abc import (
+        Iterable,
+        Iterator,
+        MutableSequence,
+        Sequence,
+    )
+    from .emitter import DiagnosticEmitter
     from ..core import Span
 
+## Constants
+ENGINE_CODES = (Diagnostic.Code.E0001, Diagnostic.Code.E0002)
+
 
 ## Classes
 class DiagnosticEngine:
@@ -26,48 +37,71 @@ class DiagnosticEngine:
     Ember Diagnostic Engine
 
     Driver for logging, storing, and displaying diagnostics through compiler pipeline.
+    Optionally caps the total error count and the reports stored per code; once the
+    error cap is passed the engine aborts, which signals each pass to stop early.
+    Every path storing a diagnostic is serialized by one lock, so reports and merges
+    may come from any thread; parallel workers report into forked engines whose
+    batches are merged back ordered by source id and offset. Stored order is arrival
+    order across batches; `display` re-sorts by source and offset.
     """
     # -Constructor
-    def __init__(self, source_map: SourceMap) -> None:
+    def __init__(
+        self, source_map: SourceMap,
+        max_errors: int | None = None,
+        max_per_code: int | None = None,
+    ) -> None:
         self.source_map: SourceMap = source_map
+        self.max_errors = max_errors
+        self.max_per_code = max_per_code
         self.has_error = False
         self.has_warning = False
+        self.is_aborted = False
+        self._error_count = 0
+        self._code_counts: dict[Diagnostic.Code, int] = {}
         self._diagnostics: MutableSequence[Diagnostic] = []
+        self._emitters: MutableSequence[DiagnosticEmitter] = []
+        self._lock = Lock()
+
+    # -Dunder Methods
+    def __iter__(self) -> Iterator[Diagnostic]:
+        yield from self._diagnostics
+
+    def __len__(self) -> int:
+        return len(self._diagnostics)
 
     # -Instance Methods: Display
     def display(
         self, fd: TextIO = sys.stderr,
-        level: Diagnostic.Level = Diagnostic.Level.Warn
+        level: Diagnostic.Level = Diagnostic.Level.Warn,
+        snippets: bool = True,
     ) -> None:
-        '''Display all diagnostics to io; filter by level.'''
+        '''Display all diagnostics to io ordered by source and offset; filter by level.'''
+        renderer = DiagnosticRenderer(self.source_map, fd, snippets)
+        renderer.render(self._diagnostics, level)
+
+    # -Instance Methods: Emission
+    def add_emitter(self, emitter: DiagnosticEmitter) -> None:
+        '''Attach emitter; it receives every diagnostic as soon as it is stored.'''
+        self._emitters.append(emitter)
+
+    def finish(self) -> None:
+        '''Signal end of compilation to all attached emitters.'''
+        for emitter in self._emitters:
+            emitter.finish()
+
+    def write_jsonl(self, fd: TextIO) -> None:
+        '''Write all stored diagnostics as JSON Lines.'''
+        self._replay(JSONLinesEmitter(self.source_map, fd))
+
+    def write_sarif(self, fd: TextIO) -> None:
+        '''Write all stored diagnostics as a SARIF log.'''
+        self._replay(SARIFEmitter(self.source_map, fd))
+
+    def _replay(self, emitter: DiagnosticEmitter) -> None:
+        '''Emit every stored diagnostic to emitter, then finish it.'''
         for diagnostic in self._diagnostics:
-            if diagnostic.level > level:
-                continue
-            formatted = self._format_diagnostic(diagnostic)
-            print(formatted, file=fd)
-
-    def _format_diagnostic(self, diagnostic: Diagnostic) -> str:
-        '''Return formatted string of diagnostic report.'''
-        source = self.source_map[diagnostic.location.id]
-        # -Location
-        location = str(source.path) if source.is_path else "<raw source>"
-        row, column = source.resolve_location(diagnostic.location.start)
-        location = f"[{location}:{row}:{column}]"
-        # -Level
-        level: str
-        match diagnostic.level:
-            case Diagnostic.Level.Error:
-                level = "Error"
-            case Diagnostic.Level.Warn:
-                level = "Warning"
-            case _:
-                assert_never(diagnostic.level)
-        level = f"{level}[{diagnostic.name}]"
-        # -Message
-        message = diagnostic.message
-        if diagnostic.is_formatted:
-            message = message.format(*diagnostic.args)
-        return f"{location} {level}: {message}"
+            emitter.emit(diagnostic)
+        emitter.finish()
 
     # -Instance Methods: Diagnostic
     def error(self, code: Diagnostic.Code, location: Span, *args: Any) -> None:
@@ -79,23 +113,87 @@ class DiagnosticEngine:
         self.report(Diagnostic(Diagnostic.Level.Warn, code, location, *args))
 
     def report(self, diagnostic: Diagnostic) -> None:
-        '''Store diagnostic and flag necessary state change.'''
+        '''Store diagnostic and flag necessary state change; enforce error and per-code limits.'''
+        with self._lock:
+            self._report(diagnostic)
+
+    def _report(self, diagnostic: Diagnostic) -> None:
+        '''Report diagnostic; caller holds the lock.'''
+        if self.is_aborted:
+            return
+        count = self._code_counts.get(diagnostic.code, 0) + 1
+        self._code_counts[diagnostic.code] = count
+        if self.max_per_code is None or count <= self.max_per_code:
+            self._store(diagnostic)
+        elif count == self.max_per_code + 1:
+            self._store(Diagnostic(
+                Diagnostic.Level.Warn, Diagnostic.Code.E0002,
+                diagnostic.location, diagnostic.name, self.max_per_code
+            ))
+        if diagnostic.level is not Diagnostic.Level.Error:
+            return
+        # -Suppressed errors still count towards the abort threshold
+        self._error_count += 1
+        if self.max_errors is not None and self._error_count >= self.max_errors:
+            self._store(Diagnostic(
+                Diagnostic.Level.Error, Diagnostic.Code.E0001,
+                diagnostic.location, self._error_count
+            ))
+            self.is_aborted = True
+
+    def _store(self, diagnostic: Diagnostic) -> None:
+        '''Append diagnostic and flag level state.'''
         self._diagnostics.append(diagnostic)
+        for emitter in self._emitters:
+            emitter.emit(diagnostic)
         match diagnostic.level:
             case Diagnostic.Level.Error:
                 self.has_error = True
             case Diagnostic.Level.Warn:
                 self.has_warning = True
 
+    # -Instance Methods: Workers
+    def fork(self) -> DiagnosticEngine:
+        '''Create a worker engine sharing the source map and limits; without emitters.'''
+        return DiagnosticEngine(self.source_map, self.max_errors, self.max_per_code)
+
+    def merge(self, *sinks: Iterable[Diagnostic]) -> None:
+        '''
+        Report diagnostics of worker engines (or pickled diagnostic collections)
+        ordered by source id and offset; ties keep sink order.
+        Engine summaries from workers are dropped as limits are re-applied here.
+        '''
+        diagnostics = [
+            diagnostic for sink in sinks for diagnostic in sink
+            if diagnostic.code not in ENGINE_CODES
+        ]
+        diagnostics.sort(key=lambda d: (d.location.id, d.location.start))
+        with self._lock:
+            for diagnostic in diagnostics:
+                self._report(diagnostic)
+
     # -Class Methods
     @classmethod
     def new(cls) -> Self:
         return cls(SourceMap())
 
+    # -Properties
+    @property
+    def diagnostics(self) -> Sequence[Diagnostic]:
+        '''Return stored diagnostics.'''
+        return tuple(self._diagnostics)
+
     # -Class Properties
     __slots__ = (
         "source_map",
+        "max_errors",
+        "max_per_code",
         "has_error",
         "has_warning",
+        "is_aborted",
+        "_error_count",
+        "_code_counts",
         "_diagnostics",
+        "_emitters",
+        "_lock",
     )
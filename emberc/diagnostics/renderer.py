@@ -0,0 +1,149 @@
+##-------------------------------##
+## Ember Compiler                ##
+## Written By: Ryan Smith        ##
+##-------------------------------##
+## Diagnostics: Renderer         ##
+##-------------------------------##
+
+## Imports
+from typing import TYPE_CHECKING, TextIO, assert_never
+from .diagnostic import Diagnostic
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable, Sequence
+    from .source_map import Source, SourceMap
+
+## Constants
+__all__ = ("DiagnosticRenderer",)
+DEFAULT_CHUNK_SIZE = 1 << 16
+
+
+## Functions
+def _level_name(level: Diagnostic.Level) -> str:
+    """Return display name of a diagnostic level."""
+    match level:
+        case Diagnostic.Level.Error:
+            return "Error"
+        case Diagnostic.Level.Warn:
+            return "Warning"
+        case _:
+            assert_never(level)
+
+
+## Classes
+class DiagnosticRenderer:
+    """
+    Diagnostic Renderer
+
+    Formats a batch of diagnostics into human readable reports.
+    Filters by level before formatting, sorts by source and offset so every source's
+    locations resolve in a single merge pass over its line index, and writes
+    caret-underlined snippets to the output in large chunks.
+    """
+    # -Constructor
+    def __init__(
+        self, source_map: SourceMap, fd: TextIO,
+        snippets: bool = True,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+    ) -> None:
+        self.source_map = source_map
+        self.fd = fd
+        self.snippets = snippets
+        self.chunk_size = chunk_size
+        self._buffer: list[str] = []
+        self._buffered = 0
+
+    # -Instance Methods
+    def render(
+        self, diagnostics: Iterable[Diagnostic],
+        level: Diagnostic.Level = Diagnostic.Level.Warn,
+    ) -> None:
+        '''Render every diagnostic at or above level; flush output when done.'''
+        selected = [d for d in diagnostics if d.level <= level]
+        selected.sort(key=lambda d: (d.location.id, d.location.start))
+        start = 0
+        while start < len(selected):
+            _id = selected[start].location.id
+            end = start + 1
+            while end < len(selected) and selected[end].location.id == _id:
+                end += 1
+            self._render_source(self.source_map[_id], selected[start:end])
+            start = end
+        self.flush()
+
+    def _render_source(
+        self, source: Source, diagnostics: Sequence[Diagnostic]
+    ) -> None:
+        '''Render diagnostics of one source ordered by offset; resolve rows by merging with line index.'''
+        path = str(source.path) if source.is_path else "<raw source>"
+        offsets = source.line_offsets
+        text = source.text if self.snippets and source.has_text else None
+        headers: dict[tuple[Diagnostic.Level, Diagnostic.Code], tuple[str, str, bool]] = {}
+        snippets: dict[tuple[int, int, int], str] = {}
+        line = 0
+        for diagnostic in diagnostics:
+            location = diagnostic.location
+            position = location.start
+            while line + 1 < len(offsets) and offsets[line + 1] <= position:
+                line += 1
+            column = position - offsets[line]
+            # -Header
+            key = (diagnostic.level, diagnostic.code)
+            if (header := headers.get(key)) is None:
+                header = headers[key] = (
+                    f"{_level_name(diagnostic.level)}[{diagnostic.name}]",
+                    diagnostic.message, diagnostic.is_formatted,
+                )
+            prefix, message, is_formatted = header
+            if is_formatted:
+                message = message.format(*diagnostic.args)
+            output = f"[{path}:{line + 1}:{column + 1}] {prefix}: {message}\n"
+            # -Snippet
+            if text is not None:
+                snippet_key = (line, column, location.end - position)
+                if (snippet := snippets.get(snippet_key)) is None:
+                    snippet = snippets[snippet_key] = self._format_snippet(
+                        text, offsets[line], line + 1, *snippet_key[1:]
+                    )
+                output += snippet
+            self._write(output)
+
+    def _format_snippet(
+        self, text: str, line_start: int, row: int, column: int, length: int
+    ) -> str:
+        '''Return source line with a caret underline beneath the reported columns.'''
+        line_end = text.find('\n', line_start)
+        line_text = text[line_start:line_end if line_end != -1 else len(text)]
+        gutter = str(row)
+        padding = ''.join(c if c == '\t' else ' ' for c in line_text[:column])
+        width = max(1, min(length, len(line_text) - column))
+        return (
+            f" {gutter} | {line_text}\n"
+            f" {' ' * len(gutter)} | {padding}{'^' * width}\n"
+        )
+
+    # -Instance Methods: Output
+    def _write(self, text: str) -> None:
+        '''Buffer text and write out once chunk size is reached.'''
+        self._buffer.append(text)
+        self._buffered += len(text)
+        if self._buffered >= self.chunk_size:
+            self.flush()
+
+    def flush(self) -> None:
+        '''Write out buffered text and flush underlying io.'''
+        if self._buffer:
+            self.fd.write(''.join(self._buffer))
+            self._buffer.clear()
+            self._buffered = 0
+        self.fd.flush()
+
+    # -Class Properties
+    __slots__ = (
+        "source_map",
+        "fd",
+        "snippets",
+        "chunk_size",
+        "_buffer",
+        "_buffered",
+    )
@@ -7,7 +7,9 @@
 
 ## Imports
 import bisect
-from typing import TYPE_CHECKING
+from threading import Lock
+from typing import TYPE_CHECKING, Any
+from ..core import Span
 
 if TYPE_CHECKING:
     from collections.abc import (
@@ -16,9 +18,13 @@ if TYPE_CHECKING:
         Sequence,
     )
     from pathlib import Path
-    from ..core import Span
     from ..frontend import Comment
 
+## Constants
+type PackedSpan = int
+PACKED_SPAN_BITS = 32
+PACKED_SPAN_MASK = (1 << PACKED_SPAN_BITS) - 1
+
 
 ## Classes
 class Source:
@@ -37,15 +43,19 @@ class Source:
     # -Instance Methods
     def get_text_iter(self) -> Iterator[str]:
         '''Return string iterator over source text; loading file if cached text is missing.'''
+        yield from self.load_text()
+
+    def load_text(self) -> str:
+        '''Return source text; loading file if cached text is missing.'''
         if self._text is None:
             with self.path.open('r') as f:
                 self._text = f.read()
-        yield from self._text
+        return self._text
 
     def resolve_location(self, position: int) -> tuple[int, int]:
         '''Return calculated (row, column) pair from given byte offset.'''
-        row = bisect.bisect_right(self.line_offsets, position)
-        column = (position - self.line_offsets[row - 1]) + 1
+        row = bisect.bisect_right(self._line_offsets, position)
+        column = (position - self._line_offsets[row - 1]) + 1
         return (row, column)
 
     # -Properties
@@ -55,6 +65,11 @@ class Source:
         assert self._text is not None
         return self._text
 
+    @property
+    def has_text(self) -> bool:
+        '''Return if source text is loaded.'''
+        return self._text is not None
+
     @property
     def is_path(self) -> bool:
         '''Return if source is file-based.'''
@@ -84,36 +99,123 @@ class Source:
 
 
 class SourceMap:
-    """Maps a collection of sources to unique ids."""
+    """
+    Maps a collection of sources to unique ids.
+
+    Each source is assigned a base offset within one global position space,
+    allowing any span to be packed into a single 64-bit integer of
+    (global start << 32 | length) and unpacked by binary search over the bases.
+    File-based sources reserve their range only once their text is loaded, so
+    registration never touches the file system; bases are therefore ascending in
+    reservation order rather than id order.
+    Registration and reservation are serialized so sources may be added from concurrent workers.
+    """
     # -Constructor
     def __init__(self) -> None:
         self._sources: MutableSequence[Source] = []
+        self._bases: MutableSequence[int | None] = []
+        self._reserved_bases: MutableSequence[int] = []
+        self._reserved_ids: MutableSequence[int] = []
+        self._next_base = 0
+        self._lock = Lock()
 
     # -Dunder Methods
     def __getitem__(self, index: int) -> Source:
         return self._sources[index]
 
+    def __getstate__(self) -> dict[str, Any]:
+        return {
+            "_sources": self._sources,
+            "_bases": self._bases,
+            "_reserved_bases": self._reserved_bases,
+            "_reserved_ids": self._reserved_ids,
+            "_next_base": self._next_base,
+        }
+
+    def __setstate__(self, state: dict[str, Any]) -> None:
+        self._sources = state["_sources"]
+        self._bases = state["_bases"]
+        self._reserved_bases = state["_reserved_bases"]
+        self._reserved_ids = state["_reserved_ids"]
+        self._next_base = state["_next_base"]
+        self._lock = Lock()
+
     # -Instance Methods
     def add_str(self, source: str) -> int:
         '''Register string source to map and return assigned id.'''
-        _id = self.next_id
-        self._sources.append(Source(source, None))
+        with self._lock:
+            _id = self._add(Source(source, None))
+            self._reserve(_id, len(source))
         return _id
 
     def add_file(self, source: Path) -> int:
-        '''Register file-based source to map and return assigned id.'''
-        _id = self.next_id
-        self._sources.append(Source(None, source))
-        return _id
+        '''Register file-based source to map and return assigned id; text and offsets are deferred until first use.'''
+        with self._lock:
+            return self._add(Source(None, source))
 
     def get_text_span(self, span: Span) -> str:
         '''Return text string from given span.'''
         return self._sources[span.id].text[span.start:span.end]
 
+    # -Instance Methods: Global Offsets
+    def base_of(self, _id: int) -> int:
+        '''Return the global base offset assigned to a source id; loading and reserving it on first use.'''
+        base = self._bases[_id]
+        if base is None:
+            text = self._sources[_id].load_text()
+            with self._lock:
+                base = self._bases[_id]
+                if base is None:
+                    base = self._reserve(_id, len(text))
+        return base
+
+    def lookup_id(self, position: int) -> int:
+        '''Return the source id owning a global position.'''
+        assert 0 <= position < self._next_base, f"Global position {position} is out of range."
+        return self._reserved_ids[bisect.bisect_right(self._reserved_bases, position) - 1]
+
+    def pack(self, span: Span) -> PackedSpan:
+        '''Pack span into a single integer of (global start << 32 | length).'''
+        position = self.base_of(span.id) + span.start
+        length = span.end - span.start
+        assert position <= PACKED_SPAN_MASK and 0 <= length <= PACKED_SPAN_MASK
+        return (position << PACKED_SPAN_BITS) | length
+
+    def unpack(self, packed: PackedSpan) -> Span:
+        '''Unpack a packed integer back into a source-relative span.'''
+        position = packed >> PACKED_SPAN_BITS
+        _id = self.lookup_id(position)
+        start = position - self.base_of(_id)
+        return Span(_id, start, start + (packed & PACKED_SPAN_MASK))
+
+    # -Instance Methods: Helpers
+    def _add(self, source: Source) -> int:
+        '''Append source without a base; return assigned id. Caller holds the lock.'''
+        _id = self.next_id
+        self._sources.append(source)
+        self._bases.append(None)
+        return _id
+
+    def _reserve(self, _id: int, length: int) -> int:
+        '''Reserve the global offset range of a source from its loaded length; return its base. Caller holds the lock.'''
+        base = self._bases[_id] = self._next_base
+        self._reserved_bases.append(base)
+        self._reserved_ids.append(_id)
+        # -Reserve one past the end so end-of-source point spans stay in range
+        self._next_base += length + 1
+        return base
+
     # -Properties
     @property
     def next_id(self) -> int:
         return len(self._sources)
 
     # -Class Properties
-    __slots__ = ("_sources",)
+    __slots__ = (
+        "_sources",
+        "_bases",
+        "_reserved_bases",
+        "_reserved_ids",
+        "_next_base",
+        "_lock",
+    )
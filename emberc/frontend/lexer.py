@@ -79,7 +79,7 @@ class Lexer(LookaheadBuffer[str, str]):
     # -Instance Methods: Lexing
     def get_token_iter(self) -> Iterator[Token]:
         '''Return a token iterator from source stream until exhausted.'''
-        while not self.is_at_end:
+        while not self.is_at_end and not self.engine.is_aborted:
             token = self._lex()
             if token:
                 yield token
@@ -104,6 +104,8 @@ class Lexer(LookaheadBuffer[str, str]):
             self.engine.error(
                 Diagnostic.Code.E1001, Span.point(self.id, self.byte_offset), c
             )
+            if self.engine.is_aborted:
+                break
         return None
 
     def _lex_symbol(self, symbol: str) -> Token | None:
@@ -180,7 +180,7 @@ class Parser(LookaheadBuffer[Token, Token.Kind]):
         '''
         nodes: list[UnresolvedNode] = []
         _first_token = self.peek()
-        while not self.is_at_end:
+        while not self.is_at_end and not self.engine.is_aborted:
             try:
                 node = self._parse_declaration()
                 nodes.append(node)
@@ -269,7 +269,10 @@ class Parser(LookaheadBuffer[Token, Token.Kind]):
         assert self.consume(Token.Kind.SymbolLBrace)
         start = self.last_token
         nodes: list[UnresolvedNode] = []
-        while not self.matches(Token.Kind.SymbolRBrace) and not self.is_at_end:
+        while (
+            not self.matches(Token.Kind.SymbolRBrace) and
+            not self.is_at_end and not self.engine.is_aborted
+        ):
             try:
                 node = self._parse_declaration_statement()
                 nodes.append(node)
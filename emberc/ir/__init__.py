@@ -7,8 +7,12 @@
 
 ## Imports
 from .tac import (
+    CFG,
     TACUnit,
     TACVisitor,
+    TACBasicBlock,
+    PackedTACUnit,
+    TACOpcode,
     TACAddress,
     TACOperand,
     TACLiteral,
@@ -18,14 +22,23 @@ from .tac import (
     TACAssign,
     TACBinary,
     TACDeclare,
+    TACLabel,
+    TACJump,
+    TACBranch,
+    TACPhi,
 )
 
 
 ## Constants
 __all__ = (
     # -3AC
+    "CFG",
     "TACUnit",
     "TACVisitor",
+    "TACBasicBlock",
+    # -3AC: Packed
+    "PackedTACUnit",
+    "TACOpcode",
     # -3AC: Operand
     "TACAddress",
     "TACOperand",
@@ -37,4 +50,8 @@ __all__ = (
     "TACAssign",
     "TACBinary",
     "TACDeclare",
+    "TACLabel",
+    "TACJump",
+    "TACBranch",
+    "TACPhi",
 )
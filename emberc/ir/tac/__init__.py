@@ -10,11 +10,16 @@ from abc import ABC, abstractmethod
 from typing import TYPE_CHECKING, assert_never
 from dataclasses import dataclass
 
+from .cfg import CFG, TACBasicBlock
 from .instruction import (
     TACInstruction,
     TACAssign,
     TACBinary,
     TACDeclare,
+    TACLabel,
+    TACJump,
+    TACBranch,
+    TACPhi,
 )
 from .operand import (
     TACAddress,
@@ -23,14 +28,20 @@ from .operand import (
     TACTemporary,
     TACVariable,
 )
+from .packed import PackedTACUnit, TACOpcode
 
 if TYPE_CHECKING:
     from collections.abc import Iterator, MutableSequence
 
 ## Constants
 __all__ = (
+    "CFG",
     "TACUnit",
     "TACVisitor",
+    "TACBasicBlock",
+    # -Packed
+    "PackedTACUnit",
+    "TACOpcode",
     # -Operand
     "TACAddress",
     "TACOperand",
@@ -42,6 +53,10 @@ __all__ = (
     "TACAssign",
     "TACBinary",
     "TACDeclare",
+    "TACLabel",
+    "TACJump",
+    "TACBranch",
+    "TACPhi",
 )
 
 
@@ -68,6 +83,14 @@ class TACVisitor[TReturn](ABC):
                 return self.visit_binary(tac)
             case TACDeclare():
                 return self.visit_declare(tac)
+            case TACLabel():
+                return self.visit_label(tac)
+            case TACJump():
+                return self.visit_jump(tac)
+            case TACBranch():
+                return self.visit_branch(tac)
+            case TACPhi():
+                return self.visit_phi(tac)
             case _:
                 assert_never(tac)
 
@@ -80,5 +103,17 @@ class TACVisitor[TReturn](ABC):
     @abstractmethod
     def visit_declare(self, tac: TACDeclare) -> TReturn: ...
 
+    @abstractmethod
+    def visit_label(self, tac: TACLabel) -> TReturn: ...
+
+    @abstractmethod
+    def visit_jump(self, tac: TACJump) -> TReturn: ...
+
+    @abstractmethod
+    def visit_branch(self, tac: TACBranch) -> TReturn: ...
+
+    @abstractmethod
+    def visit_phi(self, tac: TACPhi) -> TReturn: ...
+
     # -Class Properties
     __slots__ = ()
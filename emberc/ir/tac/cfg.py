@@ -0,0 +1,184 @@
+##-------------------------------##
+## Ember Compiler                ##
+## Written By: Ryan Smith        ##
+##-------------------------------##
+## TAC: Control Flow Graph       ##
+##-------------------------------##
+
+## Imports
+from array import array
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING
+from .instruction import (
+    TACLabel,
+    TACJump,
+    TACBranch,
+)
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable, Iterator
+    from .instruction import TACInstruction
+
+## Constants
+UNREACHABLE = -1
+
+
+## Classes
+@dataclass(slots=True)
+class TACBasicBlock:
+    """
+    TAC Basic Block
+
+    A maximal straight-line run of instructions; entered only at its first
+    instruction and left only after its last.
+    """
+    # -Dunder Methods
+    def __iter__(self) -> Iterator[TACInstruction]:
+        yield from self.instructions
+
+    def __len__(self) -> int:
+        return len(self.instructions)
+
+    # -Properties
+    id: int
+    instructions: list[TACInstruction] = field(default_factory=list)
+
+    @property
+    def label(self) -> int | None:
+        '''Return label id starting block or None if block is only reached by fallthrough.'''
+        if self.instructions and isinstance(self.instructions[0], TACLabel):
+            return self.instructions[0].id
+        return None
+
+    @property
+    def terminator(self) -> TACJump | TACBranch | None:
+        '''Return jump or branch ending block or None if block falls through.'''
+        if self.instructions and isinstance(self.instructions[-1], (TACJump, TACBranch)):
+            return self.instructions[-1]
+        return None
+
+
+class CFG:
+    """
+    TAC Control Flow Graph
+
+    Partitions a linear instruction stream into basic blocks at labels and after jumps,
+    with successor and predecessor lists indexed by block id. Blocks keep their source order;
+    `rpo` holds reachable block ids in reverse postorder from the entry block (0)
+    and `rpo_number` maps each block id back to its position, or -1 if unreachable.
+    """
+    # -Constructor
+    def __init__(self, blocks: list[TACBasicBlock]) -> None:
+        self.blocks = blocks
+        self.successors: list[list[int]] = []
+        self.predecessors: list[list[int]] = []
+        self.rpo: list[int] = []
+        self.rpo_number = array('i')
+        self._label_blocks: dict[int, int] = {}
+        self.rebuild()
+
+    # -Dunder Methods
+    def __getitem__(self, _id: int) -> TACBasicBlock:
+        return self.blocks[_id]
+
+    def __iter__(self) -> Iterator[TACBasicBlock]:
+        yield from self.blocks
+
+    def __len__(self) -> int:
+        return len(self.blocks)
+
+    # -Instance Methods
+    def rebuild(self) -> None:
+        '''Recompute edges and ordering after blocks or terminators change.'''
+        self._label_blocks = {
+            block.label: block.id for block in self.blocks if block.label is not None
+        }
+        self.successors = [[] for _ in self.blocks]
+        self.predecessors = [[] for _ in self.blocks]
+        for block in self.blocks:
+            successors = self.successors[block.id]
+            for target in self._targets_of(block):
+                if target in successors:
+                    continue
+                successors.append(target)
+                self.predecessors[target].append(block.id)
+        self._number()
+
+    def block_of(self, label: int) -> int:
+        '''Return id of block started by label.'''
+        return self._label_blocks[label]
+
+    def instructions(self) -> Iterator[TACInstruction]:
+        '''Yield every instruction in block order.'''
+        for block in self.blocks:
+            yield from block.instructions
+
+    def _targets_of(self, block: TACBasicBlock) -> Iterable[int]:
+        '''Return ids of blocks control may pass to after block.'''
+        match block.terminator:
+            case TACJump() as jump:
+                return (self._label_blocks[jump.target],)
+            case TACBranch() as branch:
+                return (
+                    self._label_blocks[branch.true_target],
+                    self._label_blocks[branch.false_target],
+                )
+            case None:
+                return (block.id + 1,) if block.id + 1 < len(self.blocks) else ()
+
+    def _number(self) -> None:
+        '''Compute reverse postorder from the entry block with an explicit stack.'''
+        order: list[int] = []
+        rpo_number = self.rpo_number = array('i', [UNREACHABLE] * len(self.blocks))
+        if self.blocks:
+            visited = bytearray(len(self.blocks))
+            visited[0] = 1
+            stack: list[tuple[int, int]] = [(0, 0)]
+            while stack:
+                _id, edge = stack[-1]
+                successors = self.successors[_id]
+                if edge < len(successors):
+                    stack[-1] = (_id, edge + 1)
+                    target = successors[edge]
+                    if not visited[target]:
+                        visited[target] = 1
+                        stack.append((target, 0))
+                    continue
+                stack.pop()
+                order.append(_id)
+        order.reverse()
+        for number, _id in enumerate(order):
+            rpo_number[_id] = number
+        self.rpo = order
+
+    # -Class Methods
+    @classmethod
+    def build(cls, instructions: Iterable[TACInstruction]) -> CFG:
+        '''Partition instructions into basic blocks; starting a block at each label and after each jump.'''
+        blocks: list[TACBasicBlock] = [TACBasicBlock(0)]
+        for instruction in instructions:
+            current = blocks[-1]
+            if isinstance(instruction, TACLabel) and current.instructions:
+                current = TACBasicBlock(len(blocks))
+                blocks.append(current)
+            current.instructions.append(instruction)
+            if isinstance(instruction, (TACJump, TACBranch)):
+                blocks.append(TACBasicBlock(len(blocks)))
+        if len(blocks) > 1 and not blocks[-1].instructions:
+            blocks.pop()
+        return cls(blocks)
+
+    # -Properties
+    @property
+    def entry(self) -> TACBasicBlock:
+        return self.blocks[0]
+
+    # -Class Properties
+    __slots__ = (
+        "blocks",
+        "successors",
+        "predecessors",
+        "rpo",
+        "rpo_number",
+        "_label_blocks",
+    )
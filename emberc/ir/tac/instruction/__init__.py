@@ -8,7 +8,13 @@
 ## Imports
 from .assign import TACAssign
 from .binary import TACBinary
+from .control import (
+    TACLabel,
+    TACJump,
+    TACBranch,
+)
 from .declare import TACDeclare
+from .phi import TACPhi
 
 
 ## Constants
@@ -17,5 +23,13 @@ __all__ = (
     "TACAssign",
     "TACBinary",
     "TACDeclare",
+    "TACLabel",
+    "TACJump",
+    "TACBranch",
+    "TACPhi",
+)
+type TACInstruction = (
+    TACAssign | TACBinary | TACDeclare |
+    TACLabel | TACJump | TACBranch |
+    TACPhi
 )
-type TACInstruction = TACAssign | TACBinary | TACDeclare
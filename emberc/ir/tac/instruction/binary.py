@@ -6,7 +6,7 @@
 ##-------------------------------##
 
 ## Imports
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from typing import TYPE_CHECKING
 
 if TYPE_CHECKING:
@@ -14,14 +14,18 @@ if TYPE_CHECKING:
         TACAddress,
         TACOperand,
     )
-    from ....ast import BinaryOperator
+    from ....ast import BinaryOperator, TypePrimitive
 
 
 ## Classes
 @dataclass(frozen=True, slots=True)
 class TACBinary:
-    """Represents a binary operation instruction."""
+    """
+    Represents a binary operation instruction.
+    Type is the checked operand type when known; selecting width-specific behavior.
+    """
     dest: TACAddress
     operator: BinaryOperator
     lhs: TACOperand
     rhs: TACOperand
+    type: TypePrimitive | None = field(default=None, kw_only=True)
@@ -0,0 +1,34 @@
+##-------------------------------##
+## Ember Compiler                ##
+## Written By: Ryan Smith        ##
+##-------------------------------##
+## TAC: Control                  ##
+##-------------------------------##
+
+## Imports
+from dataclasses import dataclass
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from ..operand import TACOperand
+
+
+## Classes
+@dataclass(frozen=True, slots=True)
+class TACLabel:
+    """Represents a jump target starting a basic block."""
+    id: int
+
+
+@dataclass(frozen=True, slots=True)
+class TACJump:
+    """Represents an unconditional jump to a label."""
+    target: int
+
+
+@dataclass(frozen=True, slots=True)
+class TACBranch:
+    """Represents a conditional jump; taking the true label when condition is non-zero."""
+    condition: TACOperand
+    true_target: int
+    false_target: int
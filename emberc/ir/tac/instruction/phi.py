@@ -0,0 +1,24 @@
+##-------------------------------##
+## Ember Compiler                ##
+## Written By: Ryan Smith        ##
+##-------------------------------##
+## TAC: Phi                      ##
+##-------------------------------##
+
+## Imports
+from dataclasses import dataclass
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from ..operand import (
+        TACOperand,
+        TACVariable,
+    )
+
+
+## Classes
+@dataclass(frozen=True, slots=True)
+class TACPhi:
+    """Represents an SSA merge; selecting the source paired with the predecessor block control came from."""
+    dest: TACVariable
+    sources: tuple[tuple[int, TACOperand], ...]
@@ -6,7 +6,7 @@
 ##-------------------------------##
 
 ## Imports
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 
 
 ## Classes
@@ -18,5 +18,9 @@ class TACTemporary:
 
 @dataclass(frozen=True, slots=True)
 class TACVariable:
-    """Represents a user-defined source code variable."""
+    """
+    Represents a user-defined source code variable.
+    Version distinguishes each definition once in SSA form; 0 is the declared value.
+    """
     id: int
+    version: int = field(default=0, kw_only=True)
@@ -0,0 +1,362 @@
+##-------------------------------##
+## Ember Compiler                ##
+## Written By: Ryan Smith        ##
+##-------------------------------##
+## TAC: Packed Encoding          ##
+##-------------------------------##
+
+## Imports
+from array import array
+from enum import IntEnum, auto
+from typing import TYPE_CHECKING, assert_never
+from .instruction import (
+    TACAssign,
+    TACBinary,
+    TACDeclare,
+    TACLabel,
+    TACJump,
+    TACBranch,
+    TACPhi,
+)
+from .operand import (
+    TACLiteral,
+    TACTemporary,
+    TACVariable,
+)
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable, Iterator
+    from . import TACUnit
+    from .instruction import TACInstruction
+    from .operand import TACAddress, TACOperand
+    from ...ast import BinaryOperator, TypePrimitive
+
+## Constants
+TAG_BITS = 2
+TAG_MASK = (1 << TAG_BITS) - 1
+TAG_LITERAL = 0
+TAG_TEMPORARY = 1
+TAG_VARIABLE = 2
+TAG_POOLED = 3
+PAYLOAD_LIMIT = 1 << (63 - TAG_BITS)
+VERSION_SHIFT = 32
+ID_MASK = (1 << VERSION_SHIFT) - 1
+VERSION_LIMIT = PAYLOAD_LIMIT >> VERSION_SHIFT
+INLINE_LITERAL_LIMIT = PAYLOAD_LIMIT >> 1
+TYPE_SHIFT = 8
+OPERATOR_MASK = (1 << TYPE_SHIFT) - 1
+DECODED_OPERATORS: dict[int, BinaryOperator] = {}
+DECODED_TYPES: dict[int, TypePrimitive | None] = {}
+type TACRow = tuple[int, int, int, int, int]
+
+
+## Functions
+def _load_decode_tables() -> None:
+    """Fill operator and canonical primitive type tables by packed value; importing the AST on first decode."""
+    from ...ast import BinaryOperator, TypePrimitive
+    DECODED_TYPES[0] = None
+    DECODED_TYPES.update((_type.kind, _type) for _type in (
+        TypePrimitive.boolean,
+        TypePrimitive.int8, TypePrimitive.int16, TypePrimitive.int32, TypePrimitive.int64,
+        TypePrimitive.uint8, TypePrimitive.uint16, TypePrimitive.uint32, TypePrimitive.uint64,
+    ))
+    DECODED_OPERATORS.update((operator.value, operator) for operator in BinaryOperator)
+
+
+## Classes
+class TACOpcode(IntEnum):
+    """Opcodes of packed TAC rows."""
+    Assign = auto()
+    Binary = auto()
+    Declare = auto()
+    Label = auto()
+    Jump = auto()
+    Branch = auto()
+    Phi = auto()
+
+
+class PackedTACUnit:
+    """
+    Packed TAC Unit
+
+    Stores instructions as parallel array columns (opcode, dest, lhs, rhs, aux)
+    at 29 bytes per instruction. Operands are encoded into one integer with a 2-bit tag:
+    inline literals, temporaries, variables (version << 32 | id) and literals too
+    wide to inline, which index a deduplicated literal pool.
+    Column use by opcode:
+        Assign:  dest, lhs=src
+        Binary:  dest, lhs, rhs, aux=operator | type kind << 8 (0 if untyped)
+        Declare: dest=variable id
+        Label:   dest=label id
+        Jump:    dest=target
+        Branch:  dest=true target, lhs=condition, rhs=false target
+        Phi:     dest, lhs=offset into `sources`, rhs=source count
+    Phi sources are stored as (block, operand) pairs in a separate column.
+    Operators and type kinds are stored by value, so the encoding does not depend on the AST
+    at import time; decoding maps them back through tables filled from the AST on first use,
+    reusing the canonical primitive types. Operand fields that overflow their bit range
+    are rejected, never aliased.
+    """
+    # -Constructor
+    def __init__(self) -> None:
+        self.opcodes = array('B')
+        self.dests = array('q')
+        self.lhs = array('q')
+        self.rhs = array('q')
+        self.aux = array('i')
+        self.sources = array('q')
+        self.literals: list[int] = []
+        self._literal_ids: dict[int, int] = {}
+
+    # -Dunder Methods
+    def __getitem__(self, index: int) -> TACInstruction:
+        return self.instruction(index)
+
+    def __iter__(self) -> Iterator[TACInstruction]:
+        for index in range(len(self.opcodes)):
+            yield self.instruction(index)
+
+    def __len__(self) -> int:
+        return len(self.opcodes)
+
+    # -Instance Methods: Builders
+    def emit(self, opcode: TACOpcode, dest: int = 0, lhs: int = 0, rhs: int = 0, aux: int = 0) -> int:
+        '''Append a raw row; returning its index.'''
+        self.opcodes.append(opcode)
+        self.dests.append(dest)
+        self.lhs.append(lhs)
+        self.rhs.append(rhs)
+        self.aux.append(aux)
+        return len(self.opcodes) - 1
+
+    def emit_assign(self, dest: int, src: int) -> int:
+        return self.emit(TACOpcode.Assign, dest, src)
+
+    def emit_binary(
+        self, dest: int, operator: BinaryOperator, lhs: int, rhs: int,
+        _type: TypePrimitive | None = None
+    ) -> int:
+        aux = operator | ((_type.kind << TYPE_SHIFT) if _type is not None else 0)
+        return self.emit(TACOpcode.Binary, dest, lhs, rhs, aux)
+
+    def emit_declare(self, _id: int) -> int:
+        return self.emit(TACOpcode.Declare, _id)
+
+    def emit_label(self, _id: int) -> int:
+        return self.emit(TACOpcode.Label, _id)
+
+    def emit_jump(self, target: int) -> int:
+        return self.emit(TACOpcode.Jump, target)
+
+    def emit_branch(self, condition: int, true_target: int, false_target: int) -> int:
+        return self.emit(TACOpcode.Branch, true_target, condition, false_target)
+
+    def emit_phi(self, dest: int, sources: Iterable[tuple[int, int]]) -> int:
+        offset = len(self.sources)
+        for block, source in sources:
+            self.sources.append(block)
+            self.sources.append(source)
+        return self.emit(TACOpcode.Phi, dest, offset, (len(self.sources) - offset) // 2)
+
+    def append(self, instruction: TACInstruction) -> int:
+        '''Encode and append an instruction; returning its index.'''
+        match instruction:
+            case TACAssign():
+                return self.emit_assign(self.encode(instruction.dest), self.encode(instruction.src))
+            case TACBinary():
+                return self.emit_binary(
+                    self.encode(instruction.dest), instruction.operator,
+                    self.encode(instruction.lhs), self.encode(instruction.rhs), instruction.type,
+                )
+            case TACDeclare():
+                return self.emit_declare(instruction.id)
+            case TACLabel():
+                return self.emit_label(instruction.id)
+            case TACJump():
+                return self.emit_jump(instruction.target)
+            case TACBranch():
+                return self.emit_branch(
+                    self.encode(instruction.condition),
+                    instruction.true_target, instruction.false_target,
+                )
+            case TACPhi():
+                return self.emit_phi(self.encode(instruction.dest), (
+                    (block, self.encode(source)) for block, source in instruction.sources
+                ))
+            case _:
+                assert_never(instruction)
+
+    def extend(self, instructions: Iterable[TACInstruction]) -> None:
+        for instruction in instructions:
+            self.append(instruction)
+
+    # -Instance Methods: Operands
+    def literal(self, value: int) -> int:
+        '''Return code of literal value; pooling it if too wide to inline.'''
+        if -INLINE_LITERAL_LIMIT <= value < INLINE_LITERAL_LIMIT:
+            return value << TAG_BITS | TAG_LITERAL
+        index = self._literal_ids.get(value)
+        if index is None:
+            index = self._literal_ids[value] = len(self.literals)
+            self.literals.append(value)
+        return index << TAG_BITS | TAG_POOLED
+
+    def literal_value(self, code: int) -> int:
+        '''Return value of a literal code.'''
+        if code & TAG_MASK == TAG_POOLED:
+            return self.literals[code >> TAG_BITS]
+        return code >> TAG_BITS
+
+    def encode(self, operand: TACOperand) -> int:
+        '''Return code of operand.'''
+        match operand:
+            case TACLiteral():
+                return self.literal(operand.value)
+            case TACTemporary():
+                return self.temporary(operand.index)
+            case TACVariable():
+                return self.variable(operand.id, operand.version)
+            case _:
+                assert_never(operand)
+
+    def decode(self, code: int) -> TACOperand:
+        '''Return operand of code.'''
+        payload, tag = code >> TAG_BITS, code & TAG_MASK
+        if tag == TAG_LITERAL:
+            return TACLiteral(payload)
+        elif tag == TAG_TEMPORARY:
+            return TACTemporary(payload)
+        elif tag == TAG_VARIABLE:
+            return TACVariable(payload & ID_MASK, version=payload >> VERSION_SHIFT)
+        return TACLiteral(self.literals[payload])
+
+    def decode_address(self, code: int) -> TACAddress:
+        '''Return temporary or variable of code; raising if code is a literal.'''
+        payload, tag = code >> TAG_BITS, code & TAG_MASK
+        if tag == TAG_TEMPORARY:
+            return TACTemporary(payload)
+        elif tag == TAG_VARIABLE:
+            return TACVariable(payload & ID_MASK, version=payload >> VERSION_SHIFT)
+        raise ValueError(f"Packed operand {code} is a literal, not an address")
+
+    # -Instance Methods: Iterators
+    def rows(self) -> Iterator[TACRow]:
+        '''Yield (opcode, dest, lhs, rhs, aux) of every instruction.'''
+        return zip(self.opcodes, self.dests, self.lhs, self.rhs, self.aux)
+
+    def phi_sources(self, index: int) -> Iterator[tuple[int, int]]:
+        '''Yield (block, operand code) pairs of phi at index.'''
+        offset, count = self.lhs[index], self.rhs[index]
+        sources = self.sources
+        for at in range(offset, offset + 2 * count, 2):
+            yield sources[at], sources[at + 1]
+
+    def instruction(self, index: int) -> TACInstruction:
+        '''Decode instruction at index.'''
+        dest, lhs, rhs = self.dests[index], self.lhs[index], self.rhs[index]
+        match self.opcodes[index]:
+            case TACOpcode.Assign:
+                return TACAssign(self.decode_address(dest), self.decode(lhs))
+            case TACOpcode.Binary:
+                aux = self.aux[index]
+                return TACBinary(
+                    self.decode_address(dest), self.decode_operator(aux),
+                    self.decode(lhs), self.decode(rhs), type=self.decode_type(aux),
+                )
+            case TACOpcode.Declare:
+                return TACDeclare(dest)
+            case TACOpcode.Label:
+                return TACLabel(dest)
+            case TACOpcode.Jump:
+                return TACJump(dest)
+            case TACOpcode.Branch:
+                return TACBranch(self.decode(lhs), dest, rhs)
+            case TACOpcode.Phi:
+                return TACPhi(self.decode_address(dest), tuple(
+                    (block, self.decode(source)) for block, source in self.phi_sources(index)
+                ))
+            case opcode:
+                raise ValueError(f"Unknown packed TAC opcode: {opcode}")
+
+    def unpack(self) -> TACUnit:
+        '''Return a TAC unit of decoded instructions.'''
+        from . import TACUnit
+        return TACUnit(list(self))
+
+    # -Static Methods
+    @staticmethod
+    def temporary(index: int) -> int:
+        '''Return code of temporary; raising if index does not fit its payload.'''
+        if not 0 <= index < PAYLOAD_LIMIT:
+            raise ValueError(f"Temporary index {index} does not fit a packed operand")
+        return index << TAG_BITS | TAG_TEMPORARY
+
+    @staticmethod
+    def variable(_id: int, version: int = 0) -> int:
+        '''Return code of variable; raising if id or version overflows its bit field.'''
+        if not 0 <= _id <= ID_MASK:
+            raise ValueError(f"Variable id {_id} does not fit {VERSION_SHIFT} bits")
+        if not 0 <= version < VERSION_LIMIT:
+            raise ValueError(f"Variable version {version} does not fit a packed operand")
+        return (version << VERSION_SHIFT | _id) << TAG_BITS | TAG_VARIABLE
+
+    @staticmethod
+    def tag_of(code: int) -> int:
+        return code & TAG_MASK
+
+    @staticmethod
+    def is_temporary(code: int) -> bool:
+        return code & TAG_MASK == TAG_TEMPORARY
+
+    @staticmethod
+    def is_literal(code: int) -> bool:
+        '''Return if code is an inline or pooled literal.'''
+        return code & TAG_MASK in (TAG_LITERAL, TAG_POOLED)
+
+    @staticmethod
+    def operator_of(aux: int) -> int:
+        '''Return operator value of a binary's aux field.'''
+        return aux & OPERATOR_MASK
+
+    @staticmethod
+    def decode_operator(aux: int) -> BinaryOperator:
+        '''Return operator of a binary's aux field.'''
+        if not DECODED_OPERATORS:
+            _load_decode_tables()
+        return DECODED_OPERATORS[aux & OPERATOR_MASK]
+
+    @staticmethod
+    def decode_type(aux: int) -> TypePrimitive | None:
+        '''Return canonical checked type of a binary's aux field or None if untyped.'''
+        if not DECODED_OPERATORS:
+            _load_decode_tables()
+        return DECODED_TYPES[aux >> TYPE_SHIFT]
+
+    # -Class Methods
+    @classmethod
+    def pack(cls, instructions: Iterable[TACInstruction]) -> PackedTACUnit:
+        '''Encode instructions into a new packed unit.'''
+        unit = cls()
+        unit.extend(instructions)
+        return unit
+
+    # -Properties
+    @property
+    def nbytes(self) -> int:
+        '''Return bytes held by columns and literal pool entries.'''
+        return sum(
+            column.itemsize * len(column)
+            for column in (self.opcodes, self.dests, self.lhs, self.rhs, self.aux, self.sources)
+        ) + 8 * len(self.literals)
+
+    # -Class Properties
+    __slots__ = (
+        "opcodes",
+        "dests",
+        "lhs",
+        "rhs",
+        "aux",
+        "sources",
+        "literals",
+        "_literal_ids",
+    )
@@ -6,12 +6,29 @@
 ##-------------------------------##
 
 ## Imports
-from .name_binding import resolve_name_binding
-from .symbol_table import Symbol, SymbolTable
+from .name_binding import IncrementalNameBinder, resolve_name_binding
+from .span_indexer import build_span_index, reindex_span_subtree
+from .symbol_table import Symbol, SymbolStore, SymbolTable
+from .type_checking import (
+    MissingOperatorResult,
+    TypeCheckError,
+    TypeMismatch,
+    resolve_types,
+)
+from .type_table import TypeTable
 
 ## Constants
 __all__ = (
+    "IncrementalNameBinder",
+    "MissingOperatorResult",
     "Symbol",
+    "SymbolStore",
     "SymbolTable",
+    "TypeCheckError",
+    "TypeMismatch",
+    "TypeTable",
+    "build_span_index",
+    "reindex_span_subtree",
     "resolve_name_binding",
+    "resolve_types",
 )
@@ -7,7 +7,9 @@
 
 ## Imports
 from typing import TYPE_CHECKING
+from .incremental import IncrementalNameBinder
 from .local_binder import LocalNameBinder
+from .reference_index import ReferenceIndex
 from .type_factory import TypeFactory
 from ..symbol_table import Symbol, SymbolTable
 
@@ -18,7 +20,9 @@ if TYPE_CHECKING:
 
 ## Constants
 __all__ = (
+    "IncrementalNameBinder",
     "LocalNameBinder",
+    "ReferenceIndex",
     "TypeFactory",
     "resolve_name_binding",
 )
@@ -27,13 +31,15 @@ __all__ = (
 ## Functions
 def resolve_name_binding(
     unit: UnresolvedNode, engine: DiagnosticEngine,
+    references: ReferenceIndex | None = None,
 ) -> Sequence[Symbol]:
     """
     Name Binding Pass [Group]
 
     Traverses over an unresolved AST to bind identifiers to the symbol table.
-    Additionally provides type information into the symbol meta-data.
+    Additionally provides type information into the symbol meta-data,
+    and records def-use sites when given a reference index.
     """
     symbol_table = SymbolTable()
-    LocalNameBinder.run(unit, symbol_table, engine)
+    LocalNameBinder.run(unit, symbol_table, engine, references)
     return symbol_table.symbols
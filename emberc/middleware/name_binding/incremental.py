@@ -0,0 +1,188 @@
+##-------------------------------##
+## Ember Compiler                ##
+## Written By: Ryan Smith        ##
+##-------------------------------##
+## Name Binding: Incremental     ##
+##-------------------------------##
+
+## Imports
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING
+from .local_binder import LocalNameBinder
+from ..symbol_table import SymbolTable
+
+if TYPE_CHECKING:
+    from collections.abc import Sequence
+    from ..symbol_table import Symbol, SymbolStore
+    from ...ast import TypeNode, UnresolvedNode, UnresolvedSequenceNode
+    from ...diagnostics import Diagnostic, DiagnosticEngine
+
+
+## Classes
+class _TrackedSymbolTable(SymbolTable):
+    """
+    Symbol table recording every lookup that resolved outside of the node being bound.
+
+    Symbol ids released by replaced nodes are recycled: a root declaration reclaims the
+    retired id of the same name, and any other new symbol takes an id from the free list
+    before the store grows.
+    """
+    # -Constructor
+    def __init__(self) -> None:
+        super().__init__()
+        self.owned: list[int] = []
+        self.lookups: dict[str, int | None] = {}
+        self._owned_ids: set[int] = set()
+        self._retired: dict[str, int] = {}
+        self._free: list[int] = []
+
+    # -Instance Methods
+    def add_symbol(
+        self, name: str, kind: Symbol.Kind, _type: TypeNode
+    ) -> int | None:
+        if self.find_id_local(name) is not None:
+            return None
+        _id = self._retired.pop(name, None) if self.scope_depth == 0 else None
+        if _id is None and self._free:
+            _id = self._free.pop()
+        if _id is None:
+            _id = super().add_symbol(name, kind, _type)
+            assert _id is not None
+        else:
+            self._symbols.replace(_id, name, kind, _type)
+            self._depths[_id] = self.scope_depth
+            self.bind(name, _id)
+        self.owned.append(_id)
+        self._owned_ids.add(_id)
+        return _id
+
+    def find_id(self, name: str) -> int | None:
+        _id = super().find_id(name)
+        if _id is None or _id not in self._owned_ids:
+            self.lookups[name] = _id
+        return _id
+
+    def track(self) -> tuple[dict[str, int | None], list[int]]:
+        '''Begin tracking a new node; symbols created from here on are owned by it.'''
+        self.lookups = {}
+        self.owned = []
+        self._owned_ids = set()
+        return (self.lookups, self.owned)
+
+    def retire(self, declared: Sequence[tuple[str, int]], owned: Sequence[int]) -> None:
+        '''Release ids of a replaced node; keeping its root ids reclaimable by name.'''
+        root_ids = set()
+        for name, _id in declared:
+            self._retired[name] = _id
+            root_ids.add(_id)
+        self._free.extend(_id for _id in owned if _id not in root_ids)
+
+    def release(self) -> None:
+        '''Free every retired root id that was not reclaimed.'''
+        self._free.extend(self._retired.values())
+        self._retired.clear()
+
+    def declared_since(self, mark: int) -> list[tuple[str, int]]:
+        '''Return names and ids bound into the root scope after mark.'''
+        return [(name, self._bindings[name][-1]) for name in self._scopes[0][mark:]]
+
+    def matches(self, lookups: dict[str, int | None]) -> bool:
+        '''Return if every recorded lookup resolves the same in the current state.'''
+        find_id = super().find_id
+        return all(find_id(name) == _id for name, _id in lookups.items())
+
+    # -Properties
+    @property
+    def root_mark(self) -> int:
+        '''Return count of names bound into the root scope.'''
+        return len(self._scopes[0])
+
+    @property
+    def free_count(self) -> int:
+        '''Return count of released ids awaiting reuse.'''
+        return len(self._free) + len(self._retired)
+
+    # -Class Properties
+    __slots__ = ("owned", "lookups", "_owned_ids", "_retired", "_free")
+
+
+@dataclass(slots=True)
+class _BindingRecord:
+    """Outcome of binding a single top-level node."""
+    # -Properties
+    node: UnresolvedNode
+    lookups: dict[str, int | None]
+    owned: list[int]
+    declared: list[tuple[str, int]] = field(default_factory=list)
+    diagnostics: Sequence[Diagnostic] = ()
+
+
+class IncrementalNameBinder:
+    """
+    Incremental Name Binding Pass [Order=0]
+
+    Binds a unit one top-level node at a time, recording for each node the names it
+    declared in the root scope, every name it resolved from outside itself, and its diagnostics.
+    On rebind an unchanged node (same object) whose outside lookups still resolve identically
+    is reused: its root symbols are re-bound under their old ids and its diagnostics replayed.
+    An edited declaration keeps the id of its old root symbol of the same name (root names
+    cannot be redeclared, so the name identifies it), leaving nodes that refer to it reusable;
+    only edited nodes and nodes whose outside names now resolve differently are walked again.
+    Ids of replaced symbols are recycled, so the store stays bounded by the live symbol count.
+    """
+    # -Constructor
+    def __init__(self) -> None:
+        self._symbol_table = _TrackedSymbolTable()
+        self._records: dict[int, _BindingRecord] = {}
+        self.rebound = 0
+        self.reused = 0
+
+    # -Instance Methods
+    def rebind(
+        self, unit: UnresolvedSequenceNode, engine: DiagnosticEngine
+    ) -> SymbolStore:
+        '''Bind unit reusing unaffected top-level nodes; report current diagnostics to engine.'''
+        table = self._symbol_table
+        table.unwind()
+        nodes = {id(node): node for node in unit}
+        for key, record in self._records.items():
+            if nodes.get(key) is not record.node:
+                table.retire(record.declared, record.owned)
+        records: dict[int, _BindingRecord] = {}
+        self.rebound = self.reused = 0
+        for node in unit:
+            record = self._records.get(id(node))
+            if record is not None and record.node is node:
+                if table.matches(record.lookups):
+                    for name, _id in record.declared:
+                        table.bind(name, _id)
+                    self.reused += 1
+                    records[id(node)] = record
+                    continue
+                table.retire(record.declared, record.owned)
+            records[id(node)] = self._bind(node, engine)
+            self.rebound += 1
+        table.release()
+        self._records = records
+        engine.merge(*(record.diagnostics for record in records.values()))
+        return table.symbols
+
+    def _bind(self, node: UnresolvedNode, engine: DiagnosticEngine) -> _BindingRecord:
+        '''Bind node into a worker engine; recording outside lookups, owned ids and root declarations.'''
+        table = self._symbol_table
+        record = _BindingRecord(node, *table.track())
+        mark = table.root_mark
+        worker = engine.fork()
+        LocalNameBinder.run(node, table, worker)
+        record.declared = table.declared_since(mark)
+        record.diagnostics = worker.diagnostics
+        return record
+
+    # -Properties
+    @property
+    def free_count(self) -> int:
+        '''Return count of symbol ids released by replaced nodes and not yet reused.'''
+        return self._symbol_table.free_count
+
+    # -Class Properties
+    __slots__ = ("_symbol_table", "_records", "rebound", "reused")
@@ -9,6 +9,7 @@
 from typing import TYPE_CHECKING
 from .type_factory import TypeFactory
 from ...ast import (
+    AssignOperator,
     UnresolvedNode,
     UnresolvedLiteralRouterMixin,
     UnresolvedSequenceRouterMixin,
@@ -16,6 +17,7 @@ from ...ast import (
 from ...diagnostics import Diagnostic
 
 if TYPE_CHECKING:
+    from .reference_index import ReferenceIndex
     from ..symbol_table import SymbolTable
     from ...ast import (
         UnresolvedTypeNode,
@@ -45,15 +47,21 @@ class LocalNameBinder(
     Walks the entire AST tree to bind every internal identifier to a symbol.
     Creates and pops necessary scoping to allow variable shadowing while flagging
     redeclarations as well as use before declared names.
+    Optionally records declaration, read, and write sites into a reference index;
+    the l-value of a compound assignment is recorded as both a read and a write.
     """
     # -Constructor
     def __init__(
         self, symbol_table: SymbolTable,
         engine: DiagnosticEngine,
+        references: ReferenceIndex | None = None,
     ) -> None:
         self._engine = engine
         self._symbol_table = symbol_table
         self._type_factory = TypeFactory()
+        self._references = references
+        self._is_write = False
+        self._is_compound = False
 
     # -Instance Methods
     # --Types--
@@ -67,9 +75,13 @@ class LocalNameBinder(
             if entry.has_initializer:
                 entry.initializer.accept(self)
             entry._id = self._symbol_table.add_variable(entry.name, _type)
-            if entry.has_id:
+            if not entry.has_id:
+                self._engine.error(Diagnostic.Code.E3001, entry.location, entry.name)
                 continue
-            self._engine.error(Diagnostic.Code.E3001, entry.location, entry.name)
+            if self._references is not None:
+                self._references.declare(entry.id, entry.location)
+                if entry.has_initializer:
+                    self._references.add_write(entry.id, entry.location)
 
     # --Statements--
     def visit_block(self, node: UnresolvedBlockNode) -> None:
@@ -91,10 +103,14 @@ class LocalNameBinder(
         node.inner.accept(self)
 
     def visit_assignment(self, node: UnresolvedAssignNode) -> None:
+        self._is_write = True
+        self._is_compound = node.operator is not AssignOperator.Eq
         node.l_value.accept(self)
+        self._is_write = self._is_compound = False
         node.r_value.accept(self)
 
     def visit_binary(self, node: UnresolvedBinaryNode) -> None:
+        self._is_write = self._is_compound = False
         node.lhs.accept(self)
         node.rhs.accept(self)
 
@@ -102,14 +118,24 @@ class LocalNameBinder(
         node.operand.accept(self)
 
     def visit_identifier(self, node: UnresolvedIdentifierNode) -> None:
+        is_write, self._is_write = self._is_write, False
+        is_compound, self._is_compound = self._is_compound, False
         node._id = self._symbol_table.find_id(node.name)
-        if node.has_id:
+        if not node.has_id:
+            self._engine.error(Diagnostic.Code.E3002, node.location, node.name)
             return
-        self._engine.error(Diagnostic.Code.E3002, node.location, node.name)
+        if self._references is None:
+            return
+        if not is_write or is_compound:
+            self._references.add_read(node.id, node.location)
+        if is_write:
+            self._references.add_write(node.id, node.location)
 
     # --Extensions--
     def visit_sequence(self, node: UnresolvedSequenceNode) -> None:
         for _node in node:
+            if self._engine.is_aborted:
+                return
             _node.accept(self)
 
     def visit_literal(self, node: UnresolvedLiteralNode) -> None:
@@ -121,8 +147,9 @@ class LocalNameBinder(
         node: UnresolvedNode,
         symbol_table: SymbolTable,
         engine: DiagnosticEngine,
+        references: ReferenceIndex | None = None,
     ) -> None:
-        binder = LocalNameBinder(symbol_table, engine)
+        binder = LocalNameBinder(symbol_table, engine, references)
         node.accept(binder)
 
     # -Class Properties
@@ -130,4 +157,7 @@ class LocalNameBinder(
         "_engine",
         "_symbol_table",
         "_type_factory",
+        "_references",
+        "_is_write",
+        "_is_compound",
     )
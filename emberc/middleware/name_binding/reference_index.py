@@ -0,0 +1,118 @@
+##-------------------------------##
+## Ember Compiler                ##
+## Written By: Ryan Smith        ##
+##-------------------------------##
+## Name Binding: Reference Index ##
+##-------------------------------##
+
+## Imports
+from array import array
+from typing import TYPE_CHECKING
+from ...core import Span
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+
+## Constants
+NO_OFFSET = -1
+
+
+## Functions
+def _spans_from(_id: int, offsets: array[int]) -> list[Span]:
+    """Unpack flat (start, end) offset pairs into spans."""
+    return [Span(_id, offsets[i], offsets[i + 1]) for i in range(0, len(offsets), 2)]
+
+
+## Classes
+class ReferenceIndex:
+    """
+    Def-Use Reference Index
+
+    Records each symbol's declaration span along with every read and write site,
+    stored per symbol as flat arrays of (start, end) offset pairs within one source.
+    Queryable for find-references, unused variables, and dead stores without another tree walk.
+    """
+    # -Constructor
+    def __init__(self, source_id: int) -> None:
+        self.source_id = source_id
+        self._declarations = array('q')
+        self._reads: list[array[int]] = []
+        self._writes: list[array[int]] = []
+
+    # -Dunder Methods
+    def __len__(self) -> int:
+        return len(self._reads)
+
+    # -Instance Methods: Recording
+    def declare(self, _id: int, span: Span) -> None:
+        '''Record declaration span of symbol.'''
+        self._ensure(_id)
+        self._declarations[2 * _id] = span.start
+        self._declarations[2 * _id + 1] = span.end
+
+    def add_read(self, _id: int, span: Span) -> None:
+        '''Record a read site of symbol.'''
+        self._ensure(_id)
+        offsets = self._reads[_id]
+        offsets.append(span.start)
+        offsets.append(span.end)
+
+    def add_write(self, _id: int, span: Span) -> None:
+        '''Record a write site of symbol.'''
+        self._ensure(_id)
+        offsets = self._writes[_id]
+        offsets.append(span.start)
+        offsets.append(span.end)
+
+    # -Instance Methods: Queries
+    def has_declaration(self, _id: int) -> bool:
+        '''Return if symbol has a recorded declaration.'''
+        return _id < len(self) and self._declarations[2 * _id] != NO_OFFSET
+
+    def declaration(self, _id: int) -> Span:
+        '''Return declaration span of symbol; assert declaration exists.'''
+        assert self.has_declaration(_id), f"Symbol [{_id}] has no declaration."
+        start, end = self._declarations[2 * _id], self._declarations[2 * _id + 1]
+        return Span(self.source_id, start, end)
+
+    def reads(self, _id: int) -> list[Span]:
+        '''Return read sites of symbol in source order.'''
+        return _spans_from(self.source_id, self._reads[_id]) if _id < len(self) else []
+
+    def writes(self, _id: int) -> list[Span]:
+        '''Return write sites of symbol in source order.'''
+        return _spans_from(self.source_id, self._writes[_id]) if _id < len(self) else []
+
+    def references(self, _id: int) -> list[Span]:
+        '''Return declaration, read, and write sites of symbol ordered by offset.'''
+        spans = self.reads(_id) + self.writes(_id)
+        if self.has_declaration(_id):
+            spans.append(self.declaration(_id))
+        spans.sort(key=lambda span: (span.start, span.end))
+        return spans
+
+    def read_count(self, _id: int) -> int:
+        '''Return number of read sites of symbol.'''
+        return len(self._reads[_id]) // 2 if _id < len(self) else 0
+
+    def write_count(self, _id: int) -> int:
+        '''Return number of write sites of symbol.'''
+        return len(self._writes[_id]) // 2 if _id < len(self) else 0
+
+    def unused(self) -> Iterator[int]:
+        '''Yield declared symbol ids that are never read; every write to them is a dead store.'''
+        for _id in range(len(self)):
+            if self.has_declaration(_id) and not self._reads[_id]:
+                yield _id
+
+    # -Instance Methods: Helpers
+    def _ensure(self, _id: int) -> None:
+        '''Grow per-symbol storage to include id.'''
+        while len(self._reads) <= _id:
+            self._declarations.append(NO_OFFSET)
+            self._declarations.append(NO_OFFSET)
+            self._reads.append(array('q'))
+            self._writes.append(array('q'))
+
+    # -Class Properties
+    __slots__ = ("source_id", "_declarations", "_reads", "_writes")
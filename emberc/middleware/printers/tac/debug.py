@@ -23,6 +23,10 @@ if TYPE_CHECKING:
         TACAssign,
         TACBinary,
         TACDeclare,
+        TACLabel,
+        TACJump,
+        TACBranch,
+        TACPhi,
         TACOperand,
     )
 
@@ -54,6 +58,23 @@ class TACDebugPrinter(TACVisitor[str]):
     def visit_declare(self, tac: TACDeclare) -> str:
         return f"declare {self.get_symbol(tac.id)};"
 
+    def visit_label(self, tac: TACLabel) -> str:
+        return f"L{tac.id}:"
+
+    def visit_jump(self, tac: TACJump) -> str:
+        return f"goto L{tac.target};"
+
+    def visit_branch(self, tac: TACBranch) -> str:
+        condition = self.visit_operand(tac.condition)
+        return f"if {condition} goto L{tac.true_target} else L{tac.false_target};"
+
+    def visit_phi(self, tac: TACPhi) -> str:
+        dest = self.visit_operand(tac.dest)
+        sources = ", ".join(
+            f"B{block}: {self.visit_operand(source)}" for block, source in tac.sources
+        )
+        return f"{dest} = phi({sources});"
+
     # -Instance Methods: Helpers
     def visit_operand(self, operand: TACOperand) -> str:
         match operand:
@@ -61,6 +82,8 @@ class TACDebugPrinter(TACVisitor[str]):
                 return str(operand.value)
             case TACTemporary():
                 return f"t{operand.index}"
+            case TACVariable() if operand.version:
+                return f"{self.get_symbol(operand.id)}.{operand.version}"
             case TACVariable():
                 return self.get_symbol(operand.id)
 
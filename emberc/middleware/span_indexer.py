@@ -0,0 +1,162 @@
+##-------------------------------##
+## Ember Compiler                ##
+## Written By: Ryan Smith        ##
+##-------------------------------##
+## Middleware: Span Indexer      ##
+##-------------------------------##
+
+## Imports
+from typing import TYPE_CHECKING
+from ..ast import (
+    UnresolvedSequenceRouterMixin,
+    UnresolvedLiteralRouterMixin,
+)
+from ..core import SpanIndex
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+    from ..ast import (
+        UnresolvedNode,
+        UnresolvedSequenceNode,
+        UnresolvedTypeNode,
+        UnresolvedVariableNode,
+        UnresolvedConditionalNode,
+        UnresolvedExpressionNode,
+        UnresolvedGroupNode,
+        UnresolvedAssignNode,
+        UnresolvedBinaryNode,
+        UnresolvedUnaryPrefixNode,
+        UnresolvedLiteralNode,
+        UnresolvedIdentifierNode,
+    )
+    from ..core import Span
+    from ..diagnostics import Source
+    from ..frontend import Comment
+
+## Constants
+__all__ = (
+    "SpanItem",
+    "SpanCollector",
+    "build_span_index",
+    "reindex_span_subtree",
+)
+type SpanItem = UnresolvedNode | UnresolvedVariableNode.Entry | Comment
+
+
+## Functions
+def build_span_index(unit: UnresolvedNode, source: Source) -> SpanIndex[SpanItem]:
+    """Build a span index over every node of an unresolved unit and its source's comments."""
+    index: SpanIndex[SpanItem] = SpanIndex()
+    index.extend(SpanCollector.run(unit))
+    index.extend(_collect_comments(source.comments))
+    return index
+
+
+def reindex_span_subtree(
+    index: SpanIndex[SpanItem], old: UnresolvedNode, new: UnresolvedNode
+) -> None:
+    """Replace every span of an old subtree with the spans of its replacement subtree."""
+    for _, item in SpanCollector.run(old):
+        index.remove(item)
+    index.extend(SpanCollector.run(new))
+
+
+def _collect_comments(
+    comments: Iterable[Comment]
+) -> list[tuple[Span, SpanItem]]:
+    """Flatten comments and nested multi-line children into (span, comment) pairs."""
+    entries: list[tuple[Span, SpanItem]] = []
+    stack = list(reversed(tuple(comments)))
+    while stack:
+        comment = stack.pop()
+        entries.append((comment.span, comment))
+        if not comment.is_inline:
+            stack.extend(reversed(comment.children))
+    return entries
+
+
+## Classes
+class SpanCollector(
+    UnresolvedSequenceRouterMixin[None],
+    UnresolvedLiteralRouterMixin[None],
+):
+    """
+    Span Collector
+
+    Walks an unresolved AST in pre-order and collects the widest span of every node
+    and variable entry, ready for insertion into a span index.
+    """
+    # -Constructor
+    def __init__(self) -> None:
+        self.entries: list[tuple[Span, SpanItem]] = []
+
+    # -Instance Methods: Visitor
+    # --Types--
+    def visit_type(self, node: UnresolvedTypeNode) -> None:
+        self._add(node)
+
+    # --Declarations--
+    def visit_variable(self, node: UnresolvedVariableNode) -> None:
+        self._add(node)
+        node.type.accept(self)
+        for entry in node:
+            self.entries.append((entry.wide_span, entry))
+            if entry.has_initializer:
+                entry.initializer.accept(self)
+
+    # --Statements--
+    def visit_conditional(self, node: UnresolvedConditionalNode) -> None:
+        self._add(node)
+        node.condition.accept(self)
+        node.then_branch.accept(self)
+        if node.has_else_branch:
+            node.else_branch.accept(self)
+
+    def visit_expression(self, node: UnresolvedExpressionNode) -> None:
+        self._add(node)
+        node.expression.accept(self)
+
+    # --Expressions--
+    def visit_group(self, node: UnresolvedGroupNode) -> None:
+        self._add(node)
+        node.inner.accept(self)
+
+    def visit_assignment(self, node: UnresolvedAssignNode) -> None:
+        self._add(node)
+        node.l_value.accept(self)
+        node.r_value.accept(self)
+
+    def visit_binary(self, node: UnresolvedBinaryNode) -> None:
+        self._add(node)
+        node.lhs.accept(self)
+        node.rhs.accept(self)
+
+    def visit_unary(self, node: UnresolvedUnaryPrefixNode) -> None:
+        self._add(node)
+        node.operand.accept(self)
+
+    def visit_identifier(self, node: UnresolvedIdentifierNode) -> None:
+        self._add(node)
+
+    # --Extensions--
+    def visit_sequence(self, node: UnresolvedSequenceNode) -> None:
+        self._add(node)
+        for _node in node:
+            _node.accept(self)
+
+    def visit_literal(self, node: UnresolvedLiteralNode) -> None:
+        self._add(node)
+
+    # -Instance Methods: Helpers
+    def _add(self, node: UnresolvedNode) -> None:
+        self.entries.append((node.wide_span, node))
+
+    # -Static Methods
+    @staticmethod
+    def run(node: UnresolvedNode) -> list[tuple[Span, SpanItem]]:
+        collector = SpanCollector()
+        node.accept(collector)
+        return collector.entries
+
+    # -Class Properties
+    __slots__ = ("entries",)
@@ -6,12 +6,15 @@
 ##-------------------------------##
 
 ## Imports
+from array import array
+from collections.abc import Sequence
 from dataclasses import dataclass
 from enum import IntEnum, auto
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, overload
+from .type_table import TypeTable
 
 if TYPE_CHECKING:
-    from collections.abc import Sequence
+    from collections.abc import Iterator
     from ..ast import TypeNode
 
 ## Constants
@@ -37,44 +40,153 @@ class Symbol:
         Variable = auto()
 
 
+class SymbolStore(Sequence[Symbol]):
+    """
+    Columnar Symbol Store
+
+    Stores symbols as parallel arrays of interned name id, kind, and canonical type id
+    indexed by symbol id. Passes may read the columns directly; indexing the store
+    materializes a `Symbol` view on demand.
+    """
+    # -Constructor
+    def __init__(self) -> None:
+        self.names: list[str] = []
+        self.types = TypeTable()
+        self.name_ids = array('I')
+        self.kinds = array('B')
+        self.type_ids = array('I')
+        self._name_lookup: dict[str, int] = {}
+
+    # -Dunder Methods
+    @overload
+    def __getitem__(self, index: int) -> Symbol: ...
+    @overload
+    def __getitem__(self, index: slice) -> Sequence[Symbol]: ...
+    def __getitem__(self, index: int | slice) -> Symbol | Sequence[Symbol]:
+        if isinstance(index, slice):
+            return tuple(self[i] for i in range(*index.indices(len(self))))
+        if index < 0:
+            index += len(self)
+        return Symbol(
+            index, self.name_of(index), self.kind_of(index), self.type_of(index)
+        )
+
+    def __iter__(self) -> Iterator[Symbol]:
+        for _id in range(len(self)):
+            yield self[_id]
+
+    def __len__(self) -> int:
+        return len(self.kinds)
+
+    # -Instance Methods
+    def append(self, name: str, kind: Symbol.Kind, _type: TypeNode) -> int:
+        '''Store symbol columns and return assigned id.'''
+        _id = len(self)
+        self.name_ids.append(self._intern_name(name))
+        self.kinds.append(kind)
+        self.type_ids.append(self.types.intern(_type))
+        return _id
+
+    def replace(self, _id: int, name: str, kind: Symbol.Kind, _type: TypeNode) -> None:
+        '''Overwrite columns of an existing symbol id; used to recycle released ids.'''
+        self.name_ids[_id] = self._intern_name(name)
+        self.kinds[_id] = kind
+        self.type_ids[_id] = self.types.intern(_type)
+
+    def name_of(self, _id: int) -> str:
+        '''Return name of symbol.'''
+        return self.names[self.name_ids[_id]]
+
+    def kind_of(self, _id: int) -> Symbol.Kind:
+        '''Return kind of symbol.'''
+        return Symbol.Kind(self.kinds[_id])
+
+    def type_of(self, _id: int) -> TypeNode:
+        '''Return canonical type node of symbol.'''
+        return self.types[self.type_ids[_id]]
+
+    def _intern_name(self, name: str) -> int:
+        '''Return interned id of name.'''
+        name_id = self._name_lookup.get(name)
+        if name_id is None:
+            name_id = self._name_lookup[name] = len(self.names)
+            self.names.append(name)
+        return name_id
+
+    # -Class Properties
+    __slots__ = (
+        "names",
+        "types",
+        "name_ids",
+        "kinds",
+        "type_ids",
+        "_name_lookup",
+    )
+
+
 class SymbolTable:
-    """Maps a collection of symbols to unique ids. Handles scope creation and searching."""
+    """
+    Maps a collection of symbols to unique ids. Handles scope creation and searching.
+
+    Each name maps to a stack of shadowing symbol ids while each scope records the names
+    it pushed; lookups are O(1) regardless of nesting depth and popping a scope is O(k).
+    """
     # -Constructor
     def __init__(self) -> None:
-        self._scopes: list[Scope] = [{}]
-        self._symbols: list[Symbol] = []
+        self._bindings: dict[str, list[int]] = {}
+        self._scopes: list[list[str]] = [[]]
+        self._symbols = SymbolStore()
+        self._depths = array('I')
 
     # -Instance Methods: Symbol
     def add_symbol(
         self, name: str, kind: Symbol.Kind, _type: TypeNode
     ) -> int | None:
         '''Create symbol and return id or None if symbol already exists.'''
-        if name in self.current_scope:
+        if self.find_id_local(name) is not None:
             return None
-        _id = self.next_id
-        self._symbols.append(Symbol(_id, name, kind, _type))
-        self.current_scope[name] = _id
+        _id = self._symbols.append(name, kind, _type)
+        self._depths.append(self.scope_depth)
+        self._bindings.setdefault(name, []).append(_id)
+        self._scopes[-1].append(name)
         return _id
 
     def find_id(self, name: str) -> int | None:
-        '''Find and return symbol id by bubbling up scopes from top-down or None if non-existent.'''
-        for scope in reversed(self._scopes):
-            if name in scope:
-                return scope[name]
-        return None
+        '''Find and return innermost visible symbol id or None if non-existent.'''
+        stack = self._bindings.get(name)
+        return stack[-1] if stack else None
 
     def find_id_local(self, name: str) -> int | None:
-        '''Find and return symbol id within current scopet or None if non-existent.'''
-        return self.current_scope.get(name, None)
+        '''Find and return symbol id within current scope or None if non-existent.'''
+        _id = self.find_id(name)
+        if _id is None or self._depths[_id] != self.scope_depth:
+            return None
+        return _id
+
+    def bind(self, name: str, _id: int) -> None:
+        '''Make an existing symbol visible by name within current scope.'''
+        self._bindings.setdefault(name, []).append(_id)
+        self._scopes[-1].append(name)
 
     # -Instance Methods: Table
     def push(self) -> None:
         '''Push new scope onto the stack.'''
-        self._scopes.append({})
+        self._scopes.append([])
 
     def pop(self) -> Scope:
-        '''Pop and return scope from the stack.'''
-        return self._scopes.pop()
+        '''Pop and return scope from the stack; unwinding each name it shadowed.'''
+        scope: Scope = {}
+        for name in self._scopes.pop():
+            stack = self._bindings[name]
+            scope[name] = stack.pop()
+            if not stack:
+                del self._bindings[name]
+        return scope
+
+    def unwind(self) -> None:
+        '''Drop every scope and binding; keeping created symbols and their ids.'''
+        self._bindings.clear()
+        self._scopes = [[]]
 
     # -Instance Methods: Helpers
     def add_variable(self, name: str, _type: TypeNode) -> int | None:
@@ -89,7 +201,7 @@ class SymbolTable:
     @property
     def current_scope(self) -> Scope:
         '''Return top-level scope.'''
-        return self._scopes[-1]
+        return {name: self._bindings[name][-1] for name in self._scopes[-1]}
 
     @property
     def scope_depth(self) -> int:
@@ -97,11 +209,12 @@ class SymbolTable:
         return len(self._scopes) - 1
 
     @property
-    def symbols(self) -> Sequence[Symbol]:
-        '''Return symbol collection from table.'''
+    def symbols(self) -> SymbolStore:
+        '''Return columnar symbol store from table.'''
         assert self.scope_depth == 0, "Tried getting symbols on non-rooted table."
         self._scopes.clear()
-        return tuple(self._symbols)
+        self._bindings.clear()
+        return self._symbols
 
     # -Class Properties
-    __slots__ = ("_scopes", "_symbols")
+    __slots__ = ("_bindings", "_scopes", "_symbols", "_depths")
@@ -7,64 +7,49 @@
 
 ## Imports
 from typing import TYPE_CHECKING
-from .transformer import TACTreeTransformer
-from ...ir import (
-    TACUnit,
-    TACVisitor,
-    TACInstruction,
+from .copies import CopyPropagator, propagate_copies
+from .dead_code import DeadCodeEliminator, eliminate_dead_code
+from .dominance import DominatorTree
+from .folding import ConstantFolder, fold_constants
+from .numbering import ValueNumbering, number_values
+from .packed import (
+    PackedConstantFolder,
+    PackedTemporaryEliminator,
+    eliminate_packed_temporaries,
+    fold_packed_constants,
 )
+from .ssa import from_ssa, to_ssa
+from .transformer import PackedTACTreeTransformer, TACTreeTransformer
+from ...ir import TACUnit
 
 if TYPE_CHECKING:
-    from collections.abc import Collection, Iterator
-    from ...ir import (
-        TACAssign,
-        TACBinary,
-        TACDeclare,
-    )
+    from collections.abc import MutableSequence
+    from ...ir import TACInstruction
 
 ## Constants
 __all__ = (
+    "ConstantFolder",
+    "CopyPropagator",
+    "DeadCodeEliminator",
+    "DominatorTree",
+    "PackedConstantFolder",
+    "PackedTACTreeTransformer",
+    "PackedTemporaryEliminator",
     "TACTreeTransformer",
+    "ValueNumbering",
+    "eliminate_dead_code",
+    "eliminate_packed_temporaries",
+    "fold_constants",
+    "fold_packed_constants",
+    "from_ssa",
     "linearize_tac_tree",
+    "number_values",
+    "propagate_copies",
+    "to_ssa",
 )
 
 
 ## Functions
-def linearize_tac_tree(tac: Collection[TACInstruction]) -> TACUnit:
-    """[Group Pass]Runs a pipeline of lowering passes to flatten tree-structured TAC into linear TAC."""
-    return TACLinearTransformer.run(tac)
-
-
-## Classes
-class TACLinearTransformer(TACVisitor[TACInstruction | None]):
-    """
-    TAC Lowering Pass [1]
-
-    Traverses the intermediate tree structure and flattens nested instructions.
-    """
-
-    # -Instance Methods: Visitor
-    def visit_assignment(self, tac: TACAssign) -> TACInstruction:
-        return tac
-
-    def visit_binary(self, tac: TACBinary) -> TACInstruction:
-        return tac
-
-    def visit_declare(self, tac: TACDeclare) -> TACInstruction:
-        return tac
-
-    # -Instance Methods: Helpers
-    def visit_block(self, tac: Collection[TACInstruction]) -> Iterator[TACInstruction]:
-        for instruction in tac:
-            result = self.visit(instruction)
-            if result:
-                yield result
-
-    # -Static Methods
-    @staticmethod
-    def run(tac: Collection[TACInstruction]) -> TACUnit:
-        instructions: list[TACInstruction] = []
-        transformer = TACLinearTransformer()
-        for instruction in transformer.visit_block(tac):
-            instructions.append(instruction)
-        return TACUnit(instructions)
+def linearize_tac_tree(tac: MutableSequence[TACInstruction]) -> TACUnit:
+    """[Group Pass]Hand the transformer's flat instruction buffer over as a TAC unit without copying."""
+    return TACUnit(tac)
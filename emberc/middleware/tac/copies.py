@@ -0,0 +1,201 @@
+##-------------------------------##
+## Ember Compiler                ##
+## Written By: Ryan Smith        ##
+##-------------------------------##
+## TAC: Copy Propagation         ##
+##-------------------------------##
+
+## Imports
+from collections import Counter
+from dataclasses import replace
+from typing import TYPE_CHECKING
+from .liveness import Liveness
+from .operands import dest_of, map_operands, operands_of
+from ...ir import (
+    TACTemporary,
+    TACVariable,
+    TACAssign,
+    TACDeclare,
+)
+
+if TYPE_CHECKING:
+    from ...ir import (
+        CFG,
+        TACAddress,
+        TACOperand,
+        TACBasicBlock,
+        TACInstruction,
+    )
+
+## Functions
+def propagate_copies(cfg: CFG, is_ssa: bool = False) -> int:
+    """[Pass]Forward and coalesce copies of cfg in place; returning copies removed or forwarded."""
+    return CopyPropagator(is_ssa).run(cfg)
+
+
+def _references(instruction: TACInstruction | None, address: TACAddress) -> bool:
+    """Return whether instruction reads, writes or declares address."""
+    if instruction is None:
+        return False
+    if isinstance(instruction, TACDeclare):
+        return isinstance(address, TACVariable) and instruction.id == address.id
+    return dest_of(instruction) == address or address in operands_of(instruction)
+
+
+## Classes
+class CopyPropagator:
+    """
+    TAC Copy Propagation Pass
+
+    First retargets a temporary's only definition into the address it is copied to
+    when nothing between them touches that address, so `t0 = b + c; a = t0;` becomes
+    `a = b + c;`. Reads of copied addresses are then forwarded to the copy's source;
+    the copies left unread are for dead code elimination to remove.
+    Outside SSA form forwarding is local to each basic block and temporaries whose
+    live ranges never overlap are renumbered onto shared indices; in SSA form every
+    copy is forwarded through the whole graph.
+    """
+    # -Constructor
+    def __init__(self, is_ssa: bool = False) -> None:
+        self.is_ssa = is_ssa
+        self.propagated = 0
+        self.coalesced = 0
+
+    # -Instance Methods
+    def run(self, cfg: CFG) -> int:
+        '''Propagate copies of cfg in place; returning copies removed or forwarded.'''
+        self._retarget(cfg)
+        if self.is_ssa:
+            self._forward_graph(cfg)
+        else:
+            for block in cfg:
+                self._forward_block(block)
+            self._coalesce_temporaries(cfg)
+        return self.propagated
+
+    def _retarget(self, cfg: CFG) -> None:
+        '''Write single-use temporaries straight into the address they are copied to.'''
+        reads: Counter[TACOperand] = Counter()
+        writes: Counter[TACAddress] = Counter()
+        for instruction in cfg.instructions():
+            reads.update(operands_of(instruction))
+            dest = dest_of(instruction)
+            if isinstance(dest, TACTemporary):
+                writes[dest] += 1
+        for block in cfg:
+            instructions: list[TACInstruction | None] = list(block)
+            defined_at: dict[TACTemporary, int] = {}
+            for index, instruction in enumerate(instructions):
+                match instruction:
+                    case TACAssign(src=TACTemporary() as src) if (
+                        reads[src] == 1 and writes[src] == 1 and src in defined_at and
+                        not any(
+                            _references(between, instruction.dest)
+                            for between in instructions[defined_at[src] + 1:index]
+                        )
+                    ):
+                        start = defined_at.pop(src)
+                        instructions[start] = replace(instructions[start], dest=instruction.dest)  # type: ignore[type-var]
+                        instructions[index] = None
+                        self.propagated += 1
+                        continue
+                dest = dest_of(instruction)  # type: ignore[arg-type]
+                if isinstance(dest, TACTemporary):
+                    defined_at[dest] = index
+            block.instructions = [
+                instruction for instruction in instructions if instruction is not None
+            ]
+
+    def _forward_block(self, block: TACBasicBlock) -> None:
+        '''Forward copies within block while neither side of the copy is redefined.'''
+        copies: dict[TACOperand, TACOperand] = {}
+
+        def forward(operand: TACOperand) -> TACOperand:
+            source = copies.get(operand)
+            if source is None:
+                return operand
+            self.propagated += 1
+            return source
+
+        instructions: list[TACInstruction] = []
+        for instruction in block:
+            instruction = map_operands(instruction, forward)
+            instructions.append(instruction)
+            if isinstance(instruction, TACDeclare):
+                killed: TACOperand = TACVariable(instruction.id)
+            elif (dest := dest_of(instruction)) is not None:
+                killed = dest
+            else:
+                continue
+            for copy in [copy for copy, source in copies.items() if killed in (copy, source)]:
+                del copies[copy]
+            if isinstance(instruction, TACAssign) and instruction.src != instruction.dest:
+                copies[instruction.dest] = instruction.src
+        block.instructions = instructions
+
+    def _forward_graph(self, cfg: CFG) -> None:
+        '''Forward every reachable copy through the whole graph; sound as each address is defined once.'''
+        copies: dict[TACOperand, TACOperand] = {}
+        for _id in cfg.rpo:
+            for instruction in cfg[_id]:
+                if isinstance(instruction, TACAssign) and instruction.src != instruction.dest:
+                    copies[instruction.dest] = instruction.src
+
+        def forward(operand: TACOperand) -> TACOperand:
+            source = operand
+            while source in copies:
+                source = copies[source]
+            if source != operand:
+                self.propagated += 1
+            return source
+
+        for _id in cfg.rpo:
+            block = cfg[_id]
+            block.instructions = [map_operands(instruction, forward) for instruction in block]
+
+    def _coalesce_temporaries(self, cfg: CFG) -> None:
+        '''Renumber temporaries so ones never live at once share an index.'''
+        liveness = Liveness(cfg)
+        interference: dict[TACTemporary, set[TACTemporary]] = {}
+        for block in cfg:
+            live = {
+                address for address in liveness.live_out[block.id]
+                if isinstance(address, TACTemporary)
+            }
+            for instruction in reversed(block.instructions):
+                dest = dest_of(instruction)
+                if isinstance(dest, TACTemporary):
+                    neighbours = interference.setdefault(dest, set())
+                    for other in live:
+                        if other != dest:
+                            neighbours.add(other)
+                            interference.setdefault(other, set()).add(dest)
+                    live.discard(dest)
+                for operand in operands_of(instruction):
+                    if isinstance(operand, TACTemporary):
+                        live.add(operand)
+                        interference.setdefault(operand, set())
+        # -Greedy coloring in creation order
+        colors: dict[TACOperand, TACOperand] = {}
+        for temporary in sorted(interference, key=lambda temporary: temporary.index):
+            taken = {colors[other] for other in interference[temporary] if other in colors}
+            index = 0
+            while TACTemporary(index) in taken:
+                index += 1
+            colors[temporary] = TACTemporary(index)
+        self.coalesced = len(colors) - len(set(colors.values()))
+        if all(temporary == color for temporary, color in colors.items()):
+            return
+        for block in cfg:
+            instructions: list[TACInstruction] = []
+            for instruction in block:
+                instruction = map_operands(instruction, lambda operand: colors.get(operand, operand))
+                dest = dest_of(instruction)
+                if isinstance(dest, TACTemporary):
+                    instruction = replace(instruction, dest=colors[dest])  # type: ignore[type-var]
+                instructions.append(instruction)
+            block.instructions = instructions
+
+    # -Class Properties
+    __slots__ = ("is_ssa", "propagated", "coalesced")
+
@@ -0,0 +1,152 @@
+##-------------------------------##
+## Ember Compiler                ##
+## Written By: Ryan Smith        ##
+##-------------------------------##
+## TAC: Dead Code Elimination    ##
+##-------------------------------##
+
+## Imports
+from typing import TYPE_CHECKING
+from .liveness import Liveness
+from .operands import dest_of, operands_of
+from ...ast import BinaryOperator
+from ...ir import (
+    CFG,
+    TACLiteral,
+    TACVariable,
+    TACAssign,
+    TACBinary,
+    TACDeclare,
+    TACPhi,
+)
+
+if TYPE_CHECKING:
+    from collections.abc import Collection
+    from ...ir import (
+        TACUnit,
+        TACAddress,
+        TACBasicBlock,
+        TACInstruction,
+    )
+
+## Constants
+UNREACHABLE = -1
+TRAPPING_OPERATORS = frozenset((BinaryOperator.Div, BinaryOperator.Mod))
+
+
+## Functions
+def eliminate_dead_code(unit: TACUnit, live_out: Collection[int] = ()) -> int:
+    """[Pass]Remove dead instructions from unit in place; returning instructions removed."""
+    cfg = CFG.build(unit.instructions)
+    removed = DeadCodeEliminator(live_out).run(cfg)
+    if removed:
+        unit.instructions = list(cfg.instructions())
+    return removed
+
+
+## Classes
+class DeadCodeEliminator:
+    """
+    TAC Dead Code Elimination Pass
+
+    Sweeps each block backwards from its live-out set, dropping copies, binaries and
+    phis whose destination is never read afterwards; temporaries of discarded
+    expression statements and stores overwritten before any read both fall out.
+    Only variables in `live_out` are observed once the graph exits. Sweeps repeat
+    until stable, then declarations of variables no longer referenced are removed.
+    Blocks unreachable from entry are dropped from the graph outright, so they add no
+    edges for later passes. Labels and terminators of reachable blocks are always
+    kept, as are divisions and modulos that may trap on a zero divisor.
+    """
+    # -Constructor
+    def __init__(self, live_out: Collection[int] = ()) -> None:
+        self.live_out = frozenset(live_out)
+        self.removed = 0
+
+    # -Instance Methods
+    def run(self, cfg: CFG) -> int:
+        '''Eliminate dead code of cfg in place; returning instructions removed.'''
+        self._remove_unreachable(cfg)
+        exit_live = frozenset(
+            operand for instruction in cfg.instructions()
+            for operand in (*operands_of(instruction), dest_of(instruction))
+            if isinstance(operand, TACVariable) and operand.id in self.live_out
+        )
+        removed = -1
+        while removed != self.removed:
+            removed = self.removed
+            liveness = Liveness(cfg, exit_live)
+            for _id in cfg.rpo:
+                self._sweep(cfg[_id], liveness.live_out[_id])
+        self._prune_declarations(cfg)
+        return self.removed
+
+    def _sweep(self, block: TACBasicBlock, live_out: set[TACAddress]) -> None:
+        '''Drop instructions of block whose results are dead; walking backwards from live_out.'''
+        live = set(live_out)
+        kept: list[TACInstruction] = []
+        for instruction in reversed(block.instructions):
+            dest = dest_of(instruction)
+            if dest is not None:
+                if dest not in live and self._is_removable(instruction):
+                    self.removed += 1
+                    continue
+                live.discard(dest)
+            if not isinstance(instruction, TACPhi):
+                live.update(
+                    operand for operand in operands_of(instruction)
+                    if not isinstance(operand, TACLiteral)
+                )
+            kept.append(instruction)
+        kept.reverse()
+        block.instructions = kept
+
+    def _prune_declarations(self, cfg: CFG) -> None:
+        '''Remove declarations of variables no instruction references.'''
+        referenced = {
+            operand.id for instruction in cfg.instructions()
+            for operand in (*operands_of(instruction), dest_of(instruction))
+            if isinstance(operand, TACVariable)
+        } | self.live_out
+        for block in cfg:
+            instructions = [
+                instruction for instruction in block
+                if not isinstance(instruction, TACDeclare) or instruction.id in referenced
+            ]
+            self.removed += len(block) - len(instructions)
+            block.instructions = instructions
+
+    def _remove_unreachable(self, cfg: CFG) -> None:
+        '''Drop blocks never reached from entry; renumbering the rest in order and their phi sources.'''
+        # -A reachable block never falls through into an unreachable one, so order is preserved
+        reachable = [block for block in cfg if cfg.rpo_number[block.id] != UNREACHABLE]
+        if len(reachable) == len(cfg):
+            return
+        self.removed += sum(len(block) for block in cfg) - sum(len(block) for block in reachable)
+        renumbered = {block.id: _id for _id, block in enumerate(reachable)}
+        for block in reachable:
+            block.id = renumbered[block.id]
+            block.instructions = [
+                TACPhi(instruction.dest, tuple(
+                    (renumbered[source_block], source) for source_block, source in instruction.sources
+                    if source_block in renumbered
+                )) if isinstance(instruction, TACPhi) else instruction
+                for instruction in block
+            ]
+        cfg.blocks = reachable
+        cfg.rebuild()
+
+    # -Static Methods
+    @staticmethod
+    def _is_removable(instruction: TACInstruction) -> bool:
+        '''Return whether instruction has no effect besides writing its destination.'''
+        match instruction:
+            case TACBinary() if instruction.operator in TRAPPING_OPERATORS:
+                return isinstance(instruction.rhs, TACLiteral) and instruction.rhs.value != 0
+            case TACAssign() | TACBinary() | TACPhi():
+                return True
+            case _:
+                return False
+
+    # -Class Properties
+    __slots__ = ("live_out", "removed")
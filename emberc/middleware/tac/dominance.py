@@ -0,0 +1,125 @@
+##-------------------------------##
+## Ember Compiler                ##
+## Written By: Ryan Smith        ##
+##-------------------------------##
+## TAC: Dominance                ##
+##-------------------------------##
+
+## Imports
+from array import array
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+    from ...ir import CFG
+
+## Constants
+UNDEFINED = -1
+
+
+## Classes
+class DominatorTree:
+    """
+    Dominator Tree
+
+    Computes immediate dominators of every reachable block with the iterative
+    Cooper-Harvey-Kennedy algorithm over reverse postorder, along with tree children,
+    pre/post numbering for O(1) dominance queries, and dominance frontiers.
+    Unreachable blocks keep an idom of -1.
+    """
+    # -Constructor
+    def __init__(self, cfg: CFG) -> None:
+        self.cfg = cfg
+        self.idom = array('i', [UNDEFINED] * len(cfg))
+        self.children: list[list[int]] = [[] for _ in range(len(cfg))]
+        self._pre = array('i', [UNDEFINED] * len(cfg))
+        self._post = array('i', [UNDEFINED] * len(cfg))
+        self._frontiers: list[list[int]] | None = None
+        self._compute()
+
+    # -Instance Methods
+    def dominates(self, a: int, b: int) -> bool:
+        '''Return if block a dominates block b; every block dominates itself.'''
+        if self._pre[a] == UNDEFINED or self._pre[b] == UNDEFINED:
+            return False
+        return self._pre[a] <= self._pre[b] and self._post[b] <= self._post[a]
+
+    def preorder(self) -> Iterator[int]:
+        '''Yield reachable blocks in dominator tree preorder.'''
+        if not len(self.cfg):
+            return
+        stack = [0]
+        while stack:
+            _id = stack.pop()
+            yield _id
+            stack.extend(reversed(self.children[_id]))
+
+    def _compute(self) -> None:
+        '''Iterate idoms to a fixed point then number the resulting tree.'''
+        cfg = self.cfg
+        if not len(cfg):
+            return
+        idom, rpo_number = self.idom, cfg.rpo_number
+        idom[0] = 0
+
+        def intersect(a: int, b: int) -> int:
+            while a != b:
+                while rpo_number[a] > rpo_number[b]:
+                    a = idom[a]
+                while rpo_number[b] > rpo_number[a]:
+                    b = idom[b]
+            return a
+
+        order = cfg.rpo[1:]
+        changed = True
+        while changed:
+            changed = False
+            for _id in order:
+                new_idom = UNDEFINED
+                for predecessor in cfg.predecessors[_id]:
+                    if idom[predecessor] == UNDEFINED:
+                        continue
+                    new_idom = predecessor if new_idom == UNDEFINED else intersect(predecessor, new_idom)
+                if idom[_id] != new_idom:
+                    idom[_id] = new_idom
+                    changed = True
+        for _id in order:
+            self.children[idom[_id]].append(_id)
+        # -Numbering
+        counter = 0
+        stack: list[tuple[int, bool]] = [(0, False)]
+        while stack:
+            _id, is_exit = stack.pop()
+            if is_exit:
+                self._post[_id] = counter
+                counter += 1
+                continue
+            self._pre[_id] = counter
+            counter += 1
+            stack.append((_id, True))
+            stack.extend((child, False) for child in reversed(self.children[_id]))
+
+    # -Properties
+    @property
+    def frontiers(self) -> list[list[int]]:
+        '''Return dominance frontier of every block; computed once on first access.'''
+        if self._frontiers is not None:
+            return self._frontiers
+        cfg, idom = self.cfg, self.idom
+        frontiers: list[list[int]] = [[] for _ in range(len(cfg))]
+        for _id in cfg.rpo:
+            predecessors = cfg.predecessors[_id]
+            if len(predecessors) < 2:
+                continue
+            for runner in predecessors:
+                if idom[runner] == UNDEFINED:
+                    continue
+                while runner != idom[_id]:
+                    if not frontiers[runner] or frontiers[runner][-1] != _id:
+                        frontiers[runner].append(_id)
+                    runner = idom[runner]
+        self._frontiers = frontiers
+        return frontiers
+
+    # -Class Properties
+    __slots__ = ("cfg", "idom", "children", "_pre", "_post", "_frontiers")
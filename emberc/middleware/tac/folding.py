@@ -0,0 +1,180 @@
+##-------------------------------##
+## Ember Compiler                ##
+## Written By: Ryan Smith        ##
+##-------------------------------##
+## TAC: Constant Folding         ##
+##-------------------------------##
+
+## Imports
+from typing import TYPE_CHECKING, assert_never
+from .operands import dest_of, map_operands
+from ...ast import BinaryOperator, TypePrimitive
+from ...ir import (
+    TACLiteral,
+    TACVariable,
+    TACAssign,
+    TACBinary,
+    TACDeclare,
+    TACJump,
+    TACBranch,
+    TACPhi,
+)
+
+if TYPE_CHECKING:
+    from ...ir import (
+        CFG,
+        TACAddress,
+        TACOperand,
+        TACBasicBlock,
+        TACInstruction,
+    )
+
+## Constants
+DEFAULT_FOLD_TYPE = TypePrimitive.int64
+
+
+## Functions
+def evaluate_binary(
+    operator: BinaryOperator, lhs: int, rhs: int, _type: TypePrimitive | None = None
+) -> int | None:
+    """
+    Evaluate operator over constant operands wrapped around to type (int64 if unknown).
+    Division and modulo floor like the tree-walking interpreter; returns None on division by zero.
+    """
+    match operator:
+        case BinaryOperator.Add:
+            value = lhs + rhs
+        case BinaryOperator.Sub:
+            value = lhs - rhs
+        case BinaryOperator.Mul:
+            value = lhs * rhs
+        case BinaryOperator.Div:
+            if rhs == 0:
+                return None
+            value = lhs // rhs
+        case BinaryOperator.Mod:
+            if rhs == 0:
+                return None
+            value = lhs % rhs
+        case BinaryOperator.Eq:
+            return int(lhs == rhs)
+        case BinaryOperator.NtEq:
+            return int(lhs != rhs)
+        case BinaryOperator.Lt:
+            return int(lhs < rhs)
+        case BinaryOperator.LtEq:
+            return int(lhs <= rhs)
+        case BinaryOperator.Gt:
+            return int(lhs > rhs)
+        case BinaryOperator.GtEq:
+            return int(lhs >= rhs)
+        case _:
+            assert_never(operator)
+    return (_type or DEFAULT_FOLD_TYPE).wrap(value)
+
+
+def fold_constants(cfg: CFG, is_ssa: bool = False) -> int:
+    """[Pass]Fold and propagate constants through cfg in place; returning instructions folded."""
+    return ConstantFolder(is_ssa).run(cfg)
+
+
+## Classes
+class ConstantFolder:
+    """
+    TAC Constant Folding Pass
+
+    Rewrites reads of addresses holding a known literal into that literal, evaluates
+    binaries over literal operands into plain stores, and turns branches on literal
+    conditions into jumps. Outside SSA form facts only live within a basic block;
+    in SSA form every definition is unique so facts span the whole graph and phis
+    whose sources agree fold too.
+    """
+    # -Constructor
+    def __init__(self, is_ssa: bool = False) -> None:
+        self.is_ssa = is_ssa
+        self.folded = 0
+
+    # -Instance Methods
+    def run(self, cfg: CFG) -> int:
+        '''Fold cfg in place until no more folds apply; returning instructions folded.'''
+        if self.is_ssa:
+            constants: dict[TACAddress, TACLiteral] = {}
+            folded = -1
+            while folded != self.folded:
+                folded = self.folded
+                for _id in cfg.rpo:
+                    self._fold_block(cfg[_id], constants)
+        else:
+            for block in cfg:
+                self._fold_block(block, {})
+        self._fold_branches(cfg)
+        return self.folded
+
+    def _fold_block(self, block: TACBasicBlock, constants: dict[TACAddress, TACLiteral]) -> None:
+        '''Fold every instruction of block against known constants.'''
+        block.instructions = [
+            self._fold_instruction(instruction, constants) for instruction in block
+        ]
+
+    def _fold_instruction(
+        self, instruction: TACInstruction, constants: dict[TACAddress, TACLiteral]
+    ) -> TACInstruction:
+        '''Return instruction with known operands substituted and evaluated where possible.'''
+        def substitute(operand: TACOperand) -> TACOperand:
+            if isinstance(operand, TACLiteral):
+                return operand
+            return constants.get(operand, operand)
+
+        instruction = map_operands(instruction, substitute)
+        match instruction:
+            case TACBinary(lhs=TACLiteral(), rhs=TACLiteral()):
+                value = evaluate_binary(
+                    instruction.operator, instruction.lhs.value, instruction.rhs.value,  # type: ignore[union-attr]
+                    instruction.type,
+                )
+                if value is not None:
+                    instruction = TACAssign(instruction.dest, TACLiteral(value))
+                    self.folded += 1
+            case TACPhi() if instruction.sources:
+                sources = {source for _, source in instruction.sources}
+                if len(sources) == 1 and isinstance(source := sources.pop(), TACLiteral):
+                    instruction = TACAssign(instruction.dest, source)
+                    self.folded += 1
+            case TACDeclare() if not self.is_ssa:
+                constants.pop(TACVariable(instruction.id), None)
+        dest = dest_of(instruction)
+        if dest is None:
+            return instruction
+        if isinstance(instruction, TACAssign) and isinstance(instruction.src, TACLiteral):
+            constants[dest] = instruction.src
+        else:
+            constants.pop(dest, None)
+        return instruction
+
+    def _fold_branches(self, cfg: CFG) -> None:
+        '''Replace branches on literal conditions with jumps and prune phi sources of removed edges.'''
+        changed = False
+        for block in cfg:
+            branch = block.terminator
+            if not (isinstance(branch, TACBranch) and isinstance(branch.condition, TACLiteral)):
+                continue
+            target = branch.true_target if branch.condition.value else branch.false_target
+            block.instructions[-1] = TACJump(target)
+            self.folded += 1
+            changed = True
+        if not changed:
+            return
+        cfg.rebuild()
+        for block in cfg:
+            predecessors = set(cfg.predecessors[block.id])
+            block.instructions = [
+                TACPhi(instruction.dest, tuple(
+                    (predecessor, source) for predecessor, source in instruction.sources
+                    if predecessor in predecessors
+                ))
+                if isinstance(instruction, TACPhi) else instruction
+                for instruction in block
+            ]
+
+    # -Class Properties
+    __slots__ = ("is_ssa", "folded")
@@ -0,0 +1,81 @@
+##-------------------------------##
+## Ember Compiler                ##
+## Written By: Ryan Smith        ##
+##-------------------------------##
+## TAC: Liveness                 ##
+##-------------------------------##
+
+## Imports
+from typing import TYPE_CHECKING
+from .operands import dest_of, operands_of
+from ...ir import (
+    TACLiteral,
+    TACPhi,
+)
+
+if TYPE_CHECKING:
+    from collections.abc import Set
+    from ...ir import (
+        CFG,
+        TACAddress,
+    )
+
+
+## Classes
+class Liveness:
+    """
+    Block Liveness
+
+    Solves backward liveness of addresses over a control flow graph, iterating in
+    postorder to a fixed point. Phi sources are live out of their predecessor only,
+    and blocks without successors keep `exit_live` addresses live out.
+    """
+    # -Constructor
+    def __init__(self, cfg: CFG, exit_live: Set[TACAddress] = frozenset()) -> None:
+        self.cfg = cfg
+        self.exit_live = exit_live
+        self.live_in: list[set[TACAddress]] = [set() for _ in cfg]
+        self.live_out: list[set[TACAddress]] = [set() for _ in cfg]
+        self._solve()
+
+    # -Instance Methods
+    def _solve(self) -> None:
+        '''Compute local sets then iterate live-in/live-out until stable.'''
+        cfg = self.cfg
+        uses: list[set[TACAddress]] = []
+        defs: list[set[TACAddress]] = []
+        phi_uses: list[set[TACAddress]] = [set() for _ in cfg]
+        for block in cfg:
+            used: set[TACAddress] = set()
+            defined: set[TACAddress] = set()
+            for instruction in block:
+                if isinstance(instruction, TACPhi):
+                    for predecessor, source in instruction.sources:
+                        if not isinstance(source, TACLiteral):
+                            phi_uses[predecessor].add(source)
+                else:
+                    for operand in operands_of(instruction):
+                        if not isinstance(operand, TACLiteral) and operand not in defined:
+                            used.add(operand)
+                dest = dest_of(instruction)
+                if dest is not None:
+                    defined.add(dest)
+            uses.append(used)
+            defs.append(defined)
+        order = cfg.rpo[::-1]
+        changed = True
+        while changed:
+            changed = False
+            for _id in order:
+                successors = cfg.successors[_id]
+                live_out = phi_uses[_id].union(*(self.live_in[s] for s in successors))
+                if not successors:
+                    live_out |= self.exit_live
+                live_in = uses[_id] | (live_out - defs[_id])
+                self.live_out[_id] = live_out
+                if live_in != self.live_in[_id]:
+                    self.live_in[_id] = live_in
+                    changed = True
+
+    # -Class Properties
+    __slots__ = ("cfg", "exit_live", "live_in", "live_out")
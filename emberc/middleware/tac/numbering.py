@@ -0,0 +1,157 @@
+##-------------------------------##
+## Ember Compiler                ##
+## Written By: Ryan Smith        ##
+##-------------------------------##
+## TAC: Value Numbering          ##
+##-------------------------------##
+
+## Imports
+from typing import TYPE_CHECKING
+from .dominance import DominatorTree
+from .operands import dest_of
+from ...ast import BinaryOperator
+from ...ir import (
+    TACLiteral,
+    TACVariable,
+    TACAssign,
+    TACBinary,
+    TACDeclare,
+)
+
+if TYPE_CHECKING:
+    from ...ast import TypePrimitive
+    from ...ir import (
+        CFG,
+        TACAddress,
+        TACOperand,
+        TACBasicBlock,
+        TACInstruction,
+    )
+
+## Constants
+COMMUTATIVE_OPERATORS = frozenset((
+    BinaryOperator.Add, BinaryOperator.Mul,
+    BinaryOperator.Eq, BinaryOperator.NtEq,
+))
+type ExpressionKey = tuple[BinaryOperator, TypePrimitive | None, int, int]
+
+
+## Functions
+def number_values(cfg: CFG, is_ssa: bool = False) -> int:
+    """[Pass]Eliminate redundant binaries in cfg in place; returning instructions removed."""
+    return ValueNumbering(is_ssa).run(cfg)
+
+
+## Classes
+class ValueNumbering:
+    """
+    TAC Value Numbering Pass
+
+    Gives every operand a value number; copies share their source's number and
+    binaries are hashed by (operator, type, lhs, rhs) with operands of commutative
+    operators ordered. A binary whose key was already computed into an address that
+    still holds that value is replaced by a copy from it.
+    Outside SSA form tables are local to each basic block; in SSA form they are scoped
+    along the dominator tree so a computation is reused in every block it dominates.
+    """
+    # -Constructor
+    def __init__(self, is_ssa: bool = False) -> None:
+        self.is_ssa = is_ssa
+        self.removed = 0
+        self._numbers: dict[TACOperand, int] = {}
+        self._holders: dict[int, TACAddress] = {}
+        self._table: dict[ExpressionKey, int] = {}
+        self._next = 0
+
+    # -Instance Methods
+    def run(self, cfg: CFG) -> int:
+        '''Number cfg in place; returning instructions removed.'''
+        if not self.is_ssa:
+            for block in cfg:
+                self._reset()
+                self._number_block(block, None)
+            return self.removed
+        self._reset()
+        tree = DominatorTree(cfg)
+        log: list[ExpressionKey] = []
+        walk: list[tuple[int, int]] = [(0, -1)] if len(cfg) else []
+        while walk:
+            _id, mark = walk.pop()
+            if mark >= 0:
+                while len(log) > mark:
+                    del self._table[log.pop()]
+                continue
+            walk.append((_id, len(log)))
+            self._number_block(cfg[_id], log)
+            walk.extend((child, -1) for child in reversed(tree.children[_id]))
+        return self.removed
+
+    def _reset(self) -> None:
+        '''Forget every value number.'''
+        self._numbers.clear()
+        self._holders.clear()
+        self._table.clear()
+
+    def _number_block(self, block: TACBasicBlock, log: list[ExpressionKey] | None) -> None:
+        '''Number instructions of block; logging inserted keys for scoped removal.'''
+        block.instructions = [self._number(instruction, log) for instruction in block]
+
+    def _number(
+        self, instruction: TACInstruction, log: list[ExpressionKey] | None
+    ) -> TACInstruction:
+        '''Return instruction or a copy replacing it if its value is already available.'''
+        match instruction:
+            case TACBinary():
+                lhs, rhs = self._value_of(instruction.lhs), self._value_of(instruction.rhs)
+                if instruction.operator in COMMUTATIVE_OPERATORS and lhs > rhs:
+                    lhs, rhs = rhs, lhs
+                key = (instruction.operator, instruction.type, lhs, rhs)
+                value = self._table.get(key)
+                if value is not None and (holder := self._available(value)) is not None:
+                    self.removed += 1
+                    self._define(instruction.dest, value)
+                    return TACAssign(instruction.dest, holder)
+                value = self._fresh()
+                self._table[key] = value
+                if log is not None:
+                    log.append(key)
+                self._define(instruction.dest, value)
+            case TACAssign():
+                self._define(instruction.dest, self._value_of(instruction.src))
+            case TACDeclare():
+                self._numbers.pop(TACVariable(instruction.id), None)
+            case _:
+                dest = dest_of(instruction)
+                if dest is not None:
+                    self._define(dest, self._fresh())
+        return instruction
+
+    def _value_of(self, operand: TACOperand) -> int:
+        '''Return value number of operand; numbering it if unseen.'''
+        value = self._numbers.get(operand)
+        if value is None:
+            value = self._numbers[operand] = self._fresh()
+            if not isinstance(operand, TACLiteral):
+                self._holders[value] = operand
+        return value
+
+    def _define(self, dest: TACAddress, value: int) -> None:
+        '''Record dest as holding value.'''
+        self._numbers[dest] = value
+        if self._available(value) is None:
+            self._holders[value] = dest
+
+    def _available(self, value: int) -> TACAddress | None:
+        '''Return an address still holding value or None.'''
+        holder = self._holders.get(value)
+        if holder is None or self._numbers.get(holder) != value:
+            return None
+        return holder
+
+    def _fresh(self) -> int:
+        '''Return an unused value number.'''
+        self._next += 1
+        return self._next
+
+    # -Class Properties
+    __slots__ = ("is_ssa", "removed", "_numbers", "_holders", "_table", "_next")
@@ -0,0 +1,68 @@
+##-------------------------------##
+## Ember Compiler                ##
+## Written By: Ryan Smith        ##
+##-------------------------------##
+## TAC: Operands                 ##
+##-------------------------------##
+
+## Imports
+from dataclasses import replace
+from typing import TYPE_CHECKING
+from ...ir import (
+    TACAssign,
+    TACBinary,
+    TACBranch,
+    TACPhi,
+)
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Iterator
+    from ...ir import (
+        TACAddress,
+        TACOperand,
+        TACInstruction,
+    )
+
+
+## Functions
+def operands_of(instruction: TACInstruction) -> Iterator[TACOperand]:
+    """Yield every operand read by instruction."""
+    match instruction:
+        case TACAssign():
+            yield instruction.src
+        case TACBinary():
+            yield instruction.lhs
+            yield instruction.rhs
+        case TACBranch():
+            yield instruction.condition
+        case TACPhi():
+            for _, source in instruction.sources:
+                yield source
+
+
+def dest_of(instruction: TACInstruction) -> TACAddress | None:
+    """Return address written by instruction or None if it writes nothing."""
+    match instruction:
+        case TACAssign() | TACBinary() | TACPhi():
+            return instruction.dest
+        case _:
+            return None
+
+
+def map_operands(
+    instruction: TACInstruction, mapper: Callable[[TACOperand], TACOperand]
+) -> TACInstruction:
+    """Return instruction with every read operand passed through mapper."""
+    match instruction:
+        case TACAssign():
+            return replace(instruction, src=mapper(instruction.src))
+        case TACBinary():
+            return replace(instruction, lhs=mapper(instruction.lhs), rhs=mapper(instruction.rhs))
+        case TACBranch():
+            return replace(instruction, condition=mapper(instruction.condition))
+        case TACPhi():
+            return replace(instruction, sources=tuple(
+                (block, mapper(source)) for block, source in instruction.sources
+            ))
+        case _:
+            return instruction
@@ -0,0 +1,181 @@
+##-------------------------------##
+## Ember Compiler                ##
+## Written By: Ryan Smith        ##
+##-------------------------------##
+## TAC: Packed Passes            ##
+##-------------------------------##
+
+## Imports
+from array import array
+from .folding import evaluate_binary
+from ...ast import BinaryOperator
+from ...ir import PackedTACUnit, TACOpcode
+
+## Constants
+TRAPPING_OPERATORS = frozenset((BinaryOperator.Div, BinaryOperator.Mod))
+
+
+## Functions
+def fold_packed_constants(unit: PackedTACUnit) -> int:
+    """[Pass]Fold and propagate constants through a packed unit in place; returning rows folded."""
+    return PackedConstantFolder().run(unit)
+
+
+def eliminate_packed_temporaries(unit: PackedTACUnit) -> int:
+    """[Pass]Remove writes of never-read temporaries from a packed unit in place; returning rows removed."""
+    return PackedTemporaryEliminator().run(unit)
+
+
+## Classes
+class PackedConstantFolder:
+    """
+    Packed TAC Constant Folding Pass
+
+    Column-level counterpart of `ConstantFolder` outside SSA form, rewriting rows in place.
+    Facts live within a basic block: labels and terminators clear them and declarations
+    drop their variable. Reads of codes holding a known literal become that literal's code,
+    binaries over literal operands become assigns of their value, and branches on literal
+    conditions become jumps. Units holding phis keep their branches, since dropping an edge
+    would leave stale phi sources behind.
+    """
+    # -Constructor
+    def __init__(self) -> None:
+        self.folded = 0
+
+    # -Instance Methods
+    def run(self, unit: PackedTACUnit) -> int:
+        '''Fold unit in place; returning rows folded.'''
+        opcodes, dests, lhs, rhs, aux = unit.opcodes, unit.dests, unit.lhs, unit.rhs, unit.aux
+        is_literal = PackedTACUnit.is_literal
+        fold_branches = TACOpcode.Phi not in opcodes
+        constants: dict[int, int] = {}
+        for row in range(len(opcodes)):
+            match opcodes[row]:
+                case TACOpcode.Assign:
+                    src = lhs[row] = constants.get(lhs[row], lhs[row])
+                    if is_literal(src):
+                        constants[dests[row]] = src
+                    else:
+                        constants.pop(dests[row], None)
+                case TACOpcode.Binary:
+                    l_code = lhs[row] = constants.get(lhs[row], lhs[row])
+                    r_code = rhs[row] = constants.get(rhs[row], rhs[row])
+                    value = None
+                    if is_literal(l_code) and is_literal(r_code):
+                        value = evaluate_binary(
+                            PackedTACUnit.decode_operator(aux[row]),
+                            unit.literal_value(l_code), unit.literal_value(r_code),
+                            PackedTACUnit.decode_type(aux[row]),
+                        )
+                    if value is None:
+                        constants.pop(dests[row], None)
+                        continue
+                    opcodes[row], lhs[row], rhs[row], aux[row] = TACOpcode.Assign, unit.literal(value), 0, 0
+                    constants[dests[row]] = lhs[row]
+                    self.folded += 1
+                case TACOpcode.Branch:
+                    condition = lhs[row] = constants.get(lhs[row], lhs[row])
+                    if fold_branches and is_literal(condition):
+                        if not unit.literal_value(condition):
+                            dests[row] = rhs[row]
+                        opcodes[row], lhs[row], rhs[row] = TACOpcode.Jump, 0, 0
+                        self.folded += 1
+                    constants.clear()
+                case TACOpcode.Label | TACOpcode.Jump:
+                    constants.clear()
+                case TACOpcode.Declare:
+                    constants.pop(PackedTACUnit.variable(dests[row]), None)
+                case TACOpcode.Phi:
+                    constants.pop(dests[row], None)
+        return self.folded
+
+    # -Class Properties
+    __slots__ = ("folded",)
+
+
+class PackedTemporaryEliminator:
+    """
+    Packed TAC Dead Temporary Elimination Pass
+
+    Works on the integer columns of a packed unit without decoding instructions.
+    Counts reads of every temporary code across the operand columns and phi sources,
+    then sweeps rows backwards dropping copies and binaries into temporaries with no
+    reads left, releasing the reads of each dropped row; sweeps repeat until stable so
+    chains feeding loops fall out too. Divisions and modulos that may trap on a zero
+    divisor are kept. Surviving rows are compacted into fresh columns once at the end.
+    """
+    # -Constructor
+    def __init__(self) -> None:
+        self.removed = 0
+
+    # -Instance Methods
+    def run(self, unit: PackedTACUnit) -> int:
+        '''Eliminate dead temporary writes of unit in place; returning rows removed.'''
+        opcodes, dests, rhs, aux = unit.opcodes, unit.dests, unit.rhs, unit.aux
+        is_temporary = PackedTACUnit.is_temporary
+        reads: dict[int, int] = {}
+        for row in range(len(opcodes)):
+            for code in self._reads_of(unit, row):
+                if is_temporary(code):
+                    reads[code] = reads.get(code, 0) + 1
+        keep = bytearray(b"\x01") * len(opcodes)
+        changed = True
+        while changed:
+            changed = False
+            for row in range(len(opcodes) - 1, -1, -1):
+                if not keep[row]:
+                    continue
+                dest = dests[row]
+                if not is_temporary(dest) or reads.get(dest, 0):
+                    continue
+                match opcodes[row]:
+                    case TACOpcode.Assign:
+                        pass
+                    case TACOpcode.Binary if self._may_trap(unit, aux[row], rhs[row]):
+                        continue
+                    case TACOpcode.Binary:
+                        pass
+                    case _:
+                        continue
+                keep[row] = 0
+                changed = True
+                self.removed += 1
+                for code in self._reads_of(unit, row):
+                    if is_temporary(code):
+                        reads[code] -= 1
+        if self.removed:
+            self._compact(unit, keep)
+        return self.removed
+
+    # -Static Methods
+    @staticmethod
+    def _reads_of(unit: PackedTACUnit, row: int) -> list[int]:
+        '''Return operand codes read by row.'''
+        match unit.opcodes[row]:
+            case TACOpcode.Assign | TACOpcode.Branch:
+                return [unit.lhs[row]]
+            case TACOpcode.Binary:
+                return [unit.lhs[row], unit.rhs[row]]
+            case TACOpcode.Phi:
+                return [code for _, code in unit.phi_sources(row)]
+            case _:
+                return []
+
+    @staticmethod
+    def _may_trap(unit: PackedTACUnit, aux: int, rhs: int) -> bool:
+        '''Return whether a packed binary divides by a divisor that is not a known non-zero literal.'''
+        if PackedTACUnit.operator_of(aux) not in TRAPPING_OPERATORS:
+            return False
+        return not PackedTACUnit.is_literal(rhs) or unit.literal_value(rhs) == 0
+
+    @staticmethod
+    def _compact(unit: PackedTACUnit, keep: bytearray) -> None:
+        '''Replace columns of unit with kept rows; phi offsets into `sources` stay valid.'''
+        for name in ("opcodes", "dests", "lhs", "rhs", "aux"):
+            column: array[int] = getattr(unit, name)
+            setattr(unit, name, array(column.typecode, (
+                value for value, kept in zip(column, keep) if kept
+            )))
+
+    # -Class Properties
+    __slots__ = ("removed",)
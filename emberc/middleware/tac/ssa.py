@@ -0,0 +1,294 @@
+##-------------------------------##
+## Ember Compiler                ##
+## Written By: Ryan Smith        ##
+##-------------------------------##
+## TAC: Static Single Assignment ##
+##-------------------------------##
+
+## Imports
+from dataclasses import replace
+from typing import TYPE_CHECKING
+from .dominance import DominatorTree
+from .operands import dest_of, map_operands, operands_of
+from ...ir import (
+    TACBasicBlock,
+    TACLiteral,
+    TACTemporary,
+    TACVariable,
+    TACAssign,
+    TACLabel,
+    TACJump,
+    TACBranch,
+    TACPhi,
+)
+
+if TYPE_CHECKING:
+    from ...ir import (
+        CFG,
+        TACAddress,
+        TACOperand,
+        TACInstruction,
+    )
+
+## Constants
+UNREACHABLE = -1
+type TACCopy = tuple[TACAddress, TACOperand]
+
+
+## Functions
+def to_ssa(cfg: CFG) -> DominatorTree:
+    """
+    SSA Construction
+
+    Rewrites cfg in place so every variable definition has its own version.
+    Phis are placed at the iterated dominance frontiers of variables live across
+    blocks (semi-pruned form) and operands are renamed in one iterative walk of the
+    dominator tree. Version 0 stands for a variable's declared, unassigned value.
+    """
+    tree = DominatorTree(cfg)
+    reachable = [cfg.rpo_number[block.id] != UNREACHABLE for block in cfg]
+    # -Definition sites and cross-block variables
+    def_sites: dict[int, list[int]] = {}
+    crossing: set[int] = set()
+    for block in cfg:
+        if not reachable[block.id]:
+            continue
+        defined: set[int] = set()
+        for instruction in block:
+            for operand in operands_of(instruction):
+                if isinstance(operand, TACVariable) and operand.id not in defined:
+                    crossing.add(operand.id)
+            dest = dest_of(instruction)
+            if isinstance(dest, TACVariable):
+                defined.add(dest.id)
+                sites = def_sites.setdefault(dest.id, [])
+                if not sites or sites[-1] != block.id:
+                    sites.append(block.id)
+    # -Phi placement
+    frontiers = tree.frontiers
+    phis: list[dict[int, dict[int, TACOperand]]] = [{} for _ in cfg]
+    for _id in sorted(crossing):
+        worklist = list(def_sites.get(_id, ()))
+        queued = set(worklist)
+        while worklist:
+            for frontier in frontiers[worklist.pop()]:
+                if _id in phis[frontier]:
+                    continue
+                phis[frontier][_id] = {}
+                if frontier not in queued:
+                    queued.add(frontier)
+                    worklist.append(frontier)
+    # -Renaming
+    counters: dict[int, int] = {}
+    stacks: dict[int, list[int]] = {}
+    phi_versions: list[dict[int, int]] = [{} for _ in cfg]
+
+    def current(_id: int) -> int:
+        stack = stacks.get(_id)
+        return stack[-1] if stack else 0
+
+    def define(_id: int, pushed: list[int]) -> int:
+        version = counters[_id] = counters.get(_id, 0) + 1
+        stacks.setdefault(_id, []).append(version)
+        pushed.append(_id)
+        return version
+
+    def rename(operand: TACOperand) -> TACOperand:
+        if isinstance(operand, TACVariable):
+            return TACVariable(operand.id, version=current(operand.id))
+        return operand
+
+    walk: list[tuple[int, list[int] | None]] = [(0, None)] if len(cfg) else []
+    while walk:
+        _id, pushed = walk.pop()
+        if pushed is not None:
+            for variable in pushed:
+                stacks[variable].pop()
+            continue
+        pushed = []
+        block = cfg[_id]
+        for variable in phis[_id]:
+            phi_versions[_id][variable] = define(variable, pushed)
+        instructions: list[TACInstruction] = []
+        for instruction in block:
+            instruction = map_operands(instruction, rename)
+            dest = dest_of(instruction)
+            if isinstance(dest, TACVariable):
+                version = define(dest.id, pushed)
+                instruction = replace(instruction, dest=TACVariable(dest.id, version=version))
+            instructions.append(instruction)
+        block.instructions = instructions
+        for successor in cfg.successors[_id]:
+            for variable, sources in phis[successor].items():
+                sources[_id] = TACVariable(variable, version=current(variable))
+        walk.append((_id, pushed))
+        walk.extend((child, None) for child in reversed(tree.children[_id]))
+    # -Materialize phis
+    for block in cfg:
+        if not phis[block.id]:
+            continue
+        block_phis = [
+            TACPhi(TACVariable(variable, version=phi_versions[block.id][variable]), tuple(
+                (predecessor, sources[predecessor])
+                for predecessor in cfg.predecessors[block.id] if predecessor in sources
+            ))
+            for variable, sources in phis[block.id].items()
+        ]
+        start = 1 if block.label is not None else 0
+        block.instructions[start:start] = block_phis
+    return tree
+
+
+def from_ssa(cfg: CFG) -> None:
+    """
+    SSA Destruction
+
+    Rewrites cfg in place without phis: critical edges into phi blocks are split,
+    then each predecessor receives the phi copies of its edge as a parallel copy
+    sequentialized into plain assignments. Versioned variables remain distinct.
+    """
+    _split_critical_edges(cfg)
+    next_temporary = 1 + max((
+        operand.index for block in cfg for instruction in block
+        for operand in (*operands_of(instruction), dest_of(instruction))
+        if isinstance(operand, TACTemporary)
+    ), default=-1)
+    copies: list[list[TACCopy]] = [[] for _ in cfg]
+    for block in cfg:
+        instructions: list[TACInstruction] = []
+        for instruction in block:
+            if not isinstance(instruction, TACPhi):
+                instructions.append(instruction)
+                continue
+            for predecessor, source in instruction.sources:
+                copies[predecessor].append((instruction.dest, source))
+        block.instructions = instructions
+    for block in cfg:
+        if not copies[block.id]:
+            continue
+        temporary = TACTemporary(next_temporary)
+        assigns = sequentialize_copies(copies[block.id], temporary)
+        if temporary in (assign.dest for assign in assigns):
+            next_temporary += 1
+        end = len(block) - (block.terminator is not None)
+        block.instructions[end:end] = assigns
+    cfg.rebuild()
+
+
+def sequentialize_copies(copies: list[TACCopy], temporary: TACTemporary) -> list[TACAssign]:
+    """
+    Order a parallel copy into equivalent sequential assignments.
+    Copies whose destination is no longer read go first; each remaining cycle
+    is broken by saving one of its values into temporary.
+    """
+    assigns: list[TACAssign] = []
+    moves = [(dest, src) for dest, src in copies if dest != src and not isinstance(src, TACLiteral)]
+    location: dict[TACOperand, TACOperand | None] = {dest: None for dest, _ in moves}
+    source_of: dict[TACOperand, TACOperand] = {}
+    for dest, src in moves:
+        location[src] = src
+        source_of[dest] = src
+    ready = [dest for dest, _ in moves if location[dest] is None]
+    todo = [dest for dest, _ in moves]
+    while todo:
+        while ready:
+            dest = ready.pop()
+            src = source_of[dest]
+            value = location[src]
+            assert value is not None
+            assigns.append(TACAssign(dest, value))  # type: ignore[arg-type]
+            location[src] = dest
+            if src == value and src in source_of:
+                ready.append(src)
+        dest = todo.pop()
+        if dest != location[source_of[dest]]:
+            assigns.append(TACAssign(temporary, dest))
+            location[dest] = temporary
+            ready.append(dest)
+    assigns.extend(
+        TACAssign(dest, src) for dest, src in copies if isinstance(src, TACLiteral)
+    )
+    return assigns
+
+
+def _split_critical_edges(cfg: CFG) -> None:
+    """
+    Insert a jump block on every edge from a branching block into a phi block.
+    Edge blocks are placed right after their predecessor so no fallthrough changes;
+    blocks are renumbered and phi sources remapped afterwards.
+    """
+    next_label = 1 + max((
+        label for block in cfg for instruction in block
+        for label in _labels_of(instruction)
+    ), default=-1)
+    edges: dict[int, list[TACBasicBlock]] = {}
+    split = 0
+    for block in cfg:
+        if not any(isinstance(instruction, TACPhi) for instruction in block):
+            continue
+        predecessors = cfg.predecessors[block.id]
+        if len(predecessors) < 2:
+            continue
+        assert block.label is not None
+        for predecessor in predecessors:
+            if len(cfg.successors[predecessor]) < 2:
+                continue
+            source = cfg[predecessor]
+            branch = source.terminator
+            assert isinstance(branch, TACBranch)
+            source.instructions[-1] = TACBranch(
+                branch.condition,
+                next_label if branch.true_target == block.label else branch.true_target,
+                next_label if branch.false_target == block.label else branch.false_target,
+            )
+            # -Edge blocks are numbered negatively until placed
+            split += 1
+            placeholder = -split
+            edge = TACBasicBlock(placeholder, [TACLabel(next_label), TACJump(block.label)])
+            edges.setdefault(predecessor, []).append(edge)
+            block.instructions = [
+                _retarget_phi(instruction, predecessor, placeholder)
+                if isinstance(instruction, TACPhi) else instruction
+                for instruction in block
+            ]
+            next_label += 1
+    if not edges:
+        return
+    renumber: dict[int, int] = {}
+    blocks: list[TACBasicBlock] = []
+    for block in cfg.blocks:
+        for placed in (block, *edges.get(block.id, ())):
+            renumber[placed.id] = len(blocks)
+            placed.id = len(blocks)
+            blocks.append(placed)
+    for block in blocks:
+        block.instructions = [
+            replace(instruction, sources=tuple(
+                (renumber[predecessor], source) for predecessor, source in instruction.sources
+            ))
+            if isinstance(instruction, TACPhi) else instruction
+            for instruction in block
+        ]
+    cfg.blocks = blocks
+    cfg.rebuild()
+
+
+def _retarget_phi(phi: TACPhi, old: int, new: int) -> TACPhi:
+    """Return phi with sources of predecessor old attributed to new."""
+    return replace(phi, sources=tuple(
+        (new if predecessor == old else predecessor, source)
+        for predecessor, source in phi.sources
+    ))
+
+
+def _labels_of(instruction: TACInstruction) -> tuple[int, ...]:
+    """Return label ids defined or referenced by instruction."""
+    match instruction:
+        case TACLabel():
+            return (instruction.id,)
+        case TACJump():
+            return (instruction.target,)
+        case TACBranch():
+            return (instruction.true_target, instruction.false_target)
+        case _:
+            return ()
@@ -7,8 +7,10 @@
 
 ## Imports
 from typing import TYPE_CHECKING, NoReturn, get_args
-from collections.abc import Collection
+from ..type_checking import COMMON_TABLE
+from ...ast import TypePrimitive
 from ...ir import (
+    PackedTACUnit,
     TACAddress,
     TACLiteral,
     TACTemporary,
@@ -16,15 +18,20 @@ from ...ir import (
     TACAssign,
     TACBinary,
     TACDeclare,
+    TACLabel,
+    TACJump,
+    TACBranch,
 )
 
 if TYPE_CHECKING:
-    from collections.abc import Iterator
+    from collections.abc import MutableSequence
     from ...ast import (
-        TypePrimitive,
         DeclUnitNode,
         DeclVariableNode,
+        StmtBlockNode,
+        StmtConditionalNode,
         StmtExpressionNode,
+        StmtWhileNode,
         ExprAssignNode,
         ExprBinaryNode,
         ExprIntegerNode,
@@ -35,9 +42,6 @@ if TYPE_CHECKING:
         TACOperand,
     )
 
-## Constants
-type TACExprNode = tuple[TACOperand, Collection[TACInstruction] | None]
-
 
 ## Functions
 def _operand_as_address(operand: TACOperand) -> TACAddress:
@@ -45,18 +49,12 @@ def _operand_as_address(operand: TACOperand) -> TACAddress:
     return operand  # type: ignore[no-any-return]
 
 
-def _filter_tac_instructions(
-    *instructions: TACInstruction | Collection[TACInstruction] | None
-) -> Iterator[TACInstruction]:
-    """"""
-    for instruction in instructions:
-        match instruction:
-            case None:
-                continue
-            case Collection():
-                yield from instruction
-            case _:
-                yield instruction
+def _operand_type(node: ExprBinaryNode) -> TypePrimitive | None:
+    """Return checked type both operands are converted into or None if unchecked."""
+    lhs, rhs = node.lhs.type, node.rhs.type
+    if not (isinstance(lhs, TypePrimitive) and isinstance(rhs, TypePrimitive)):
+        return None
+    return COMMON_TABLE.get((lhs.kind, rhs.kind))
 
 
 ## Classes
@@ -64,13 +62,16 @@ class TACTreeTransformer:
     """
     TAC Lowering Pass [0]
 
-    Traverses the AST and yields nested instructions/blocks that preserve local expressions,
-    producing an intermediate tree structure ready for linearization.
+    Traverses the AST appending instructions to one output buffer in evaluation order;
+    statements emit only, expressions emit then return the operand holding their value.
+    `PackedTACTreeTransformer` lowers the same instructions straight into packed columns.
     """
 
     # -Constructor
-    def __init__(self) -> None:
+    def __init__(self, output: MutableSequence[TACInstruction] | None = None) -> None:
+        self.output: MutableSequence[TACInstruction] = output if output is not None else []
         self._temporary: int = 0
+        self._label: int = 0
 
     # -Instance Methods
     # --Types--
@@ -78,61 +79,77 @@ class TACTreeTransformer:
         assert False, "Tried calling 3AC tree transformer with a type node"
 
     # --Declarations--
-    def visit_decl_unit(self, node: DeclUnitNode) -> Collection[TACInstruction]:
-        instructions: list[TACInstruction] = []
+    def visit_decl_unit(self, node: DeclUnitNode) -> None:
         for child in node:
-            c_inst = child.accept(self)
-            if not c_inst:
-                continue
-            instructions.extend(c_inst)
-        return instructions
-
-    def visit_decl_variable(self, node: DeclVariableNode) -> Collection[TACInstruction]:
-        block: Collection[TACInstruction] = tuple()
+            child.accept(self)
+
+    def visit_decl_variable(self, node: DeclVariableNode) -> None:
+        emit = self.output.append
+        emit(TACDeclare(node.id))
         if node.has_initializer:
-            i_tac, i_inst = node.initializer.accept(self)
-            i_assign = TACAssign(TACVariable(node.id), i_tac)
-            block = tuple(_filter_tac_instructions(i_inst, i_assign))
-        return (
-            TACDeclare(node.id),
-            *block,
-        )
+            emit(TACAssign(TACVariable(node.id), node.initializer.accept(self)))
 
     # --Statements--
-    def visit_stmt_expression(self, node: StmtExpressionNode) -> Collection[TACInstruction] | None:
-        _, e_block = node.expression.accept(self)
-        return e_block
+    def visit_stmt_block(self, node: StmtBlockNode) -> None:
+        for child in node:
+            child.accept(self)
+
+    def visit_stmt_conditional(self, node: StmtConditionalNode) -> None:
+        emit = self.output.append
+        c_tac = node.condition.accept(self)
+        then_label, end_label = self.next_label, self.next_label
+        else_label = self.next_label if node.has_else_branch else end_label
+        emit(TACBranch(c_tac, then_label, else_label))
+        emit(TACLabel(then_label))
+        node.then_branch.accept(self)
+        emit(TACJump(end_label))
+        if node.has_else_branch:
+            emit(TACLabel(else_label))
+            node.else_branch.accept(self)
+            emit(TACJump(end_label))
+        emit(TACLabel(end_label))
+
+    def visit_stmt_expression(self, node: StmtExpressionNode) -> None:
+        node.expression.accept(self)
+
+    def visit_stmt_while(self, node: StmtWhileNode) -> None:
+        emit = self.output.append
+        head_label, body_label, end_label = self.next_label, self.next_label, self.next_label
+        emit(TACLabel(head_label))
+        emit(TACBranch(node.condition.accept(self), body_label, end_label))
+        emit(TACLabel(body_label))
+        node.body.accept(self)
+        emit(TACJump(head_label))
+        emit(TACLabel(end_label))
 
     # --Expressions--
-    def visit_expr_assignment(self, node: ExprAssignNode) -> TACExprNode:
-        l_tac, l_inst = node.l_value.accept(self)
-        r_tac, r_inst = node.r_value.accept(self)
-        l_tac = _operand_as_address(l_tac)
-        return (r_tac, (
-            *_filter_tac_instructions(l_inst, r_inst),
-            TACAssign(l_tac, r_tac),
-        ))
-
-    def visit_expr_binary(self, node: ExprBinaryNode) -> TACExprNode:
-        l_tac, l_inst = node.lhs.accept(self)
-        r_tac, r_inst = node.rhs.accept(self)
+    def visit_expr_assignment(self, node: ExprAssignNode) -> TACOperand:
+        l_tac = _operand_as_address(node.l_value.accept(self))
+        r_tac = node.r_value.accept(self)
+        self.output.append(TACAssign(l_tac, r_tac))
+        return r_tac
+
+    def visit_expr_binary(self, node: ExprBinaryNode) -> TACOperand:
+        l_tac = node.lhs.accept(self)
+        r_tac = node.rhs.accept(self)
         dest = TACTemporary(self.next_temporary)
-        return (dest, (
-            *_filter_tac_instructions(l_inst, r_inst),
-            TACBinary(dest, node.operator, l_tac, r_tac),
-        ))
+        self.output.append(TACBinary(dest, node.operator, l_tac, r_tac, type=_operand_type(node)))
+        return dest
 
-    def visit_expr_integer(self, node: ExprIntegerNode) -> TACExprNode:
-        return (TACLiteral(node.value), None)
+    def visit_expr_integer(self, node: ExprIntegerNode) -> TACOperand:
+        return TACLiteral(node.value)
 
-    def visit_expr_variable(self, node: ExprVariableNode) -> TACExprNode:
-        return (TACVariable(node.id), None)
+    def visit_expr_variable(self, node: ExprVariableNode) -> TACOperand:
+        return TACVariable(node.id)
 
     # -Static Methods
     @staticmethod
-    def run(ast: DeclUnitNode) -> Collection[TACInstruction]:
-        transformer = TACTreeTransformer()
-        return ast.accept(transformer)
+    def run(
+        ast: DeclUnitNode, output: MutableSequence[TACInstruction] | None = None
+    ) -> MutableSequence[TACInstruction]:
+        transformer = TACTreeTransformer(output)
+        ast.accept(transformer)
+        return transformer.output
 
     # -Properties
     @property
@@ -141,5 +158,120 @@ class TACTreeTransformer:
         self._temporary += 1
         return _temporary
 
+    @property
+    def next_label(self) -> int:
+        _label = self._label
+        self._label += 1
+        return _label
+
+    # -Class Properties
+    __slots__ = ("output", "_temporary", "_label")
+
+
+class PackedTACTreeTransformer:
+    """
+    Packed TAC Lowering Pass [0]
+
+    Lowers the AST into the same instruction sequence as `TACTreeTransformer`, written
+    straight into the integer columns of a packed unit; expressions return operand codes,
+    so no instruction or operand objects are created.
+    """
+
+    # -Constructor
+    def __init__(self, output: PackedTACUnit | None = None) -> None:
+        self.output = output if output is not None else PackedTACUnit()
+        self._temporary: int = 0
+        self._label: int = 0
+
+    # -Instance Methods
+    # --Types--
+    def visit_type_primitive(self, node: TypePrimitive) -> NoReturn:
+        assert False, "Tried calling packed 3AC tree transformer with a type node"
+
+    # --Declarations--
+    def visit_decl_unit(self, node: DeclUnitNode) -> None:
+        for child in node:
+            child.accept(self)
+
+    def visit_decl_variable(self, node: DeclVariableNode) -> None:
+        output = self.output
+        output.emit_declare(node.id)
+        if node.has_initializer:
+            output.emit_assign(PackedTACUnit.variable(node.id), node.initializer.accept(self))
+
+    # --Statements--
+    def visit_stmt_block(self, node: StmtBlockNode) -> None:
+        for child in node:
+            child.accept(self)
+
+    def visit_stmt_conditional(self, node: StmtConditionalNode) -> None:
+        output = self.output
+        c_code = node.condition.accept(self)
+        then_label, end_label = self.next_label, self.next_label
+        else_label = self.next_label if node.has_else_branch else end_label
+        output.emit_branch(c_code, then_label, else_label)
+        output.emit_label(then_label)
+        node.then_branch.accept(self)
+        output.emit_jump(end_label)
+        if node.has_else_branch:
+            output.emit_label(else_label)
+            node.else_branch.accept(self)
+            output.emit_jump(end_label)
+        output.emit_label(end_label)
+
+    def visit_stmt_expression(self, node: StmtExpressionNode) -> None:
+        node.expression.accept(self)
+
+    def visit_stmt_while(self, node: StmtWhileNode) -> None:
+        output = self.output
+        head_label, body_label, end_label = self.next_label, self.next_label, self.next_label
+        output.emit_label(head_label)
+        output.emit_branch(node.condition.accept(self), body_label, end_label)
+        output.emit_label(body_label)
+        node.body.accept(self)
+        output.emit_jump(head_label)
+        output.emit_label(end_label)
+
+    # --Expressions--
+    def visit_expr_assignment(self, node: ExprAssignNode) -> int:
+        l_code = node.l_value.accept(self)
+        assert not PackedTACUnit.is_literal(l_code), "Expected an address code, got a literal"
+        r_code = node.r_value.accept(self)
+        self.output.emit_assign(l_code, r_code)
+        return r_code
+
+    def visit_expr_binary(self, node: ExprBinaryNode) -> int:
+        l_code = node.lhs.accept(self)
+        r_code = node.rhs.accept(self)
+        dest = PackedTACUnit.temporary(self.next_temporary)
+        self.output.emit_binary(dest, node.operator, l_code, r_code, _operand_type(node))
+        return dest
+
+    def visit_expr_integer(self, node: ExprIntegerNode) -> int:
+        return self.output.literal(node.value)
+
+    def visit_expr_variable(self, node: ExprVariableNode) -> int:
+        return PackedTACUnit.variable(node.id)
+
+    # -Static Methods
+    @staticmethod
+    def run(ast: DeclUnitNode, output: PackedTACUnit | None = None) -> PackedTACUnit:
+        transformer = PackedTACTreeTransformer(output)
+        ast.accept(transformer)
+        return transformer.output
+
+    # -Properties
+    @property
+    def next_temporary(self) -> int:
+        _temporary = self._temporary
+        self._temporary += 1
+        return _temporary
+
+    @property
+    def next_label(self) -> int:
+        _label = self._label
+        self._label += 1
+        return _label
+
     # -Class Properties
-    __slots__ = ("_temporary",)
+    __slots__ = ("output", "_temporary", "_label")
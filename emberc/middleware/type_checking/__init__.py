@@ -0,0 +1,46 @@
+##-------------------------------##
+## Ember Compiler                ##
+## Written By: Ryan Smith        ##
+##-------------------------------##
+## Middleware: Type Checking     ##
+##-------------------------------##
+
+## Imports
+from typing import TYPE_CHECKING
+from .checker import (
+    MissingOperatorResult,
+    TypeCheckError,
+    TypeChecker,
+    TypeMismatch,
+)
+from .tables import COERCION_TABLE, COMMON_TABLE, RESULT_TABLE
+
+if TYPE_CHECKING:
+    from collections.abc import Sequence
+    from ..symbol_table import Symbol
+    from ...ast import DeclUnitNode
+
+## Constants
+__all__ = (
+    "COERCION_TABLE",
+    "COMMON_TABLE",
+    "RESULT_TABLE",
+    "MissingOperatorResult",
+    "TypeCheckError",
+    "TypeChecker",
+    "TypeMismatch",
+    "resolve_types",
+)
+
+
+## Functions
+def resolve_types(
+    unit: DeclUnitNode, symbols: Sequence[Symbol]
+) -> Sequence[TypeCheckError]:
+    """
+    Type Checking Pass [Group]
+
+    Infers and caches the type of every resolved expression in unit.
+    Returns mismatches and missing operator results found; their nodes are left pending.
+    """
+    return TypeChecker.run(unit, symbols)
@@ -0,0 +1,229 @@
+##-------------------------------##
+## Ember Compiler                ##
+## Written By: Ryan Smith        ##
+##-------------------------------##
+## Type Checking: Checker        ##
+##-------------------------------##
+
+## Imports
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, NoReturn
+from .tables import (
+    MATH_OPERATORS,
+    COERCION_TABLE,
+    COMMON_TABLE,
+    RESULT_TABLE,
+)
+from ...ast import (
+    TypePending,
+    TypePrimitive,
+    ExprBinaryNode,
+    ExprIntegerNode,
+)
+
+if TYPE_CHECKING:
+    from collections.abc import Sequence
+    from ...ast import (
+        BinaryOperator,
+        TypeNode,
+        DeclNode,
+        DeclUnitNode,
+        DeclVariableNode,
+        StmtBlockNode,
+        StmtConditionalNode,
+        StmtExpressionNode,
+        StmtWhileNode,
+        ExprNode,
+        ExprAssignNode,
+        ExprVariableNode,
+    )
+    from ..symbol_table import Symbol
+
+## Constants
+DEFAULT_INTEGER_TYPE = TypePrimitive.int64
+type TypeCheckError = TypeMismatch | MissingOperatorResult
+
+
+## Classes
+@dataclass(frozen=True, slots=True)
+class TypeMismatch:
+    """
+    Type Mismatch
+
+    A type error found on a resolved node; the node is left pending.
+    Resolved nodes carry no spans, so mismatches are reported by node.
+    """
+    # -Properties
+    node: DeclNode | ExprNode
+    expected: TypeNode
+    found: TypeNode
+
+
+@dataclass(frozen=True, slots=True)
+class MissingOperatorResult:
+    """
+    Missing Operator Result
+
+    A binary operator with no result for its operand types; the node is left pending.
+    """
+    # -Properties
+    node: ExprBinaryNode
+    operator: BinaryOperator
+    lhs: TypePrimitive
+    rhs: TypePrimitive
+
+
+class TypeChecker:
+    """
+    Type Checking Pass [Order=1]
+
+    Infers expression types bottom-up from symbol types and caches them on each node;
+    a node whose type is no longer pending is never visited again.
+    Operator results and implicit conversions are looked up in precomputed tables.
+    Untyped integer literals take the integer type of their context, defaulting to int64;
+    they never settle into `bool`.
+    """
+    # -Constructor
+    def __init__(self, symbols: Sequence[Symbol]) -> None:
+        self.symbols = symbols
+        self.mismatches: list[TypeCheckError] = []
+
+    # -Instance Methods
+    # --Types--
+    def visit_type_primitive(self, node: TypePrimitive) -> NoReturn:
+        assert False, "Tried calling type checker with a primitive type node"
+
+    # --Declarations--
+    def visit_decl_unit(self, node: DeclUnitNode) -> None:
+        for child in node:
+            child.accept(self)
+
+    def visit_decl_variable(self, node: DeclVariableNode) -> None:
+        if node.has_initializer:
+            self._check(node.initializer, self.symbols[node.id].type, node)
+
+    # --Statements--
+    def visit_stmt_block(self, node: StmtBlockNode) -> None:
+        for child in node:
+            child.accept(self)
+
+    def visit_stmt_conditional(self, node: StmtConditionalNode) -> None:
+        self._check_condition(node.condition)
+        node.then_branch.accept(self)
+        if node.has_else_branch:
+            node.else_branch.accept(self)
+
+    def visit_stmt_expression(self, node: StmtExpressionNode) -> None:
+        if isinstance(self.infer(node.expression), TypePending):
+            self._settle(node.expression, DEFAULT_INTEGER_TYPE)
+
+    def visit_stmt_while(self, node: StmtWhileNode) -> None:
+        self._check_condition(node.condition)
+        node.body.accept(self)
+
+    # --Expressions--
+    def visit_expr_assignment(self, node: ExprAssignNode) -> TypeNode:
+        target = self.infer(node.l_value)
+        if isinstance(target, TypePending):
+            return target
+        self._check(node.r_value, target, node)
+        return target
+
+    def visit_expr_binary(self, node: ExprBinaryNode) -> TypeNode:
+        lhs = self.infer(node.lhs)
+        rhs = self.infer(node.rhs)
+        match (lhs, rhs):
+            case (TypePending(), TypePending()):
+                if node.operator in MATH_OPERATORS:
+                    return TypePending()
+                lhs = self._settle(node.lhs, DEFAULT_INTEGER_TYPE)
+                rhs = self._settle(node.rhs, DEFAULT_INTEGER_TYPE)
+            case (TypePending(), TypePrimitive()):
+                lhs = self._settle(node.lhs, rhs)
+            case (TypePrimitive(), TypePending()):
+                rhs = self._settle(node.rhs, lhs)
+        if not (isinstance(lhs, TypePrimitive) and isinstance(rhs, TypePrimitive)):
+            return TypePending()
+        result = RESULT_TABLE.get((node.operator, lhs.kind, rhs.kind))
+        if result is None:
+            self.mismatches.append(MissingOperatorResult(node, node.operator, lhs, rhs))
+            return TypePending()
+        return result
+
+    def visit_expr_integer(self, node: ExprIntegerNode) -> TypeNode:
+        return node.type
+
+    def visit_expr_variable(self, node: ExprVariableNode) -> TypeNode:
+        return self.symbols[node.id].type
+
+    # -Instance Methods: Inference
+    def infer(self, node: ExprNode) -> TypeNode:
+        '''Return type of expression; visiting and caching it on the node once.'''
+        if not isinstance(node.type, TypePending):
+            return node.type
+        node.type = node.accept(self)
+        return node.type
+
+    def operand_type(self, node: ExprBinaryNode) -> TypePrimitive:
+        '''Return type both operands of a checked binary expression are converted into.'''
+        lhs, rhs = node.lhs.type, node.rhs.type
+        assert isinstance(lhs, TypePrimitive) and isinstance(rhs, TypePrimitive)
+        return COMMON_TABLE[lhs.kind, rhs.kind]
+
+    def _check(self, node: ExprNode, target: TypeNode, parent: DeclNode | ExprNode) -> None:
+        '''Check expression converts into target; typing untyped literals as target.'''
+        found = self.infer(node)
+        if not isinstance(target, TypePrimitive):
+            return
+        match found:
+            case TypePending():
+                self._settle(node, target)
+            case TypePrimitive() if (found.kind, target.kind) not in COERCION_TABLE:
+                self.mismatches.append(TypeMismatch(parent, target, found))
+
+    def _check_condition(self, node: ExprNode) -> None:
+        '''Infer condition expression; any primitive type tests against zero.'''
+        if isinstance(self.infer(node), TypePending):
+            self._settle(node, DEFAULT_INTEGER_TYPE)
+
+    def _settle(self, node: ExprNode, target: TypePrimitive) -> TypeNode:
+        '''Type a pending literal expression as target; checking literals are integers that fit.'''
+        match node:
+            case ExprIntegerNode() if isinstance(node.type, TypePending):
+                if not (target.is_integer and target.contains(node.value)):
+                    self.mismatches.append(TypeMismatch(node, target, DEFAULT_INTEGER_TYPE))
+                    return node.type
+                node.type = target
+            case ExprBinaryNode() if self._is_untyped(node):
+                node.type = self._settle_pair(node, target)
+        return node.type
+
+    def _settle_pair(self, node: ExprBinaryNode, target: TypePrimitive) -> TypeNode:
+        '''Type both pending operands as target; returning result type of operator.'''
+        result = RESULT_TABLE.get((node.operator, target.kind, target.kind))
+        if result is None:
+            # -Operator has no result in target: report it once, then type operands by default
+            self.mismatches.append(MissingOperatorResult(node, node.operator, target, target))
+            self._settle(node.lhs, DEFAULT_INTEGER_TYPE)
+            self._settle(node.rhs, DEFAULT_INTEGER_TYPE)
+            return TypePending()
+        self._settle(node.lhs, target)
+        self._settle(node.rhs, target)
+        if node.lhs.type != target or node.rhs.type != target:
+            return TypePending()
+        return result
+
+    # -Static Methods
+    @staticmethod
+    def _is_untyped(node: ExprBinaryNode) -> bool:
+        '''Return if node is pending only because both operands are untyped literal expressions.'''
+        return all(isinstance(_type, TypePending) for _type in (node.type, node.lhs.type, node.rhs.type))
+
+    @staticmethod
+    def run(ast: DeclUnitNode, symbols: Sequence[Symbol]) -> Sequence[TypeCheckError]:
+        checker = TypeChecker(symbols)
+        ast.accept(checker)
+        return checker.mismatches
+
+    # -Class Properties
+    __slots__ = ("symbols", "mismatches")
@@ -0,0 +1,90 @@
+##-------------------------------##
+## Ember Compiler                ##
+## Written By: Ryan Smith        ##
+##-------------------------------##
+## Type Checking: Tables         ##
+##-------------------------------##
+
+## Imports
+from itertools import product
+from ...ast import BinaryOperator, TypePrimitive
+
+## Constants
+type Kind = TypePrimitive.Kind
+MATH_OPERATORS = (
+    BinaryOperator.Add, BinaryOperator.Sub, BinaryOperator.Mul,
+    BinaryOperator.Div, BinaryOperator.Mod,
+)
+EQUALITY_OPERATORS = (BinaryOperator.Eq, BinaryOperator.NtEq)
+ORDER_OPERATORS = (
+    BinaryOperator.Lt, BinaryOperator.LtEq,
+    BinaryOperator.Gt, BinaryOperator.GtEq,
+)
+PRIMITIVES: dict[Kind, TypePrimitive] = {
+    kind: TypePrimitive(kind) for kind in TypePrimitive.Kind
+}
+INTEGERS = tuple(_type for _type in PRIMITIVES.values() if _type.is_integer)
+
+
+## Functions
+def _coerces(source: TypePrimitive, target: TypePrimitive) -> bool:
+    """Return if source implicitly converts into target without loss."""
+    if source == target:
+        return True
+    if not (source.is_integer and target.is_integer):
+        return False
+    if source.is_signed == target.is_signed:
+        return target.bits >= source.bits
+    return not source.is_signed and target.bits > source.bits
+
+
+def _common_type(lhs: TypePrimitive, rhs: TypePrimitive) -> TypePrimitive | None:
+    """Return narrowest integer both operands losslessly convert into."""
+    candidates = [
+        _type for _type in INTEGERS
+        if _coerces(lhs, _type) and _coerces(rhs, _type)
+    ]
+    return min(candidates, key=lambda _type: _type.bits, default=None)
+
+
+def _build_coercion_table() -> frozenset[tuple[Kind, Kind]]:
+    """Build every allowed (source, target) implicit conversion."""
+    return frozenset(
+        (source.kind, target.kind)
+        for source, target in product(PRIMITIVES.values(), repeat=2)
+        if _coerces(source, target)
+    )
+
+
+def _build_common_table() -> dict[tuple[Kind, Kind], TypePrimitive]:
+    """Build type both operands are converted into for every compatible integer pair."""
+    table: dict[tuple[Kind, Kind], TypePrimitive] = {}
+    for lhs, rhs in product(INTEGERS, repeat=2):
+        common = _common_type(lhs, rhs)
+        if common is not None:
+            table[lhs.kind, rhs.kind] = common
+    boolean = TypePrimitive.Kind.Boolean
+    table[boolean, boolean] = TypePrimitive.boolean
+    return table
+
+
+def _build_result_table() -> dict[tuple[BinaryOperator, Kind, Kind], TypePrimitive]:
+    """Build result type of every valid (operator, lhs, rhs) combination."""
+    table: dict[tuple[BinaryOperator, Kind, Kind], TypePrimitive] = {}
+    for (lhs, rhs), common in COMMON_TABLE.items():
+        if not common.is_integer:
+            continue
+        for operator in MATH_OPERATORS:
+            table[operator, lhs, rhs] = common
+        for operator in EQUALITY_OPERATORS + ORDER_OPERATORS:
+            table[operator, lhs, rhs] = TypePrimitive.boolean
+    boolean = TypePrimitive.Kind.Boolean
+    for operator in EQUALITY_OPERATORS:
+        table[operator, boolean, boolean] = TypePrimitive.boolean
+    return table
+
+
+## Body
+COERCION_TABLE = _build_coercion_table()
+COMMON_TABLE = _build_common_table()
+RESULT_TABLE = _build_result_table()
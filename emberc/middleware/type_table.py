@@ -0,0 +1,49 @@
+##-------------------------------##
+## Ember Compiler                ##
+## Written By: Ryan Smith        ##
+##-------------------------------##
+## Middleware: Type Table        ##
+##-------------------------------##
+
+## Imports
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+    from ..ast import TypeNode
+
+
+## Classes
+class TypeTable:
+    """Canonicalizes structurally equal type nodes into small, dense integer ids."""
+    # -Constructor
+    def __init__(self) -> None:
+        self._types: list[TypeNode] = []
+        self._ids: dict[TypeNode, int] = {}
+
+    # -Dunder Methods
+    def __getitem__(self, _id: int) -> TypeNode:
+        return self._types[_id]
+
+    def __iter__(self) -> Iterator[TypeNode]:
+        yield from self._types
+
+    def __len__(self) -> int:
+        return len(self._types)
+
+    # -Instance Methods
+    def intern(self, _type: TypeNode) -> int:
+        '''Return id of type; registering it if unseen.'''
+        _id = self._ids.get(_type)
+        if _id is None:
+            _id = len(self._types)
+            self._types.append(_type)
+            self._ids[_type] = _id
+        return _id
+
+    def find_id(self, _type: TypeNode) -> int | None:
+        '''Return id of type or None if not registered.'''
+        return self._ids.get(_type)
+
+    # -Class Properties
+    __slots__ = ("_types", "_ids")